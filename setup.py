@@ -0,0 +1,27 @@
+"""
+Optional compiled build.
+
+Package metadata lives in pyproject.toml; this file only adds an opt-in mypyc
+build of pure-Python hot paths. Set BACKTESTER_MYPYC=1 (with mypy installed
+and --no-build-isolation) to compile them into C extensions, e.g.:
+
+    BACKTESTER_MYPYC=1 pip install --no-build-isolation .
+
+Without the variable this is a plain setuptools build.
+"""
+
+import os
+
+from setuptools import setup
+
+# Modules compiled with mypyc (must stay fully annotated and mypy-clean)
+MYPYC_MODULES = [
+    'src/backtester/config/core/validator.py',
+]
+
+ext_modules = []
+if os.environ.get('BACKTESTER_MYPYC') == '1':
+    from mypyc.build import mypycify
+    ext_modules = mypycify(['--ignore-missing-imports', '--follow-imports=silent', *MYPYC_MODULES])
+
+setup(ext_modules=ext_modules)
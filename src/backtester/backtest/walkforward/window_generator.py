@@ -5,8 +5,9 @@ Generates rolling in-sample/out-of-sample windows from date ranges.
 """
 
 from dataclasses import dataclass
-from typing import List
-from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import List, Tuple
+from datetime import datetime, timedelta, timezone
 import pandas as pd
 
 from backtester.backtest.walkforward.period_parser import parse_period, PeriodParseError
@@ -56,8 +57,9 @@ def generate_windows(
     
     # Adjust dates based on actual data if DataFrame provided
     if data_df is not None and not data_df.empty:
-        # Get actual data dates
-        data_dates = pd.to_datetime(data_df.index)
+        # Get actual data dates (a DatetimeIndex is reduced directly, skipping NaT)
+        idx = data_df.index
+        data_dates = idx if isinstance(idx, pd.DatetimeIndex) else pd.to_datetime(idx)
         data_start = data_dates.min()
         data_end = data_dates.max()
         
@@ -65,27 +67,22 @@ def generate_windows(
         if data_start.tzinfo is not None:
             # Data is timezone-aware, make start/end match
             if start_date.tzinfo is None:
-                from datetime import timezone
                 start_date = start_date.replace(tzinfo=timezone.utc)
             if end_date.tzinfo is None:
-                from datetime import timezone
                 end_date = end_date.replace(tzinfo=timezone.utc)
             if current_start.tzinfo is None:
-                from datetime import timezone
                 current_start = current_start.replace(tzinfo=timezone.utc)
         
         # Use data bounds if they're narrower than specified
+        # (both bounds are pd.Timestamp here, so convert straight to datetime)
         if data_start > start_date:
-            # Convert to same type (datetime or Timestamp)
-            if isinstance(data_start, pd.Timestamp):
-                current_start = data_start.to_pydatetime()
-            else:
-                current_start = data_start
+            current_start = data_start.to_pydatetime()
         if data_end < end_date:
-            if isinstance(data_end, pd.Timestamp):
-                end_date = data_end.to_pydatetime()
-            else:
-                end_date = data_end
+            end_date = data_end.to_pydatetime()
+    
+    # Minimum remaining days for a partial final OOS window (at least 50% of
+    # out_sample_days); ceil keeps the integer compare equal to `< out_sample_days * 0.5`
+    half_oos = (out_sample_days + 1) // 2
     
     while True:
         # Calculate in-sample period
@@ -116,7 +113,7 @@ def generate_windows(
         if out_sample_end > end_date:
             # Try to use remaining data if there's at least some amount
             remaining_days = (end_date - out_sample_start).days
-            if remaining_days < out_sample_days * 0.5:  # Need at least 50% of out-sample period
+            if remaining_days < half_oos:  # Need at least 50% of out-sample period
                 break
             out_sample_end = end_date
         
@@ -137,6 +134,12 @@ def generate_windows(
     return windows
 
 
+@lru_cache(maxsize=128)
+def _parse_period_cached(period_str: str) -> Tuple[int, int]:
+    """Memoized parse_period; period strings form a tiny set across a sweep."""
+    return parse_period(period_str)
+
+
 def generate_windows_from_period(
     start_date: datetime,
     end_date: datetime,
@@ -158,6 +161,6 @@ def generate_windows_from_period(
     Raises:
         PeriodParseError: If period format is invalid
     """
-    in_sample_days, out_sample_days = parse_period(period_str)
+    in_sample_days, out_sample_days = _parse_period_cached(period_str)
     return generate_windows(start_date, end_date, in_sample_days, out_sample_days, data_df)
 
@@ -4,89 +4,181 @@ Configuration accessor module.
 Provides type-safe access to configuration values.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Mapping
+from types import MappingProxyType
+import copy
 import warnings
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields, is_dataclass
+from functools import cached_property
 
+try:
+    import msgspec
+    HAS_MSGSPEC = True
+except ImportError:
+    HAS_MSGSPEC = False
 
-@dataclass
+
+# Shared default for internal read-only lookups of missing sections. Never
+# returned to callers or mutated.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Config dataclasses are slotted. Trading/strategy/data-quality configs are also
+# frozen (shared cached instances); the debug tree stays mutable because callers
+# toggle flags such as debug_config.enabled at runtime, so get_debug_config hands
+# out a fresh copy of the cached instance.
+
+
+@dataclass(slots=True, frozen=True)
 class TradingConfig:
     """Trading configuration."""
-    use_exchange_fees: bool
-    fee_type: str  # 'maker' or 'taker'
-    slippage: float
-    risk_per_trade: float
-    position_size: float
-    commission: float
-    commission_maker: float
+    use_exchange_fees: bool = False
+    fee_type: str = 'taker'  # 'maker' or 'taker'
+    slippage: float = 0.0
+    risk_per_trade: float = 0.01
+    position_size: float = 0.1
+    commission: float = 0.006
+    commission_maker: float = 0.004
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class StrategyConfig:
     """Strategy configuration."""
     name: str
     parameters: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DataQualityConfig:
     """Data quality configuration."""
-    weights: Dict[str, float]
-    thresholds: Dict[str, Any]
-    warning_threshold: float
-    liveliness_cache_days: int
-    incremental_assessment: bool
-    full_assessment_schedule: str
-    gap_filling_schedule: str
+    weights: Dict[str, float] = field(default_factory=dict)
+    thresholds: Dict[str, Any] = field(default_factory=dict)
+    warning_threshold: float = 70.0
+    liveliness_cache_days: int = 30
+    incremental_assessment: bool = True
+    full_assessment_schedule: str = 'weekly'
+    gap_filling_schedule: str = 'weekly'
 
 
-@dataclass
+@dataclass(slots=True)
 class TracingConfig:
     """Tracing configuration."""
-    enabled: bool
-    level: str  # minimal, standard, detailed
-    sample_rate: float
+    enabled: bool = True
+    level: str = 'standard'  # minimal, standard, detailed
+    sample_rate: float = 1.0
 
 
-@dataclass
+@dataclass(slots=True)
 class AutoCaptureConfig:
     """Auto-capture configuration for crash reports."""
-    triggers: List[str]
-    min_severity: str  # error, warning, info
+    triggers: List[str] = field(default_factory=list)
+    min_severity: str = 'error'  # error, warning, info
 
 
-@dataclass
+@dataclass(slots=True)
 class CrashReportsConfig:
     """Crash reports configuration."""
-    enabled: bool
-    max_reports: int
-    max_total_size_mb: float
-    min_free_disk_mb: float
-    auto_capture: AutoCaptureConfig
+    enabled: bool = True
+    max_reports: int = 50
+    max_total_size_mb: float = 500.0
+    min_free_disk_mb: float = 1000.0
+    auto_capture: AutoCaptureConfig = field(default_factory=AutoCaptureConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class LogRotationConfig:
     """Log rotation configuration."""
-    max_bytes: int
-    backup_count: int
+    max_bytes: int = 10485760
+    backup_count: int = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugLoggingConfig:
     """Debug logging configuration."""
-    execution_trace_file: str
-    crash_report_dir: str
-    rotation: LogRotationConfig
+    execution_trace_file: str = 'artifacts/logs/backtest_execution.jsonl'
+    crash_report_dir: str = 'artifacts/logs/crash_reports'
+    rotation: LogRotationConfig = field(default_factory=LogRotationConfig)
 
 
-@dataclass
+@dataclass(slots=True)
 class DebugConfig:
     """Debug configuration."""
-    enabled: bool
-    tracing: TracingConfig
-    crash_reports: CrashReportsConfig
-    logging: DebugLoggingConfig
+    enabled: bool = True
+    tracing: TracingConfig = field(default_factory=TracingConfig)
+    crash_reports: CrashReportsConfig = field(default_factory=CrashReportsConfig)
+    logging: DebugLoggingConfig = field(default_factory=DebugLoggingConfig)
+
+
+@dataclass(slots=True, frozen=True)
+class WalkforwardConfig:
+    """Walk-forward configuration (symbols/timeframes already validated against metadata)."""
+    start_date: Optional[str] = None
+    end_date: Optional[str] = None
+    initial_capital: float = 100000.0
+    symbols: List[str] = field(default_factory=list)
+    timeframes: List[str] = field(default_factory=list)
+    verbose: bool = False
+    # Tuples of names; a malformed raw value is kept as-is and rejected by its getter
+    periods: Any = ()
+    fitness_functions: Any = ('np_avg_dd',)
+    parameter_ranges: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    filters: List[str] = field(default_factory=list)
+
+
+def _as_tuple(value: Any, default: Any = None) -> Any:
+    """Convert a list/tuple config entry to a tuple; None gives default, anything else is kept raw."""
+    if value is None and default is not None:
+        return default
+    if isinstance(value, (list, tuple)):
+        return tuple(value)
+    return value
+
+
+def _as_name_list(value: Any, valid: frozenset) -> List[str]:
+    """Normalize a symbols/timeframes entry to a list, keeping only names in valid (if any)."""
+    if isinstance(value, str):
+        return [value]
+    if isinstance(value, list):
+        if valid:
+            return [v for v in value if v in valid]
+        return value
+    return []
+
+
+def _convert_config(raw: Optional[Dict[str, Any]], config_cls: type) -> Any:
+    """
+    Decode a config section into a typed config dataclass.
+    
+    Missing keys take the dataclass defaults, float/int fields are coerced, and
+    nested dataclass fields are decoded recursively. Uses msgspec.convert when
+    msgspec is installed, otherwise an equivalent pure-Python walk.
+    
+    Args:
+        raw: Config section dictionary (None is treated as empty)
+        config_cls: Target dataclass type
+    
+    Returns:
+        Instance of config_cls
+    """
+    raw = raw or _EMPTY
+    if HAS_MSGSPEC:
+        try:
+            return msgspec.convert(raw, config_cls, strict=False)
+        except msgspec.ValidationError:
+            pass  # Fall back to the lenient Python decoding below
+    
+    values = {}
+    for f in fields(config_cls):
+        if f.name not in raw:
+            continue  # dataclass default / default_factory applies
+        value = raw[f.name]
+        if is_dataclass(f.type):
+            value = _convert_config(value, f.type)
+        elif f.type is float:
+            value = float(value)
+        elif f.type is int:
+            value = int(value)
+        values[f.name] = value
+    return config_cls(**values)
 
 
 class ConfigAccessor:
@@ -94,6 +186,10 @@ class ConfigAccessor:
     Type-safe access to configuration values.
     """
     
+    # Cached properties resolved in __init__ so per-trade/per-fetch reads are plain
+    # instance-dict hits (no __slots__: cached_property stores into __dict__)
+    _EAGER_PROPERTIES = ('commission', 'slippage', 'exchange_name', 'historical_start_date')
+    
     def __init__(self, config: Dict[str, Any], metadata: Dict[str, Any] = None):
         """
         Initialize the accessor.
@@ -104,129 +200,205 @@ class ConfigAccessor:
         """
         self.config = config
         self.metadata = metadata or {}
+        
+        # Resolve immutable top-level sections once; 'strategy' is read through
+        # self.config because ConfigManager updates it in place during walk-forward
+        self._data = config.get('data') or _EMPTY
+        self._trading = config.get('trading') or _EMPTY
+        self._data_quality = config.get('data_quality') or _EMPTY
+        self._parallel = config.get('parallel') or _EMPTY
+        self._walkforward = config.get('walkforward') or _EMPTY
+        self._debug = config.get('debug') or _EMPTY
+        self._data_view = MappingProxyType(self._data)
+        
+        # Metadata membership sets for symbol/timeframe validation (O(1) lookups)
+        self._valid_symbols = frozenset(self.metadata.get('top_markets', ()))
+        self._valid_timeframes = frozenset(self.metadata.get('timeframes', ()))
+        
+        # Typed config objects, built on first access
+        self._trading_config: Optional[TradingConfig] = None
+        self._strategy_config: Optional[StrategyConfig] = None
+        self._data_quality_config: Optional[DataQualityConfig] = None
+        self._debug_config: Optional[DebugConfig] = None
+        self._walkforward_config: Optional[WalkforwardConfig] = None
+        self._invalid_filters: List[Any] = []  # Non-string filter entries, reported by get_walkforward_filters
+        
+        for name in self._EAGER_PROPERTIES:
+            getattr(self, name)
+    
+    # Stable scalar values are cached properties: computed on first access, then
+    # served straight from the instance __dict__. The get_* methods wrap them.
     
     # Data accessors
+    @cached_property
+    def exchange_name(self) -> str:
+        """Exchange name (from data config)."""
+        return self._data.get('exchange', 'coinbase')
+    
     def get_exchange_name(self) -> str:
         """Get the exchange name (from data config)."""
-        return self.config.get('data', {}).get('exchange', 'coinbase')
+        return self.exchange_name
+    
+    # Walk-forward accessors (all served from the WalkforwardConfig built on first use)
+    def get_walkforward_config(self) -> WalkforwardConfig:
+        """
+        Get walk-forward configuration as typed object.
+        
+        Symbols and timeframes are filtered against metadata, and invalid filter
+        entries are dropped, when the object is built (get_walkforward_filters
+        warns about the dropped filters).
+        """
+        if self._walkforward_config is None:
+            self._walkforward_config = self._build_walkforward_config()
+        return self._walkforward_config
+    
+    def _build_walkforward_config(self) -> WalkforwardConfig:
+        """Build the WalkforwardConfig from the raw walkforward section."""
+        wf = self._walkforward
+        capital = wf.get('initial_capital')
+        periods = wf.get('periods')
+        if isinstance(periods, str):
+            periods = [periods]  # Single period string
+        fitness_funcs = wf.get('fitness_functions', ['np_avg_dd'])
+        filters, self._invalid_filters = self._build_walkforward_filters(wf.get('filters', []))
+        
+        # Sequences that callers hash/cache on are stored as immutable tuples
+        return WalkforwardConfig(
+            start_date=wf.get('start_date'),
+            end_date=wf.get('end_date'),
+            initial_capital=float(capital) if capital is not None else 100000.0,
+            symbols=_as_name_list(wf.get('symbols'), self._valid_symbols),
+            timeframes=_as_name_list(wf.get('timeframes'), self._valid_timeframes),
+            verbose=wf.get('verbose', False),
+            periods=_as_tuple(periods, ()),
+            fitness_functions=_as_tuple(fitness_funcs),
+            parameter_ranges=wf.get('parameter_ranges', {}),
+            filters=filters,
+        )
+    
+    @property
+    def walkforward_start_date(self) -> str:
+        """Start date for walk-forward optimization."""
+        return self.get_walkforward_config().start_date
     
-    # Walk-forward accessors
     def get_walkforward_start_date(self) -> str:
         """Get start date for walk-forward optimization."""
-        return self.config.get('walkforward', {}).get('start_date')
+        return self.get_walkforward_config().start_date
+    
+    @property
+    def walkforward_end_date(self) -> str:
+        """End date for walk-forward optimization."""
+        return self.get_walkforward_config().end_date
     
     def get_walkforward_end_date(self) -> str:
         """Get end date for walk-forward optimization."""
-        return self.config.get('walkforward', {}).get('end_date')
+        return self.get_walkforward_config().end_date
+    
+    @property
+    def walkforward_initial_capital(self) -> float:
+        """Initial capital for walk-forward optimization."""
+        return self.get_walkforward_config().initial_capital
     
     def get_walkforward_initial_capital(self) -> float:
         """Get initial capital for walk-forward optimization."""
-        capital = self.config.get('walkforward', {}).get('initial_capital')
-        return float(capital) if capital is not None else 100000.0
+        return self.get_walkforward_config().initial_capital
     
     def get_walkforward_symbols(self) -> List[str]:
         """
         Get symbols for walk-forward optimization.
         
-        Returns symbols from walkforward config, validates against metadata.
+        Returns symbols from walkforward config, validated against metadata.
         """
-        symbols = self.config.get('walkforward', {}).get('symbols')
-        
-        if symbols is None:
-            return []
-        elif isinstance(symbols, str):
-            return [symbols]
-        elif isinstance(symbols, list):
-            # Validate against metadata
-            valid_symbols = self.metadata.get('top_markets', [])
-            if valid_symbols:
-                return [s for s in symbols if s in valid_symbols]
-            return symbols
-        else:
-            return []
+        return self.get_walkforward_config().symbols
     
     def get_walkforward_timeframes(self) -> List[str]:
         """
         Get timeframes for walk-forward optimization.
         
-        Returns timeframes from walkforward config, validates against metadata.
+        Returns timeframes from walkforward config, validated against metadata.
         """
-        timeframes = self.config.get('walkforward', {}).get('timeframes')
-        
-        if timeframes is None:
-            return []
-        elif isinstance(timeframes, str):
-            return [timeframes]
-        elif isinstance(timeframes, list):
-            # Validate against metadata
-            valid_timeframes = self.metadata.get('timeframes', [])
-            if valid_timeframes:
-                return [tf for tf in timeframes if tf in valid_timeframes]
-            return timeframes
-        else:
-            return []
+        return self.get_walkforward_config().timeframes
+    
+    @property
+    def walkforward_verbose(self) -> bool:
+        """Verbose flag for walk-forward optimization."""
+        return self.get_walkforward_config().verbose
     
     def get_walkforward_verbose(self) -> bool:
         """Get verbose flag for walk-forward optimization."""
-        return self.config.get('walkforward', {}).get('verbose', False)
+        return self.get_walkforward_config().verbose
     
     # Trading accessors
     def get_trading_config(self) -> TradingConfig:
         """Get trading configuration as typed object."""
-        trading = self.config.get('trading', {})
-        return TradingConfig(
-            use_exchange_fees=trading.get('use_exchange_fees', False),
-            fee_type=trading.get('fee_type', 'taker'),
-            slippage=float(trading.get('slippage', 0.0)),
-            risk_per_trade=float(trading.get('risk_per_trade', 0.01)),
-            position_size=float(trading.get('position_size', 0.1)),
-            commission=float(trading.get('commission', 0.006)),
-            commission_maker=float(trading.get('commission_maker', 0.004))
-        )
+        if self._trading_config is None:
+            self._trading_config = _convert_config(self._trading, TradingConfig)
+        return self._trading_config
     
-    def get_commission(self) -> float:
-        """Get commission rate for backtesting."""
+    @cached_property
+    def commission(self) -> float:
+        """Effective commission rate from trading config and metadata."""
         trading_config = self.get_trading_config()
         
         # Check if we should use exchange fees
         if trading_config.use_exchange_fees:
             fee_type = trading_config.fee_type
-            return self.metadata.get('fees', {}).get(fee_type, 0.006)
+            return self.metadata.get('fees', _EMPTY).get(fee_type, 0.006)
         else:
             if trading_config.fee_type == 'maker':
                 return trading_config.commission_maker
             else:
                 return trading_config.commission
     
+    def get_commission(self) -> float:
+        """Get commission rate for backtesting."""
+        return self.commission
+    
+    @cached_property
+    def slippage(self) -> float:
+        """Slippage rate."""
+        return self.get_trading_config().slippage
+    
     def get_slippage(self) -> float:
         """Get slippage rate."""
-        return self.get_trading_config().slippage
+        return self.slippage
     
     # Strategy accessors
-    def get_strategy_name(self) -> str:
-        """Get the strategy name."""
+    @cached_property
+    def strategy_name(self) -> str:
+        """Strategy name."""
         from backtester.config.core.exceptions import ConfigError
-        if 'name' not in self.config.get('strategy', {}):
+        if 'name' not in self.config.get('strategy', _EMPTY):
             raise ConfigError("Missing 'name' in strategy configuration")
         return self.config['strategy']['name']
     
+    def get_strategy_name(self) -> str:
+        """Get the strategy name."""
+        return self.strategy_name
     
     def get_strategy_config(self) -> StrategyConfig:
         """Get strategy configuration as typed object."""
-        strategy = self.config.get('strategy', {})
-        return StrategyConfig(
-            name=strategy['name'],
-            parameters=strategy.get('parameters', {})
-        )
+        if self._strategy_config is None:
+            strategy = self.config.get('strategy', _EMPTY)
+            self._strategy_config = StrategyConfig(
+                name=strategy['name'],
+                parameters=strategy.get('parameters', {})
+            )
+        return self._strategy_config
     
     # Data accessors
-    def get_data_config(self) -> Dict[str, Any]:
-        """Get data configuration dictionary."""
-        return self.config.get('data', {}).copy()
+    def get_data_config(self) -> Mapping[str, Any]:
+        """Get data configuration as a read-only mapping (use dict(...) for a mutable copy)."""
+        return self._data_view
+    
+    @cached_property
+    def historical_start_date(self) -> str:
+        """Historical start date for data collection."""
+        return self._data.get('historical_start_date', '2017-01-01')
     
     def get_historical_start_date(self) -> str:
         """Get historical start date for data collection."""
-        return self.config.get('data', {}).get('historical_start_date', '2017-01-01')
+        return self.historical_start_date
     
     def get_data_exchange_name(self) -> str:
         """Get exchange name from data config (alias for get_exchange_name for clarity)."""
@@ -235,50 +407,67 @@ class ConfigAccessor:
     # Data quality accessors
     def get_data_quality_config(self) -> DataQualityConfig:
         """Get data quality configuration as typed object."""
-        dq = self.config.get('data_quality', {})
-        return DataQualityConfig(
-            weights=dq.get('weights', {}),
-            thresholds=dq.get('thresholds', {}),
-            warning_threshold=float(dq.get('warning_threshold', 70)),
-            liveliness_cache_days=int(dq.get('liveliness_cache_days', 30)),
-            incremental_assessment=dq.get('incremental_assessment', True),
-            full_assessment_schedule=dq.get('full_assessment_schedule', 'weekly'),
-            gap_filling_schedule=dq.get('gap_filling_schedule', 'weekly')
-        )
+        if self._data_quality_config is None:
+            self._data_quality_config = _convert_config(self._data_quality, DataQualityConfig)
+        return self._data_quality_config
     
     # Parallel execution accessors
+    @cached_property
+    def parallel_mode(self) -> str:
+        """Parallel execution mode: 'auto' or 'manual'."""
+        return self._parallel.get('mode', 'auto')
+    
     def get_parallel_mode(self) -> str:
         """Get parallel execution mode: 'auto' or 'manual'."""
-        return self.config.get('parallel', {}).get('mode', 'auto')
+        return self.parallel_mode
+    
+    @cached_property
+    def manual_workers(self) -> Optional[int]:
+        """Manual worker count (only used if mode='manual')."""
+        workers = self._parallel.get('max_workers')
+        return int(workers) if workers is not None else None
     
     def get_manual_workers(self) -> Optional[int]:
         """Get manual worker count (only used if mode='manual')."""
-        workers = self.config.get('parallel', {}).get('max_workers')
-        return int(workers) if workers is not None else None
+        return self.manual_workers
+    
+    @cached_property
+    def memory_safety_factor(self) -> float:
+        """Memory safety factor for parallel execution."""
+        return float(self._parallel.get('memory_safety_factor', 0.75))
     
     def get_memory_safety_factor(self) -> float:
         """Get memory safety factor for parallel execution."""
-        return float(self.config.get('parallel', {}).get('memory_safety_factor', 0.75))
+        return self.memory_safety_factor
+    
+    @cached_property
+    def cpu_reserve_cores(self) -> int:
+        """Number of CPU cores to reserve for system."""
+        return int(self._parallel.get('cpu_reserve_cores', 1))
     
     def get_cpu_reserve_cores(self) -> int:
         """Get number of CPU cores to reserve for system."""
-        return int(self.config.get('parallel', {}).get('cpu_reserve_cores', 1))
+        return self.cpu_reserve_cores
     
     # Walk-forward accessors
-    def get_walkforward_periods(self) -> List[str]:
-        """Get walk-forward period configurations (e.g., ["1Y/6M"])."""
-        return self.config.get('walkforward', {}).get('periods', [])
+    def get_walkforward_periods(self) -> Tuple[str, ...]:
+        """Get walk-forward period configurations (e.g., ("1Y/6M",)). Immutable."""
+        from backtester.config.core.exceptions import ConfigError
+        periods = self.get_walkforward_config().periods
+        if not isinstance(periods, tuple):
+            raise ConfigError(f"walkforward.periods must be a list, got {type(periods)}")
+        return periods
     
-    def get_walkforward_fitness_functions(self) -> List[str]:
+    def get_walkforward_fitness_functions(self) -> Tuple[str, ...]:
         """
         Get fitness function names for walk-forward optimization.
         
         Returns:
-            List of fitness function names (e.g., ["np_avg_dd", "net_profit"])
+            Immutable tuple of fitness function names (e.g., ("np_avg_dd", "net_profit"))
         """
         from backtester.config.core.exceptions import ConfigError
-        fitness_funcs = self.config.get('walkforward', {}).get('fitness_functions', ['np_avg_dd'])
-        if not isinstance(fitness_funcs, list):
+        fitness_funcs = self.get_walkforward_config().fitness_functions
+        if not isinstance(fitness_funcs, tuple):
             raise ConfigError(
                 f"walkforward.fitness_functions must be a list, got {type(fitness_funcs)}. "
                 f"Update config from 'fitness_function: \"...\"' to 'fitness_functions: [\"...\"]'"
@@ -287,7 +476,7 @@ class ConfigAccessor:
     
     def get_parameter_ranges(self) -> Dict[str, Dict[str, int]]:
         """Get parameter ranges for optimization (grid search)."""
-        return self.config.get('walkforward', {}).get('parameter_ranges', {})
+        return self.get_walkforward_config().parameter_ranges
     
     def get_walkforward_filters(self) -> List[str]:
         """
@@ -304,59 +493,42 @@ class ConfigAccessor:
             filters = config.get_walkforward_filters()
             # ['volatility_regime_atr', 'volatility_regime_stddev']
         """
-        filters = self.config.get('walkforward', {}).get('filters', [])
+        filters = self.get_walkforward_config().filters
         
+        # Report invalid entries with a single warning
+        if self._invalid_filters:
+            warnings.warn(
+                f"Ignoring {len(self._invalid_filters)} invalid filter(s) (must be string): "
+                f"{self._invalid_filters!r}",
+                UserWarning, stacklevel=2
+            )
+        return filters
+    
+    @staticmethod
+    def _build_walkforward_filters(filters: Any) -> Tuple[List[str], List[Any]]:
+        """Normalize the raw filters entry to (filter names, invalid non-string entries)."""
         # Handle different input formats
         if filters is None:
-            return []
+            return [], []
         elif isinstance(filters, str):
-            return [filters]  # Single filter name as string
+            return [filters], []  # Single filter name as string
         elif isinstance(filters, list):
-            # Validate all are strings
             valid_filters = []
+            invalid = []
             for f in filters:
-                if isinstance(f, str):
-                    valid_filters.append(f)
-                else:
-                    warnings.warn(f"Ignoring invalid filter (must be string): {f}", UserWarning, stacklevel=2)
-            return valid_filters
+                (valid_filters if isinstance(f, str) else invalid).append(f)
+            return valid_filters, invalid
         else:
-            return []
+            return [], []
     
     # Debug accessors
     def get_debug_config(self) -> DebugConfig:
-        """Get debug configuration as typed object."""
-        debug = self.config.get('debug', {})
-        tracing = debug.get('tracing', {})
-        crash_reports = debug.get('crash_reports', {})
-        auto_capture = crash_reports.get('auto_capture', {})
-        logging = debug.get('logging', {})
-        rotation = logging.get('rotation', {})
+        """
+        Get debug configuration as typed object.
         
-        return DebugConfig(
-            enabled=debug.get('enabled', True),
-            tracing=TracingConfig(
-                enabled=tracing.get('enabled', True),
-                level=tracing.get('level', 'standard'),
-                sample_rate=float(tracing.get('sample_rate', 1.0))
-            ),
-            crash_reports=CrashReportsConfig(
-                enabled=crash_reports.get('enabled', True),
-                max_reports=int(crash_reports.get('max_reports', 50)),
-                max_total_size_mb=float(crash_reports.get('max_total_size_mb', 500)),
-                min_free_disk_mb=float(crash_reports.get('min_free_disk_mb', 1000)),
-                auto_capture=AutoCaptureConfig(
-                    triggers=auto_capture.get('triggers', []),
-                    min_severity=auto_capture.get('min_severity', 'error')
-                )
-            ),
-            logging=DebugLoggingConfig(
-                execution_trace_file=logging.get('execution_trace_file', 'artifacts/logs/backtest_execution.jsonl'),
-                crash_report_dir=logging.get('crash_report_dir', 'artifacts/logs/crash_reports'),
-                rotation=LogRotationConfig(
-                    max_bytes=int(rotation.get('max_bytes', 10485760)),
-                    backup_count=int(rotation.get('backup_count', 5))
-                )
-            )
-        )
-
+        Returns a new copy on every call so callers can toggle flags without
+        affecting other users of this accessor.
+        """
+        if self._debug_config is None:
+            self._debug_config = _convert_config(self._debug, DebugConfig)
+        return copy.deepcopy(self._debug_config)
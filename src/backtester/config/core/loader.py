@@ -5,10 +5,58 @@ Responsible for loading and merging configuration from multiple domain-specific
 """
 
 import os
+import copy
+import json
 import yaml
-from typing import Dict, Any, Optional
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
+# Prefer the libyaml-backed loader; fall back to pure Python if PyYAML was built without it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# orjson (optional) for the per-file JSON cache; stdlib json otherwise
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Merged configs keyed by (config_dir, profile_name, file digests); see ConfigLoader._cache_key
+_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _file_cache_dir() -> Path:
+    """
+    Directory of the per-file JSON cache of parsed YAML.
+    
+    BACKTESTER_CONFIG_CACHE_DIR if set, otherwise backtester/config in the user's
+    cache directory (XDG_CACHE_HOME or ~/.cache), never the config directory itself.
+    """
+    override = os.getenv('BACKTESTER_CONFIG_CACHE_DIR')
+    if override:
+        return Path(override)
+    return Path(os.getenv('XDG_CACHE_HOME') or Path.home() / '.cache') / 'backtester' / 'config'
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class ConfigLoader:
     """
@@ -51,26 +99,60 @@ class ConfigLoader:
         Raises:
             ConfigError: If required config files cannot be loaded
         """
-        # Import here to avoid circular dependency
-        from backtester.config.core.exceptions import ConfigError
+        # Unchanged files -> reuse the previous merge (copied, since callers mutate config)
+        cache_key = self._cache_key(profile_name)
+        if cache_key is not None and cache_key in _CACHE:
+            return copy.deepcopy(_CACHE[cache_key])
+        
         config = {}
         
-        # Load all domain-specific files
-        for domain_file in self.DOMAIN_FILES:
-            file_path = self.config_dir / domain_file
-            if file_path.exists():
-                domain_config = self._load_yaml(file_path)
+        # Load all domain-specific files concurrently (independent reads), then
+        # apply them in DOMAIN_FILES order so update semantics are unchanged
+        file_paths = [self.config_dir / domain_file for domain_file in self.DOMAIN_FILES]
+        with ThreadPoolExecutor(max_workers=len(file_paths)) as executor:
+            for domain_config in executor.map(self._load_yaml_checked, file_paths):
                 config.update(domain_config)
-            else:
-                raise ConfigError(f"Required configuration file not found: {file_path}")
         
-        # Apply profile overrides if specified
+        # Apply profile overrides if specified (only deep-merge when it can matter)
         if profile_name:
             profile_config = self.load_profile(profile_name)
-            config = self.merge_configs(config, profile_config)
+            if not profile_config:
+                pass
+            elif len(profile_config) == 1 and not isinstance(next(iter(profile_config.values())), dict):
+                # Single scalar top-level override: nothing nested to merge
+                config.update(profile_config)
+            else:
+                config = self.merge_configs(config, profile_config)
+        
+        if cache_key is not None:
+            _CACHE[cache_key] = copy.deepcopy(config)
         
         return config
     
+    def _cache_key(self, profile_name: Optional[str]) -> Optional[Tuple]:
+        """
+        Build the load_all cache key from the content of every file it reads.
+        
+        Args:
+            profile_name: Optional profile name included in the load
+        
+        Returns:
+            Hashable key, or None if any file is missing (the uncached path
+            then raises the usual ConfigError)
+        """
+        paths = [self.config_dir / domain_file for domain_file in self.DOMAIN_FILES]
+        if profile_name:
+            paths.append(self.config_dir / 'profiles' / f'{profile_name}.yaml')
+        
+        digests = []
+        for path in paths:
+            try:
+                digests.append((path.name, hashlib.blake2b(path.read_bytes(), digest_size=16).digest()))
+            except OSError:
+                return None
+        
+        return (str(self.config_dir.resolve()), profile_name, tuple(digests))
+    
     def load_profile(self, profile_name: str) -> Dict[str, Any]:
         """
         Load profile-specific configuration overrides.
@@ -90,14 +172,17 @@ class ConfigLoader:
         if not profile_path.exists():
             raise ConfigError(f"Profile configuration file not found: {profile_path}")
         
-        return self._load_yaml(profile_path)
+        return self._load_fast(profile_path)
     
     def merge_configs(self, base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
         """
         Deep merge two configuration dictionaries.
         
         Overrides are applied recursively, so nested dictionaries are merged
-        rather than replaced entirely.
+        rather than replaced entirely; any other value (including lists) replaces
+        the base value. Only dictionaries along overridden paths are copied:
+        untouched subtrees are shared with ``base`` and override values are
+        shared with ``overrides``. Neither input is modified.
         
         Args:
             base: Base configuration dictionary
@@ -106,18 +191,72 @@ class ConfigLoader:
         Returns:
             Merged configuration dictionary
         """
-        result = base.copy()
+        result = dict(base)
         
         for key, value in overrides.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+            base_value = result.get(key)
+            if isinstance(base_value, dict) and isinstance(value, dict):
                 # Recursively merge nested dictionaries
-                result[key] = self.merge_configs(result[key], value)
+                result[key] = self.merge_configs(base_value, value)
             else:
                 # Replace or add the value
                 result[key] = value
         
         return result
     
+    def _load_yaml_checked(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Load a required YAML file.
+        
+        Raises:
+            ConfigError: If the file does not exist or cannot be parsed
+        """
+        from backtester.config.core.exceptions import ConfigError
+        if not file_path.exists():
+            raise ConfigError(f"Required configuration file not found: {file_path}")
+        return self._load_fast(file_path)
+    
+    def _load_fast(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Load a YAML file through the per-file JSON cache.
+        
+        Cache entries are named after a hash of the file's bytes, so any edit
+        (whatever its mtime) misses and parses the YAML again; the parsed result
+        is then cached (best effort, skipped if the content does not round-trip
+        through JSON or the cache directory is not writable).
+        
+        Args:
+            file_path: Path to YAML file
+        
+        Returns:
+            Parsed content as dictionary
+        
+        Raises:
+            ConfigError: If the YAML file cannot be loaded or parsed
+        """
+        try:
+            digest = hashlib.blake2b(file_path.read_bytes(), digest_size=16).hexdigest()
+        except OSError:
+            return self._load_yaml(file_path)
+        cache_path = _file_cache_dir() / f'{digest}.json'
+        
+        try:
+            return _json_loads(cache_path.read_bytes())
+        except (OSError, ValueError):
+            pass
+        
+        content = self._load_yaml(file_path)
+        try:
+            encoded = _json_dumps(content)
+            if _json_loads(encoded) == content:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+                tmp_path.write_bytes(encoded)
+                os.replace(tmp_path, cache_path)
+        except (TypeError, ValueError, OSError):
+            pass
+        return content
+    
     def _load_yaml(self, file_path: Path) -> Dict[str, Any]:
         """
         Load and parse a YAML file.
@@ -134,7 +273,7 @@ class ConfigLoader:
         from backtester.config.core.exceptions import ConfigError
         try:
             with open(file_path, 'r') as f:
-                content = yaml.safe_load(f)
+                content = yaml.load(f, Loader=_SafeLoader)
                 if content is None:
                     return {}
                 return content
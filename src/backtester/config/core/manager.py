@@ -11,11 +11,11 @@ for the backtesting system using a clean separation of concerns:
 
 import os
 import yaml
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple, Mapping
 from pathlib import Path
 
 from backtester.config.core.exceptions import ConfigError
-from backtester.config.core.loader import ConfigLoader
+from backtester.config.core.loader import ConfigLoader, _SafeLoader
 from backtester.config.core.validator import ConfigValidator, ValidationResult
 from backtester.config.core.accessor import ConfigAccessor
 
@@ -64,7 +64,7 @@ class ConfigManager:
             raise ConfigError(f"Metadata file not found: {self.metadata_path}")
         
         with open(self.metadata_path, 'r') as f:
-            self.metadata = yaml.safe_load(f) or {}
+            self.metadata = yaml.load(f, Loader=_SafeLoader) or {}
         
         # Load all configuration files
         try:
@@ -97,6 +97,10 @@ class ConfigManager:
         """Get strategy configuration as typed object."""
         return self.accessor.get_strategy_config()
     
+    def get_walkforward_config(self):
+        """Get walk-forward configuration as typed object."""
+        return self.accessor.get_walkforward_config()
+    
     def get_walkforward_start_date(self) -> str:
         """Get start date for walk-forward optimization."""
         return self.accessor.get_walkforward_start_date()
@@ -166,11 +170,11 @@ class ConfigManager:
         """Get historical start date for data collection."""
         return self.accessor.get_historical_start_date()
     
-    def get_walkforward_periods(self) -> List[str]:
-        """Get walk-forward period configurations (e.g., ["1Y/6M"])."""
+    def get_walkforward_periods(self) -> Tuple[str, ...]:
+        """Get walk-forward period configurations (e.g., ("1Y/6M",))."""
         return self.accessor.get_walkforward_periods()
     
-    def get_walkforward_fitness_functions(self) -> List[str]:
+    def get_walkforward_fitness_functions(self) -> Tuple[str, ...]:
         """Get fitness function names for walk-forward optimization."""
         return self.accessor.get_walkforward_fitness_functions()
     
@@ -182,8 +186,8 @@ class ConfigManager:
         """Get list of filter names for walk-forward optimization."""
         return self.accessor.get_walkforward_filters()
     
-    def get_data_config(self) -> Dict[str, Any]:
-        """Get data configuration dictionary."""
+    def get_data_config(self) -> Mapping[str, Any]:
+        """Get data configuration as a read-only mapping."""
         return self.accessor.get_data_config()
     
     def get_historical_start_date(self) -> str:
@@ -216,9 +220,10 @@ class ConfigManager:
             self.config['strategy']['parameters'] = {}
         self.config['strategy']['parameters'].update(params)
         
-        # Update accessor's internal config reference
+        # Update accessor's internal config reference and drop its cached strategy config
         if self.accessor:
             self.accessor.config = self.config
+            self.accessor._strategy_config = None
     
     def _to_dict(self) -> Dict[str, Any]:
         """
@@ -4,17 +4,483 @@ Configuration validator module.
 Validates configuration structure, types, ranges, and logical constraints.
 """
 
-import pandas as pd
-from typing import Dict, Any, List
+import math
+import re
+from types import MappingProxyType
+from typing import Dict, Any, List, Callable, Optional, Tuple, Mapping
 from datetime import datetime
 
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+try:
+    import ciso8601
+    HAS_CISO8601 = True
+except ImportError:
+    HAS_CISO8601 = False
+
+# Calendar-date ISO 8601 forms that ciso8601 and pandas both accept identically
+# (ciso8601 also takes week/ordinal dates and hour 24, which pandas rejects)
+_ISO_DATE_RE = re.compile(
+    r'\d{4}-\d{2}-\d{2}'
+    r'(?:[T ](?:[01]\d|2[0-3]):\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?'
+)
+
+# Walk-forward period notation accepted by period_parser.parse_period: two
+# <number>[Y|M|W|D] parts (case-insensitive, decimals allowed) around a '/'
+_PERIOD_PATTERN = r'^\s*\d+(?:\.\d+)?\s*[YMWDymwd]?\s*/\s*\d+(?:\.\d+)?\s*[YMWDymwd]?\s*$'
+_PERIOD_RE = re.compile(_PERIOD_PATTERN)
+
+# Years safely inside the pandas nanosecond Timestamp range (1677-09-21 .. 2262-04-11)
+_MIN_SAFE_YEAR = 1678
+_MAX_SAFE_YEAR = 2261
+
+# Section values come straight from YAML and may be of any type (the validators
+# check types themselves), so section parameters are annotated with this alias
+_Section = Any
+
+# Shared read-only stand-in for missing sections (validators only read)
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# Shared endings of field error messages, rendered by _err as "'<path>' <ending>"
+_MSG = {
+    'num': 'must be a number',
+    'int': 'must be an integer',
+    'pos': 'must be positive',
+    'unit': 'must be between 0 and 1.0',
+    'dict': 'must be a dictionary',
+    'bool': 'must be a boolean',
+    'str': 'must be a string',
+}
+
+# Static pieces of parameter_ranges messages; each parameter's path is built
+# once and reused for all of its field errors
+_PR_PREFIX = 'walkforward.parameter_ranges.'
+_PR_FIELDS = ('start', 'end', 'step')
+_PR_ORDER_SUFFIX = ".start' must be less than 'end'"
+
+# Allowed values: tuples keep the documented order for messages, frozensets serve lookups
+_FEE_TYPES = ('maker', 'taker')
+_FULL_ASSESSMENT_SCHEDULES = ('weekly', 'daily')
+_GAP_FILLING_SCHEDULES = ('weekly', 'monthly')
+_PARALLEL_MODES = ('auto', 'manual')
+_FITNESS_FUNCTIONS = ('net_profit', 'sharpe_ratio', 'max_dd', 'profit_factor', 'np_avg_dd')
+_TRACING_LEVELS = ('minimal', 'standard', 'detailed')
+_CRASH_TRIGGERS = (
+    'exception', 'zero_trades', 'validation_error',
+    'memory_warning', 'filter_error', 'indicator_error',
+    'data_alignment_error'
+)
+_SEVERITIES = ('error', 'warning', 'info')
+
+_FEE_TYPE_SET = frozenset(_FEE_TYPES)
+_FULL_ASSESSMENT_SCHEDULE_SET = frozenset(_FULL_ASSESSMENT_SCHEDULES)
+_GAP_FILLING_SCHEDULE_SET = frozenset(_GAP_FILLING_SCHEDULES)
+_PARALLEL_MODE_SET = frozenset(_PARALLEL_MODES)
+_FITNESS_FUNCTION_SET = frozenset(_FITNESS_FUNCTIONS)
+_TRACING_LEVEL_SET = frozenset(_TRACING_LEVELS)
+_CRASH_TRIGGER_SET = frozenset(_CRASH_TRIGGERS)
+_SEVERITY_SET = frozenset(_SEVERITIES)
+
+
+def _is_choice(value: Any, choices: frozenset) -> bool:
+    """Membership test that treats unhashable values (lists, dicts) as not allowed."""
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
+
+# Numeric field rules per config section: (field, type, lo, hi, strict_lo, strict_hi).
+# A value must convert with type() and satisfy lo <= value <= hi (< with strict_*).
+_NUMERIC_RULES: Dict[str, Tuple[Tuple[str, type, float, float, bool, bool], ...]] = {
+    'trading': (
+        ('slippage', float, 0, math.inf, False, False),
+        ('risk_per_trade', float, 0, 1.0, True, False),
+        ('position_size', float, 0, 1.0, True, False),
+        ('commission', float, 0, 1.0, False, False),
+        ('commission_maker', float, 0, 1.0, False, False),
+    ),
+    'data_quality': (
+        ('warning_threshold', float, 0, 100, False, False),
+    ),
+    'parallel': (
+        ('memory_safety_factor', float, 0, 1.0, True, False),
+        ('cpu_reserve_cores', int, 0, math.inf, False, False),
+    ),
+    'walkforward': (
+        ('initial_capital', float, 0, math.inf, True, False),
+    ),
+    'debug.tracing': (
+        ('sample_rate', float, 0, 1.0, True, False),
+    ),
+    'debug.crash_reports': (
+        ('max_reports', int, 0, math.inf, True, False),
+        ('max_total_size_mb', float, 0, math.inf, True, False),
+        ('min_free_disk_mb', float, 0, math.inf, False, False),
+    ),
+    'debug.logging.rotation': (
+        ('max_bytes', int, 0, math.inf, True, False),
+        ('backup_count', int, 0, math.inf, False, False),
+    ),
+}
+
+
+def _err(result: 'ValidationResult', path: str, key: str) -> None:
+    """Add the shared _MSG[key] error for a dotted field path."""
+    result.add_error(f"'{path}' {_MSG[key]}")
+
+
+def _codegen_numeric_checker(section: str, specs) -> str:
+    """
+    Python source of a check(config, result) function applying a section's rules.
+    
+    Each rule becomes an inline membership test, conversion and comparison
+    against literal bounds, with the error messages baked in as constants.
+    """
+    lines = ['def check(config, result):']
+    for field, convert, lo, hi, strict_lo, strict_hi in specs:
+        path = f"'{section}.{field}'"
+        if hi == math.inf:
+            bound = _MSG['pos'] if strict_lo else f'must be >= {lo}'
+        else:
+            bound = f'must be between {lo} and {hi}'
+        kind = _MSG['num'] if convert is float else _MSG['int']
+        
+        out_of_range = [f"value {'<=' if strict_lo else '<'} {lo!r}"]
+        if hi != math.inf:
+            out_of_range.append(f"value {'>=' if strict_hi else '>'} {hi!r}")
+        lines += [
+            f'    if {field!r} in config:',
+            '        try:',
+            f'            value = {convert.__name__}(config[{field!r}])',
+            '        except (ValueError, TypeError):',
+            f'            result.add_error({f"{path} {kind}"!r})',
+            '        else:',
+            f"            if {' or '.join(out_of_range)}:",
+            f'                result.add_error({f"{path} {bound}"!r})',
+        ]
+    if len(lines) == 1:
+        lines.append('    pass')
+    return '\n'.join(lines)
+
+
+def _build_numeric_checker(section: str, specs) -> Callable[[Any, 'ValidationResult'], None]:
+    """Compile the generated checker for one section."""
+    namespace: Dict[str, Any] = {}
+    exec(compile(_codegen_numeric_checker(section, specs), f'<numeric rules: {section}>', 'exec'), namespace)
+    return namespace['check']
+
+
+# Numeric rules are fixed at import time, so each section gets a generated checker
+_NUMERIC_CHECKERS = {
+    section: _build_numeric_checker(section, specs) for section, specs in _NUMERIC_RULES.items()
+}
+
+
+# Hashing a metadata list into a frozenset costs about as much as 2-4 failed
+# linear scans of it, so fewer probes than this just scan the list
+_LOOKUP_MIN_PROBES = 4
+
+
+def _as_lookup(values: Any, probes: int) -> Any:
+    """
+    Metadata list/tuple as a frozenset for O(1) membership; anything else unchanged.
+    
+    Args:
+        values: Metadata value to test membership against
+        probes: Number of membership tests that will be made (few -> keep the list)
+    """
+    if probes >= _LOOKUP_MIN_PROBES and type(values) in (list, tuple):
+        try:
+            return frozenset(values)
+        except TypeError:
+            pass  # Unhashable entries: keep list membership semantics
+    return values
+
+
+def _number(minimum=None, maximum=None, exclusive_minimum=None):
+    """JSON Schema for a number with optional bounds."""
+    schema = {'type': 'number'}
+    if minimum is not None:
+        schema['minimum'] = minimum
+    if exclusive_minimum is not None:
+        schema['exclusiveMinimum'] = exclusive_minimum
+    if maximum is not None:
+        schema['maximum'] = maximum
+    return schema
+
+
+_STRING_OR_STRINGS = {
+    'anyOf': [
+        {'type': 'null'},
+        {'type': 'string'},
+        {'type': 'array', 'items': {'type': 'string'}},
+    ]
+}
+
+# Type/range rules of the validate_* methods as a draft-7 JSON Schema. A config that
+# passes it cannot fail any of those rules (the schema is as strict or stricter), so
+# only cross-field and metadata checks are left to run in Python. Configs rejected by
+# the schema go through the full Python validators, which produce the error messages.
+CONFIG_SCHEMA: Dict[str, Any] = {
+    '$schema': 'http://json-schema.org/draft-07/schema#',
+    'type': 'object',
+    'required': ['data', 'trading', 'strategy', 'walkforward'],
+    'properties': {
+        'data': {
+            'type': 'object',
+            'required': ['exchange'],
+            'properties': {
+                'exchange': {'type': 'string'},
+                'cache_enabled': {'type': 'boolean'},
+                'cache_directory': {'type': 'string'},
+            },
+        },
+        'trading': {
+            'type': 'object',
+            'minProperties': 1,
+            'properties': {
+                'use_exchange_fees': {'type': 'boolean'},
+                'fee_type': {'enum': list(_FEE_TYPES)},
+                'slippage': _number(minimum=0),
+                'risk_per_trade': _number(exclusive_minimum=0, maximum=1.0),
+                'position_size': _number(exclusive_minimum=0, maximum=1.0),
+                'commission': _number(minimum=0, maximum=1.0),
+                'commission_maker': _number(minimum=0, maximum=1.0),
+            },
+        },
+        'strategy': {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string'},
+            },
+        },
+        'data_quality': {
+            'type': 'object',
+            'properties': {
+                'weights': {
+                    'type': 'object',
+                    'additionalProperties': _number(minimum=0, maximum=1.0),
+                },
+                'thresholds': {
+                    'type': 'object',
+                    'additionalProperties': {'type': 'number'},
+                },
+                'warning_threshold': _number(minimum=0, maximum=100),
+                'full_assessment_schedule': {'enum': list(_FULL_ASSESSMENT_SCHEDULES)},
+                'gap_filling_schedule': {'enum': list(_GAP_FILLING_SCHEDULES)},
+            },
+        },
+        'parallel': {
+            'type': 'object',
+            'properties': {
+                'mode': {'enum': list(_PARALLEL_MODES)},
+                'max_workers': {'type': ['integer', 'null'], 'exclusiveMinimum': 0},
+                'memory_safety_factor': _number(exclusive_minimum=0, maximum=1.0),
+                'cpu_reserve_cores': {'type': 'integer', 'minimum': 0},
+            },
+        },
+        'walkforward': {
+            'type': 'object',
+            'required': ['start_date', 'end_date', 'initial_capital'],
+            'properties': {
+                'initial_capital': _number(exclusive_minimum=0),
+                'verbose': {'type': 'boolean'},
+                'symbols': _STRING_OR_STRINGS,
+                'timeframes': _STRING_OR_STRINGS,
+                'periods': {
+                    'type': 'array',
+                    'items': {'type': 'string', 'pattern': _PERIOD_PATTERN},
+                },
+                'fitness_functions': {
+                    'type': 'array',
+                    'items': {'enum': list(_FITNESS_FUNCTIONS)},
+                },
+                'parameter_ranges': {
+                    'type': 'object',
+                    'additionalProperties': {
+                        'type': 'object',
+                        'required': ['start', 'end', 'step'],
+                        'properties': {
+                            'start': {'type': 'integer', 'exclusiveMinimum': 0},
+                            'end': {'type': 'integer', 'exclusiveMinimum': 0},
+                            'step': {'type': 'integer', 'exclusiveMinimum': 0},
+                        },
+                    },
+                },
+                'filters': _STRING_OR_STRINGS,
+            },
+        },
+        'debug': {
+            'type': 'object',
+            'properties': {
+                'enabled': {'type': 'boolean'},
+                'tracing': {
+                    'type': 'object',
+                    'properties': {
+                        'enabled': {'type': 'boolean'},
+                        'level': {'enum': list(_TRACING_LEVELS)},
+                        'sample_rate': _number(exclusive_minimum=0, maximum=1.0),
+                    },
+                },
+                'crash_reports': {
+                    'type': 'object',
+                    'properties': {
+                        'enabled': {'type': 'boolean'},
+                        'max_reports': {'type': 'integer', 'exclusiveMinimum': 0},
+                        'max_total_size_mb': _number(exclusive_minimum=0),
+                        'min_free_disk_mb': _number(minimum=0),
+                        'auto_capture': {
+                            'type': 'object',
+                            'properties': {
+                                'triggers': {
+                                    'type': 'array',
+                                    'items': {'enum': list(_CRASH_TRIGGERS)},
+                                },
+                                'min_severity': {'enum': list(_SEVERITIES)},
+                            },
+                        },
+                    },
+                },
+                'logging': {
+                    'type': 'object',
+                    'properties': {
+                        'execution_trace_file': {'type': 'string'},
+                        'crash_report_dir': {'type': 'string'},
+                        'rotation': {
+                            'type': 'object',
+                            'properties': {
+                                'max_bytes': {'type': 'integer', 'exclusiveMinimum': 0},
+                                'backup_count': {'type': 'integer', 'minimum': 0},
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+# Bump when CONFIG_SCHEMA changes so cached compiled validators are not reused
+_SCHEMA_VERSION = 'v1'
+
+# Compiled schema validators keyed by schema version, shared by all ConfigValidators
+_COMPILED: Dict[str, Callable[[Any], Any]] = {}
+
+
+def _compiled_validator(version: str) -> Optional[Callable[[Any], Any]]:
+    """
+    Get the compiled CONFIG_SCHEMA validator, compiling it on first use.
+    
+    Returns:
+        Compiled validator, or None if fastjsonschema is not installed
+    """
+    if not HAS_FASTJSONSCHEMA:
+        return None
+    compiled = _COMPILED.get(version)
+    if compiled is None:
+        compiled = _COMPILED[version] = fastjsonschema.compile(CONFIG_SCHEMA, use_default=False)
+    return compiled
+
+
+def _parse_date(value: Any, message: str, result: 'ValidationResult') -> Any:
+    """
+    Parse a config date once, recording message as an error if it is invalid.
+    
+    Plain ISO 8601 strings are parsed by ciso8601 when installed. Other strings
+    go through the scalar pd.Timestamp constructor (same parsing as
+    pd.to_datetime, without its list-like dispatch) and are held to the same
+    nanosecond bounds; other values keep pd.to_datetime semantics.
+    
+    Returns:
+        Parsed datetime/timestamp (None/NaT for empty values), or None if invalid
+    """
+    if type(value) is str and HAS_CISO8601 and _ISO_DATE_RE.fullmatch(value):
+        try:
+            parsed = ciso8601.parse_datetime(value)
+        except ValueError:
+            pass  # e.g. day out of range; let pandas decide
+        else:
+            if _MIN_SAFE_YEAR <= parsed.year <= _MAX_SAFE_YEAR:
+                return parsed
+    
+    # Imported on first use so callers that never reach pandas parsing skip its import
+    import pandas as pd
+    try:
+        if type(value) is str:
+            return pd.Timestamp(value).as_unit('ns')
+        return pd.to_datetime(value)
+    except (ValueError, TypeError):
+        result.add_error(message)
+        return None
+
+
+def _dates_out_of_order(start: Any, end: Any) -> bool:
+    """True if both dates parsed and start is not before end."""
+    if start is None or end is None:
+        return False
+    try:
+        return bool(start >= end)
+    except (ValueError, TypeError):
+        return False  # Not comparable (e.g. tz-aware vs naive)
+
+
+def _check_parameter_ranges(ranges: Dict[Any, Any], result: 'ValidationResult') -> None:
+    """
+    Check walkforward.parameter_ranges entries.
+    
+    Each start/end/step is converted with int() once and reused for both the
+    positive check and the start < end check.
+    """
+    for param_name, param_range in ranges.items():
+        path = _PR_PREFIX + str(param_name)
+        if not isinstance(param_range, dict):
+            _err(result, path, 'dict')
+            continue
+        
+        parsed: Dict[str, int] = {}
+        for field in _PR_FIELDS:
+            if field not in param_range:
+                result.add_error("Missing '" + path + "." + field + "'")
+                continue
+            try:
+                value = int(param_range[field])
+            except (ValueError, TypeError):
+                _err(result, path + "." + field, 'int')
+                continue
+            parsed[field] = value
+            if value <= 0:
+                _err(result, path + "." + field, 'pos')
+        
+        # Validate logical constraint: start < end
+        if 'start' in parsed and 'end' in parsed and parsed['start'] >= parsed['end']:
+            result.add_error("'" + path + _PR_ORDER_SUFFIX)
+
+
+class _EarlyExit(Exception):
+    """Raised by ValidationResult.add_error once max_errors is reached."""
+
 
 class ValidationResult:
     """Result of configuration validation."""
     
-    def __init__(self):
+    # No per-instance __dict__: bulk validation creates many of these
+    __slots__ = ('errors', 'warnings', 'max_errors')
+    
+    def __init__(self, max_errors: Optional[int] = None):
+        """
+        Args:
+            max_errors: Stop validating once this many errors were recorded
+                        (None collects every error)
+        """
         self.errors: List[str] = []
         self.warnings: List[str] = []
+        self.max_errors = max_errors
     
     def is_valid(self) -> bool:
         """Check if validation passed."""
@@ -23,6 +489,8 @@ class ValidationResult:
     def add_error(self, message: str):
         """Add a validation error."""
         self.errors.append(message)
+        if self.max_errors is not None and len(self.errors) >= self.max_errors:
+            raise _EarlyExit()
     
     def add_warning(self, message: str):
         """Add a validation warning."""
@@ -36,34 +504,101 @@ class ConfigValidator:
     
     def __init__(self):
         """Initialize the validator."""
-        pass
+        self._schema_version = _SCHEMA_VERSION
+        self._validate = _compiled_validator(self._schema_version)
+    
+    @staticmethod
+    def clear_cache():
+        """Drop compiled schema validators (recompiled by the next ConfigValidator)."""
+        _COMPILED.clear()
     
-    def validate(self, config: Dict[str, Any], metadata: Dict[str, Any] = None) -> ValidationResult:
+    def validate(self, config: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None,
+                 max_errors: Optional[int] = None) -> ValidationResult:
         """
         Validate entire configuration.
         
         Args:
             config: Configuration dictionary to validate
             metadata: Optional exchange metadata for cross-validation
+            max_errors: Optional limit; validation stops at the max_errors-th error
+                        (e.g. 1 for a fail-fast "does this config load?" check)
         
         Returns:
             ValidationResult with errors and warnings
         """
-        from backtester.config.core.exceptions import ConfigError
-        result = ValidationResult()
+        result = ValidationResult(max_errors)
+        try:
+            self._validate_into(config, metadata, result)
+        except _EarlyExit:
+            pass
+        return result
+    
+    def _validate_into(self, config: Dict[str, Any], metadata: Optional[Dict[str, Any]],
+                       result: ValidationResult):
+        """Run all checks, recording errors and warnings in result."""
+        # Fast path: schema-valid configs only need the cross-field/metadata checks
+        if self._validate is not None:
+            try:
+                self._validate(config)
+            except fastjsonschema.JsonSchemaException:
+                pass
+            else:
+                self.validate_cross_fields(config, result, metadata)
+                return
         
         # Validate each domain
-        self.validate_data(config.get('data', {}), result, metadata)
-        self.validate_trading(config.get('trading', {}), result)
-        self.validate_strategy(config.get('strategy', {}), result)
-        self.validate_data_quality(config.get('data_quality', {}), result)
-        self.validate_parallel(config.get('parallel', {}), result)
-        self.validate_walkforward(config.get('walkforward', {}), result, metadata)
-        self.validate_debug(config.get('debug', {}), result)
+        self.validate_data(config.get('data', _EMPTY), result, metadata)
+        self.validate_trading(config.get('trading', _EMPTY), result)
+        self.validate_strategy(config.get('strategy', _EMPTY), result)
+        self.validate_data_quality(config.get('data_quality', _EMPTY), result)
+        self.validate_parallel(config.get('parallel', _EMPTY), result)
+        self.validate_walkforward(config.get('walkforward', _EMPTY), result, metadata)
+        self.validate_debug(config.get('debug', _EMPTY), result)
+    
+    def validate_cross_fields(self, config: Dict[str, Any], result: ValidationResult,
+                              metadata: Optional[Dict[str, Any]] = None):
+        """
+        Run the checks CONFIG_SCHEMA cannot express, for a config that passed it.
         
-        return result
+        Covers date parsing and ordering, metadata cross-validation, the weights
+        sum and parameter range ordering, in the same order validate() reports them.
+        """
+        data = config['data']
+        if metadata and 'exchanges' in metadata:
+            if data['exchange'] not in metadata['exchanges']:
+                result.add_warning(f"Exchange '{data['exchange']}' not found in metadata")
+        if 'historical_start_date' in data:
+            _parse_date(data['historical_start_date'],
+                        "'data.historical_start_date' must be a valid date string", result)
+        
+        weights = config.get('data_quality', _EMPTY).get('weights')
+        if weights is not None:
+            self._check_weights(weights, result)
+        
+        walkforward = config['walkforward']
+        start = _parse_date(walkforward['start_date'],
+                            "'walkforward.start_date' must be a valid date string (YYYY-MM-DD)", result)
+        end = _parse_date(walkforward['end_date'],
+                          "'walkforward.end_date' must be a valid date string (YYYY-MM-DD)", result)
+        if _dates_out_of_order(start, end):
+            result.add_error("'walkforward.start_date' must be before 'walkforward.end_date'")
+        
+        if metadata and 'top_markets' in metadata and isinstance(walkforward.get('symbols'), list):
+            known_symbols = _as_lookup(metadata['top_markets'], len(walkforward['symbols']))
+            for symbol in walkforward['symbols']:
+                if symbol not in known_symbols:
+                    result.add_warning(f"Symbol '{symbol}' not found in metadata.top_markets")
+        if metadata and 'timeframes' in metadata and isinstance(walkforward.get('timeframes'), list):
+            known_timeframes = _as_lookup(metadata['timeframes'], len(walkforward['timeframes']))
+            for tf in walkforward['timeframes']:
+                if tf not in known_timeframes:
+                    result.add_warning(f"Timeframe '{tf}' not found in metadata.timeframes")
+        
+        for param_name, param_range in walkforward.get('parameter_ranges', _EMPTY).items():
+            if param_range['start'] >= param_range['end']:
+                result.add_error("'" + _PR_PREFIX + str(param_name) + _PR_ORDER_SUFFIX)
     
-    def validate_data(self, config: Dict[str, Any], result: ValidationResult, metadata: Dict[str, Any] = None):
+    def validate_data(self, config: _Section, result: ValidationResult, metadata: Optional[Dict[str, Any]] = None):
         """Validate data configuration."""
         if not config:
             result.add_error("Missing 'data' configuration section")
@@ -73,26 +608,24 @@ class ConfigValidator:
         if 'exchange' not in config:
             result.add_error("Missing 'data.exchange' field")
         elif not isinstance(config['exchange'], str):
-            result.add_error("'data.exchange' must be a string")
+            _err(result, 'data.exchange', 'str')
         elif metadata and 'exchanges' in metadata:
             if config['exchange'] not in metadata['exchanges']:
                 result.add_warning(f"Exchange '{config['exchange']}' not found in metadata")
         
         # Validate cache settings
         if 'cache_enabled' in config and not isinstance(config['cache_enabled'], bool):
-            result.add_error("'data.cache_enabled' must be a boolean")
+            _err(result, 'data.cache_enabled', 'bool')
         
         if 'cache_directory' in config and not isinstance(config['cache_directory'], str):
-            result.add_error("'data.cache_directory' must be a string")
+            _err(result, 'data.cache_directory', 'str')
         
         # Validate historical_start_date
         if 'historical_start_date' in config:
-            try:
-                pd.to_datetime(config['historical_start_date'])
-            except (ValueError, TypeError):
-                result.add_error("'data.historical_start_date' must be a valid date string")
+            _parse_date(config['historical_start_date'],
+                        "'data.historical_start_date' must be a valid date string", result)
     
-    def validate_trading(self, config: Dict[str, Any], result: ValidationResult):
+    def validate_trading(self, config: _Section, result: ValidationResult):
         """Validate trading configuration."""
         if not config:
             result.add_error("Missing 'trading' configuration section")
@@ -100,51 +633,17 @@ class ConfigValidator:
         
         # Validate use_exchange_fees
         if 'use_exchange_fees' in config and not isinstance(config['use_exchange_fees'], bool):
-            result.add_error("'trading.use_exchange_fees' must be a boolean")
+            _err(result, 'trading.use_exchange_fees', 'bool')
         
         # Validate fee_type
         if 'fee_type' in config:
-            if config['fee_type'] not in ['maker', 'taker']:
+            if not _is_choice(config['fee_type'], _FEE_TYPE_SET):
                 result.add_error("'trading.fee_type' must be 'maker' or 'taker'")
         
-        # Validate slippage
-        if 'slippage' in config:
-            try:
-                slippage = float(config['slippage'])
-                if slippage < 0:
-                    result.add_error("'trading.slippage' must be >= 0")
-            except (ValueError, TypeError):
-                result.add_error("'trading.slippage' must be a number")
-        
-        # Validate risk_per_trade
-        if 'risk_per_trade' in config:
-            try:
-                risk = float(config['risk_per_trade'])
-                if risk <= 0 or risk > 1.0:
-                    result.add_error("'trading.risk_per_trade' must be between 0 and 1.0")
-            except (ValueError, TypeError):
-                result.add_error("'trading.risk_per_trade' must be a number")
-        
-        # Validate position_size
-        if 'position_size' in config:
-            try:
-                size = float(config['position_size'])
-                if size <= 0 or size > 1.0:
-                    result.add_error("'trading.position_size' must be between 0 and 1.0")
-            except (ValueError, TypeError):
-                result.add_error("'trading.position_size' must be a number")
-        
-        # Validate commission rates
-        for field in ['commission', 'commission_maker']:
-            if field in config:
-                try:
-                    rate = float(config[field])
-                    if rate < 0 or rate > 1.0:
-                        result.add_error(f"'trading.{field}' must be between 0 and 1.0")
-                except (ValueError, TypeError):
-                    result.add_error(f"'trading.{field}' must be a number")
+        # Validate slippage, risk_per_trade, position_size and commission rates
+        _NUMERIC_CHECKERS['trading'](config, result)
     
-    def validate_strategy(self, config: Dict[str, Any], result: ValidationResult):
+    def validate_strategy(self, config: _Section, result: ValidationResult):
         """Validate strategy configuration."""
         if not config:
             result.add_error("Missing 'strategy' configuration section")
@@ -154,11 +653,11 @@ class ConfigValidator:
         if 'name' not in config:
             result.add_error("Missing 'strategy.name' field")
         elif not isinstance(config['name'], str):
-            result.add_error("'strategy.name' must be a string")
+            _err(result, 'strategy.name', 'str')
         
     
     
-    def validate_data_quality(self, config: Dict[str, Any], result: ValidationResult):
+    def validate_data_quality(self, config: _Section, result: ValidationResult):
         """Validate data quality configuration."""
         if not config:
             return  # Data quality config is optional
@@ -166,19 +665,9 @@ class ConfigValidator:
         # Validate weights
         if 'weights' in config:
             if not isinstance(config['weights'], dict):
-                result.add_error("'data_quality.weights' must be a dictionary")
+                _err(result, 'data_quality.weights', 'dict')
             else:
-                total_weight = sum(float(v) for v in config['weights'].values())
-                if abs(total_weight - 1.0) > 0.01:  # Allow small floating point error
-                    result.add_warning(f"'data_quality.weights' sum to {total_weight:.2f}, expected 1.0")
-                
-                for key, value in config['weights'].items():
-                    try:
-                        weight = float(value)
-                        if weight < 0 or weight > 1.0:
-                            result.add_error(f"'data_quality.weights.{key}' must be between 0 and 1.0")
-                    except (ValueError, TypeError):
-                        result.add_error(f"'data_quality.weights.{key}' must be a number")
+                self._check_weights(config['weights'], result)
         
         # Validate thresholds
         if 'thresholds' in config and isinstance(config['thresholds'], dict):
@@ -190,33 +679,46 @@ class ConfigValidator:
                         result.add_warning(f"'data_quality.thresholds.{key}' should be a number")
         
         # Validate warning_threshold
-        if 'warning_threshold' in config:
-            try:
-                threshold = float(config['warning_threshold'])
-                if threshold < 0 or threshold > 100:
-                    result.add_error("'data_quality.warning_threshold' must be between 0 and 100")
-            except (ValueError, TypeError):
-                result.add_error("'data_quality.warning_threshold' must be a number")
+        _NUMERIC_CHECKERS['data_quality'](config, result)
         
         # Validate schedules
         for field in ['full_assessment_schedule', 'gap_filling_schedule']:
             if field in config:
                 if field == 'full_assessment_schedule':
-                    valid_values = ['weekly', 'daily']
+                    valid_values, valid_set = _FULL_ASSESSMENT_SCHEDULES, _FULL_ASSESSMENT_SCHEDULE_SET
                 else:
-                    valid_values = ['weekly', 'monthly']
+                    valid_values, valid_set = _GAP_FILLING_SCHEDULES, _GAP_FILLING_SCHEDULE_SET
                 
-                if config[field] not in valid_values:
-                    result.add_error(f"'data_quality.{field}' must be one of {valid_values}")
+                if not _is_choice(config[field], valid_set):
+                    result.add_error(f"'data_quality.{field}' must be one of {list(valid_values)}")
     
-    def validate_parallel(self, config: Dict[str, Any], result: ValidationResult):
+    def _check_weights(self, weights: Dict[str, Any], result: ValidationResult):
+        """Check each data quality weight and their sum in a single pass."""
+        total_weight = 0.0
+        all_numeric = True
+        for key, value in weights.items():
+            try:
+                weight = float(value)
+            except (ValueError, TypeError):
+                _err(result, f'data_quality.weights.{key}', 'num')
+                all_numeric = False
+                continue
+            if weight < 0 or weight > 1.0:
+                _err(result, f'data_quality.weights.{key}', 'unit')
+            total_weight += weight
+        
+        # The sum is only meaningful when every weight is a number
+        if all_numeric and abs(total_weight - 1.0) > 0.01:  # Allow small floating point error
+            result.add_warning(f"'data_quality.weights' sum to {total_weight:.2f}, expected 1.0")
+    
+    def validate_parallel(self, config: _Section, result: ValidationResult):
         """Validate parallel execution configuration."""
         if not config:
             return  # Parallel config is optional
         
         # Validate mode
         if 'mode' in config:
-            if config['mode'] not in ['auto', 'manual']:
+            if not _is_choice(config['mode'], _PARALLEL_MODE_SET):
                 result.add_error("'parallel.mode' must be 'auto' or 'manual'")
         
         # Validate max_workers
@@ -228,72 +730,42 @@ class ConfigValidator:
             except (ValueError, TypeError):
                 result.add_error("'parallel.max_workers' must be an integer or null")
         
-        # Validate memory_safety_factor
-        if 'memory_safety_factor' in config:
-            try:
-                factor = float(config['memory_safety_factor'])
-                if factor <= 0 or factor > 1.0:
-                    result.add_error("'parallel.memory_safety_factor' must be between 0 and 1.0")
-            except (ValueError, TypeError):
-                result.add_error("'parallel.memory_safety_factor' must be a number")
-        
-        # Validate cpu_reserve_cores
-        if 'cpu_reserve_cores' in config:
-            try:
-                cores = int(config['cpu_reserve_cores'])
-                if cores < 0:
-                    result.add_error("'parallel.cpu_reserve_cores' must be >= 0")
-            except (ValueError, TypeError):
-                result.add_error("'parallel.cpu_reserve_cores' must be an integer")
+        # Validate memory_safety_factor and cpu_reserve_cores
+        _NUMERIC_CHECKERS['parallel'](config, result)
     
-    def validate_walkforward(self, config: Dict[str, Any], result: ValidationResult, metadata: Dict[str, Any] = None):
+    def validate_walkforward(self, config: _Section, result: ValidationResult, metadata: Optional[Dict[str, Any]] = None):
         """Validate walk-forward optimization configuration."""
         if not config:
             result.add_error("Missing 'walkforward' configuration section")
             return
         
-        # Validate start_date
+        # Validate start_date and end_date (each parsed once, reused for the range check)
+        start = end = None
         if 'start_date' not in config:
             result.add_error("Missing required field 'walkforward.start_date'")
         else:
-            try:
-                pd.to_datetime(config['start_date'])
-            except (ValueError, TypeError):
-                result.add_error("'walkforward.start_date' must be a valid date string (YYYY-MM-DD)")
+            start = _parse_date(config['start_date'],
+                                "'walkforward.start_date' must be a valid date string (YYYY-MM-DD)", result)
         
-        # Validate end_date
         if 'end_date' not in config:
             result.add_error("Missing required field 'walkforward.end_date'")
         else:
-            try:
-                pd.to_datetime(config['end_date'])
-            except (ValueError, TypeError):
-                result.add_error("'walkforward.end_date' must be a valid date string (YYYY-MM-DD)")
+            end = _parse_date(config['end_date'],
+                              "'walkforward.end_date' must be a valid date string (YYYY-MM-DD)", result)
         
         # Validate date range logic
-        if 'start_date' in config and 'end_date' in config:
-            try:
-                start = pd.to_datetime(config['start_date'])
-                end = pd.to_datetime(config['end_date'])
-                if start >= end:
-                    result.add_error("'walkforward.start_date' must be before 'walkforward.end_date'")
-            except (ValueError, TypeError):
-                pass  # Already caught above
+        if _dates_out_of_order(start, end):
+            result.add_error("'walkforward.start_date' must be before 'walkforward.end_date'")
         
         # Validate initial_capital
         if 'initial_capital' not in config:
             result.add_error("Missing required field 'walkforward.initial_capital'")
         else:
-            try:
-                capital = float(config['initial_capital'])
-                if capital <= 0:
-                    result.add_error("'walkforward.initial_capital' must be positive")
-            except (ValueError, TypeError):
-                result.add_error("'walkforward.initial_capital' must be a number")
+            _NUMERIC_CHECKERS['walkforward'](config, result)
         
         # Validate verbose
         if 'verbose' in config and not isinstance(config['verbose'], bool):
-            result.add_error("'walkforward.verbose' must be a boolean")
+            _err(result, 'walkforward.verbose', 'bool')
         
         # Validate symbols
         if 'symbols' in config:
@@ -302,11 +774,18 @@ class ConfigValidator:
                 if not isinstance(symbols, (str, list)):
                     result.add_error("'walkforward.symbols' must be a string or list of strings")
                 elif isinstance(symbols, list):
+                    # Metadata lists become sets once per call when enough symbols are checked.
+                    # Element checks here and below test the exact str type first,
+                    # falling back to isinstance only for non-str values/subclasses.
+                    check_symbols = False
+                    known_symbols: Any = None
+                    if metadata and 'top_markets' in metadata:
+                        check_symbols, known_symbols = True, _as_lookup(metadata['top_markets'], len(symbols))
                     for i, symbol in enumerate(symbols):
-                        if not isinstance(symbol, str):
-                            result.add_error(f"'walkforward.symbols[{i}]' must be a string")
-                        elif metadata and 'top_markets' in metadata:
-                            if symbol not in metadata['top_markets']:
+                        if type(symbol) is not str and not isinstance(symbol, str):
+                            _err(result, f'walkforward.symbols[{i}]', 'str')
+                        elif check_symbols:
+                            if symbol not in known_symbols:
                                 result.add_warning(f"Symbol '{symbol}' not found in metadata.top_markets")
         
         # Validate timeframes
@@ -316,11 +795,15 @@ class ConfigValidator:
                 if not isinstance(timeframes, (str, list)):
                     result.add_error("'walkforward.timeframes' must be a string or list of strings")
                 elif isinstance(timeframes, list):
+                    check_timeframes = False
+                    known_timeframes: Any = None
+                    if metadata and 'timeframes' in metadata:
+                        check_timeframes, known_timeframes = True, _as_lookup(metadata['timeframes'], len(timeframes))
                     for i, tf in enumerate(timeframes):
-                        if not isinstance(tf, str):
-                            result.add_error(f"'walkforward.timeframes[{i}]' must be a string")
-                        elif metadata and 'timeframes' in metadata:
-                            if tf not in metadata['timeframes']:
+                        if type(tf) is not str and not isinstance(tf, str):
+                            _err(result, f'walkforward.timeframes[{i}]', 'str')
+                        elif check_timeframes:
+                            if tf not in known_timeframes:
                                 result.add_warning(f"Timeframe '{tf}' not found in metadata.timeframes")
         
         # Validate periods
@@ -329,9 +812,9 @@ class ConfigValidator:
                 result.add_error("'walkforward.periods' must be a list")
             else:
                 for period in config['periods']:
-                    if not isinstance(period, str):
+                    if type(period) is not str and not isinstance(period, str):
                         result.add_error("Each 'walkforward.periods' entry must be a string")
-                    elif '/' not in period:
+                    elif not _PERIOD_RE.match(period):
                         result.add_error(f"Invalid period format '{period}': expected 'X/Y' (e.g., '1Y/6M')")
         
         # Validate fitness_functions
@@ -339,40 +822,16 @@ class ConfigValidator:
             if not isinstance(config['fitness_functions'], list):
                 result.add_error("'walkforward.fitness_functions' must be a list")
             else:
-                valid_functions = ['net_profit', 'sharpe_ratio', 'max_dd', 'profit_factor', 'np_avg_dd']
                 for func in config['fitness_functions']:
-                    if func not in valid_functions:
-                        result.add_error(f"Invalid fitness function '{func}': must be one of {valid_functions}")
+                    if not _is_choice(func, _FITNESS_FUNCTION_SET):
+                        result.add_error(f"Invalid fitness function '{func}': must be one of {list(_FITNESS_FUNCTIONS)}")
         
         # Validate parameter_ranges
         if 'parameter_ranges' in config:
             if not isinstance(config['parameter_ranges'], dict):
-                result.add_error("'walkforward.parameter_ranges' must be a dictionary")
+                _err(result, 'walkforward.parameter_ranges', 'dict')
             else:
-                for param_name, param_range in config['parameter_ranges'].items():
-                    if not isinstance(param_range, dict):
-                        result.add_error(f"'walkforward.parameter_ranges.{param_name}' must be a dictionary")
-                    else:
-                        for field in ['start', 'end', 'step']:
-                            if field not in param_range:
-                                result.add_error(f"Missing 'walkforward.parameter_ranges.{param_name}.{field}'")
-                            else:
-                                try:
-                                    value = int(param_range[field])
-                                    if value <= 0:
-                                        result.add_error(f"'walkforward.parameter_ranges.{param_name}.{field}' must be positive")
-                                except (ValueError, TypeError):
-                                    result.add_error(f"'walkforward.parameter_ranges.{param_name}.{field}' must be an integer")
-                        
-                        # Validate logical constraint: start < end
-                        if 'start' in param_range and 'end' in param_range:
-                            try:
-                                start = int(param_range['start'])
-                                end = int(param_range['end'])
-                                if start >= end:
-                                    result.add_error(f"'walkforward.parameter_ranges.{param_name}.start' must be less than 'end'")
-                            except (ValueError, TypeError):
-                                pass  # Already caught above
+                _check_parameter_ranges(config['parameter_ranges'], result)
         
         # Validate filters (optional)
         if 'filters' in config:
@@ -382,81 +841,50 @@ class ConfigValidator:
                     result.add_error("'walkforward.filters' must be a string or list of strings")
                 elif isinstance(filters, list):
                     for i, f in enumerate(filters):
-                        if not isinstance(f, str):
+                        if type(f) is not str and not isinstance(f, str):
                             result.add_error(f"'walkforward.filters[{i}]' must be a string, got {type(f).__name__}")
     
-    def validate_debug(self, config: Dict[str, Any], result: ValidationResult):
+    def validate_debug(self, config: _Section, result: ValidationResult):
         """Validate debug configuration."""
         if not config:
             return  # Debug config is optional
         
         # Validate enabled
         if 'enabled' in config and not isinstance(config['enabled'], bool):
-            result.add_error("'debug.enabled' must be a boolean")
+            _err(result, 'debug.enabled', 'bool')
         
         # Validate tracing
         if 'tracing' in config:
             tracing = config['tracing']
             if not isinstance(tracing, dict):
-                result.add_error("'debug.tracing' must be a dictionary")
+                _err(result, 'debug.tracing', 'dict')
             else:
                 if 'enabled' in tracing and not isinstance(tracing['enabled'], bool):
-                    result.add_error("'debug.tracing.enabled' must be a boolean")
+                    _err(result, 'debug.tracing.enabled', 'bool')
                 
                 if 'level' in tracing:
-                    valid_levels = ['minimal', 'standard', 'detailed']
-                    if tracing['level'] not in valid_levels:
-                        result.add_error(f"'debug.tracing.level' must be one of {valid_levels}")
+                    if not _is_choice(tracing['level'], _TRACING_LEVEL_SET):
+                        result.add_error(f"'debug.tracing.level' must be one of {list(_TRACING_LEVELS)}")
                 
-                if 'sample_rate' in tracing:
-                    try:
-                        rate = float(tracing['sample_rate'])
-                        if rate <= 0 or rate > 1.0:
-                            result.add_error("'debug.tracing.sample_rate' must be between 0 and 1.0")
-                    except (ValueError, TypeError):
-                        result.add_error("'debug.tracing.sample_rate' must be a number")
+                _NUMERIC_CHECKERS['debug.tracing'](tracing, result)
         
         # Validate crash_reports
         if 'crash_reports' in config:
             crash_reports = config['crash_reports']
             if not isinstance(crash_reports, dict):
-                result.add_error("'debug.crash_reports' must be a dictionary")
+                _err(result, 'debug.crash_reports', 'dict')
             else:
                 if 'enabled' in crash_reports and not isinstance(crash_reports['enabled'], bool):
-                    result.add_error("'debug.crash_reports.enabled' must be a boolean")
+                    _err(result, 'debug.crash_reports.enabled', 'bool')
                 
-                # Validate max_reports
-                if 'max_reports' in crash_reports:
-                    try:
-                        max_reports = int(crash_reports['max_reports'])
-                        if max_reports <= 0:
-                            result.add_error("'debug.crash_reports.max_reports' must be positive")
-                    except (ValueError, TypeError):
-                        result.add_error("'debug.crash_reports.max_reports' must be an integer")
-                
-                # Validate max_total_size_mb
-                if 'max_total_size_mb' in crash_reports:
-                    try:
-                        size = float(crash_reports['max_total_size_mb'])
-                        if size <= 0:
-                            result.add_error("'debug.crash_reports.max_total_size_mb' must be positive")
-                    except (ValueError, TypeError):
-                        result.add_error("'debug.crash_reports.max_total_size_mb' must be a number")
-                
-                # Validate min_free_disk_mb
-                if 'min_free_disk_mb' in crash_reports:
-                    try:
-                        free = float(crash_reports['min_free_disk_mb'])
-                        if free < 0:
-                            result.add_error("'debug.crash_reports.min_free_disk_mb' must be >= 0")
-                    except (ValueError, TypeError):
-                        result.add_error("'debug.crash_reports.min_free_disk_mb' must be a number")
+                # Validate max_reports, max_total_size_mb and min_free_disk_mb
+                _NUMERIC_CHECKERS['debug.crash_reports'](crash_reports, result)
                 
                 # Validate auto_capture
                 if 'auto_capture' in crash_reports:
                     auto_capture = crash_reports['auto_capture']
                     if not isinstance(auto_capture, dict):
-                        result.add_error("'debug.crash_reports.auto_capture' must be a dictionary")
+                        _err(result, 'debug.crash_reports.auto_capture', 'dict')
                     else:
                         # Validate triggers
                         if 'triggers' in auto_capture:
@@ -464,54 +892,34 @@ class ConfigValidator:
                             if not isinstance(triggers, list):
                                 result.add_error("'debug.crash_reports.auto_capture.triggers' must be a list")
                             else:
-                                valid_triggers = [
-                                    'exception', 'zero_trades', 'validation_error',
-                                    'memory_warning', 'filter_error', 'indicator_error',
-                                    'data_alignment_error'
-                                ]
                                 for trigger in triggers:
-                                    if trigger not in valid_triggers:
+                                    if not _is_choice(trigger, _CRASH_TRIGGER_SET):
                                         result.add_warning(f"Unknown trigger '{trigger}' (will be ignored)")
                         
                         # Validate min_severity
                         if 'min_severity' in auto_capture:
-                            valid_severities = ['error', 'warning', 'info']
-                            if auto_capture['min_severity'] not in valid_severities:
-                                result.add_error(f"'debug.crash_reports.auto_capture.min_severity' must be one of {valid_severities}")
+                            if not _is_choice(auto_capture['min_severity'], _SEVERITY_SET):
+                                result.add_error(f"'debug.crash_reports.auto_capture.min_severity' must be one of {list(_SEVERITIES)}")
         
         # Validate logging
         if 'logging' in config:
             logging = config['logging']
             if not isinstance(logging, dict):
-                result.add_error("'debug.logging' must be a dictionary")
+                _err(result, 'debug.logging', 'dict')
             else:
                 # Validate execution_trace_file
                 if 'execution_trace_file' in logging and not isinstance(logging['execution_trace_file'], str):
-                    result.add_error("'debug.logging.execution_trace_file' must be a string")
+                    _err(result, 'debug.logging.execution_trace_file', 'str')
                 
                 # Validate crash_report_dir
                 if 'crash_report_dir' in logging and not isinstance(logging['crash_report_dir'], str):
-                    result.add_error("'debug.logging.crash_report_dir' must be a string")
+                    _err(result, 'debug.logging.crash_report_dir', 'str')
                 
                 # Validate rotation
                 if 'rotation' in logging:
                     rotation = logging['rotation']
                     if not isinstance(rotation, dict):
-                        result.add_error("'debug.logging.rotation' must be a dictionary")
+                        _err(result, 'debug.logging.rotation', 'dict')
                     else:
-                        if 'max_bytes' in rotation:
-                            try:
-                                max_bytes = int(rotation['max_bytes'])
-                                if max_bytes <= 0:
-                                    result.add_error("'debug.logging.rotation.max_bytes' must be positive")
-                            except (ValueError, TypeError):
-                                result.add_error("'debug.logging.rotation.max_bytes' must be an integer")
-                        
-                        if 'backup_count' in rotation:
-                            try:
-                                backup_count = int(rotation['backup_count'])
-                                if backup_count < 0:
-                                    result.add_error("'debug.logging.rotation.backup_count' must be >= 0")
-                            except (ValueError, TypeError):
-                                result.add_error("'debug.logging.rotation.backup_count' must be an integer")
+                        _NUMERIC_CHECKERS['debug.logging.rotation'](rotation, result)
 
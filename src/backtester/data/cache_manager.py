@@ -8,15 +8,23 @@ and manages the cache manifest for metadata tracking.
 import os
 import json
 from tempfile import NamedTemporaryFile
+from threading import Lock
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime
 
 
 CACHE_DIR = Path('data')
 MANIFEST_FILE = CACHE_DIR / '.cache_manifest.json'
 
+# Manifest entries per (manifest file, symbol, timeframe) for get_cached_manifest_entry;
+# cleared by save_manifest, which every manifest writer goes through. The generation
+# counter stops a lookup that raced a save from caching the entry it read before it.
+_entry_cache: Dict[Tuple[str, str, str], Optional[Dict[str, Any]]] = {}
+_entry_cache_generation = 0
+_entry_cache_lock = Lock()
+
 
 def ensure_cache_dir():
     """Ensure cache directory exists."""
@@ -195,11 +203,15 @@ def load_manifest() -> Dict[str, Any]:
 
 def save_manifest(manifest: Dict[str, Any]):
     """Save cache manifest to disk."""
+    global _entry_cache_generation
     ensure_cache_dir()
     tmp_path = MANIFEST_FILE.with_suffix('.json.tmp')
     with open(tmp_path, 'w') as f:
         json.dump(manifest, f, indent=2)
     os.replace(tmp_path, MANIFEST_FILE)
+    with _entry_cache_lock:
+        _entry_cache_generation += 1
+        _entry_cache.clear()
 
 
 def get_manifest_entry(symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
@@ -218,6 +230,33 @@ def get_manifest_entry(symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
     return manifest.get(key)
 
 
+def get_cached_manifest_entry(symbol: str, timeframe: str) -> Optional[Dict[str, Any]]:
+    """
+    Get manifest entry for a symbol/timeframe, reading the manifest once per process.
+    
+    The entry is kept until the manifest is next saved (write_cache,
+    update_manifest, delete_cache). Writes by other processes are not seen.
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+    
+    Returns:
+        Manifest entry dictionary (shared; do not modify) or None if not found
+    """
+    key = (str(MANIFEST_FILE), symbol, timeframe)
+    try:
+        return _entry_cache[key]
+    except KeyError:
+        pass
+    generation = _entry_cache_generation
+    entry = get_manifest_entry(symbol, timeframe)
+    with _entry_cache_lock:
+        if generation == _entry_cache_generation:
+            _entry_cache[key] = entry
+    return entry
+
+
 def get_last_cached_timestamp(symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
     """
     Get the last cached timestamp for a symbol/timeframe.
@@ -0,0 +1,148 @@
+"""
+Persistent cache for exchange discovery results.
+
+Earliest-date probes and best-exchange decisions hardly ever change, so they are
+stored in a small SQLite database next to the data cache and reused for a TTL
+(default 7 days, override with BACKTESTER_DISCOVERY_CACHE_TTL in seconds; 0
+disables lookups). All operations are best effort: database errors behave like
+a cache miss.
+"""
+
+import os
+import time
+import sqlite3
+import pandas as pd
+from pathlib import Path
+from typing import Optional, Tuple, List
+from datetime import datetime
+
+from backtester.data import cache_manager
+
+
+DISCOVERY_CACHE_NAME = '.discovery_cache.db'
+DEFAULT_TTL_SECONDS = 7 * 86400
+
+# Stored in earliest_ms for markets with no data (negative results)
+_NO_DATA = -1
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS earliest ('
+    'exchange TEXT, symbol TEXT, timeframe TEXT, earliest_ms INTEGER, probed_at INTEGER, '
+    'PRIMARY KEY (exchange, symbol, timeframe))',
+    'CREATE TABLE IF NOT EXISTS best_exchange ('
+    'symbol TEXT, timeframe TEXT, exchanges TEXT, exchange TEXT, earliest_ms INTEGER, probed_at INTEGER, '
+    'PRIMARY KEY (symbol, timeframe, exchanges))',
+)
+
+
+def get_cache_file() -> Path:
+    """Path of the discovery database (inside the data cache directory)."""
+    return cache_manager.CACHE_DIR / DISCOVERY_CACHE_NAME
+
+
+def get_ttl_seconds() -> int:
+    """Cache TTL from BACKTESTER_DISCOVERY_CACHE_TTL, or the 7 day default."""
+    try:
+        return int(os.getenv('BACKTESTER_DISCOVERY_CACHE_TTL', DEFAULT_TTL_SECONDS))
+    except ValueError:
+        return DEFAULT_TTL_SECONDS
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the database, creating it and its tables if needed."""
+    cache_manager.ensure_cache_dir()
+    conn = sqlite3.connect(get_cache_file(), timeout=30)
+    for statement in _SCHEMA:
+        conn.execute(statement)
+    return conn
+
+
+def _to_ms(date: Optional[datetime]) -> int:
+    """Date as epoch milliseconds (_NO_DATA for None)."""
+    return _NO_DATA if date is None else int(pd.Timestamp(date).value // 10**6)
+
+
+def _from_ms(earliest_ms: int) -> Optional[pd.Timestamp]:
+    """Inverse of _to_ms: UTC timestamp, or None for _NO_DATA."""
+    return None if earliest_ms == _NO_DATA else pd.to_datetime(earliest_ms, unit='ms', utc=True)
+
+
+def _query_one(sql: str, params: tuple) -> Optional[tuple]:
+    """Fetch one fresh row, or None on a miss, an expired TTL or a database error."""
+    ttl = get_ttl_seconds()
+    if ttl <= 0:
+        return None
+    try:
+        conn = _connect()
+        try:
+            return conn.execute(sql, params + (int(time.time()) - ttl,)).fetchone()
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        return None
+
+
+def _execute(sql: str, params: tuple) -> None:
+    """Run a write statement, ignoring database errors."""
+    try:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute(sql, params)
+        finally:
+            conn.close()
+    except (sqlite3.Error, OSError):
+        pass
+
+
+def lookup_earliest(exchange_id: str, symbol: str, timeframe: str) -> Tuple[bool, Optional[pd.Timestamp]]:
+    """
+    Look up a cached earliest date.
+    
+    Returns:
+        Tuple of (hit, earliest_date); earliest_date is None for a cached "no data" result
+    """
+    row = _query_one(
+        'SELECT earliest_ms FROM earliest WHERE exchange = ? AND symbol = ? AND timeframe = ? '
+        'AND probed_at > ?', (exchange_id, symbol, timeframe))
+    if row is None:
+        return False, None
+    return True, _from_ms(row[0])
+
+
+def store_earliest(exchange_id: str, symbol: str, timeframe: str, earliest: Optional[datetime]) -> None:
+    """Cache an earliest date (None records that the market has no data)."""
+    _execute('INSERT OR REPLACE INTO earliest VALUES (?, ?, ?, ?, ?)',
+             (exchange_id, symbol, timeframe, _to_ms(earliest), int(time.time())))
+
+
+def lookup_best_exchange(symbol: str, timeframe: str,
+                         exchanges: List[str]) -> Optional[Tuple[str, pd.Timestamp]]:
+    """Cached (exchange_name, earliest_date) winner for this exchange list, or None."""
+    row = _query_one(
+        'SELECT exchange, earliest_ms FROM best_exchange WHERE symbol = ? AND timeframe = ? '
+        'AND exchanges = ? AND probed_at > ?', (symbol, timeframe, ','.join(exchanges)))
+    if row is None:
+        return None
+    return row[0], _from_ms(row[1])
+
+
+def store_best_exchange(symbol: str, timeframe: str, exchanges: List[str],
+                        exchange_name: str, earliest: datetime) -> None:
+    """Cache the winning exchange for a symbol/timeframe and exchange list."""
+    _execute('INSERT OR REPLACE INTO best_exchange VALUES (?, ?, ?, ?, ?, ?)',
+             (symbol, timeframe, ','.join(exchanges), exchange_name, _to_ms(earliest), int(time.time())))
+
+
+def invalidate(symbol: Optional[str] = None) -> None:
+    """
+    Drop cached discovery results.
+    
+    Args:
+        symbol: Only drop entries for this trading pair (None drops everything)
+    """
+    for table in ('earliest', 'best_exchange'):
+        if symbol is None:
+            _execute(f'DELETE FROM {table}', ())
+        else:
+            _execute(f'DELETE FROM {table} WHERE symbol = ?', (symbol,))
@@ -8,59 +8,106 @@ the furthest in time for a given market and timeframe.
 import ccxt
 import pandas as pd
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, List
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
-from backtester.data.fetcher import create_exchange, MarketNotFoundError
+from backtester.data import discovery_cache
+from backtester.data.fetcher import create_exchange, MarketNotFoundError, search_earliest_candle, fetch_first_candle
 
 logger = logging.getLogger(__name__)
 
 
-def get_earliest_date(exchange: ccxt.Exchange, symbol: str, timeframe: str) -> Optional[datetime]:
+# Concurrent Jan 1 / month probes per exchange in get_earliest_date (spaced by its rate limiter)
+PROBE_WORKERS = 3
+
+
+def get_earliest_date(exchange: ccxt.Exchange, symbol: str, timeframe: str,
+                      max_workers: int = PROBE_WORKERS, before: Optional[datetime] = None) -> Optional[datetime]:
     """
     Find the earliest available date for a market on a specific exchange.
     
-    Uses year-by-year sampling to efficiently find when data starts.
+    Uses a binary search over years (then months) since 2010, see
+    search_earliest_candle, probing up to max_workers dates at a time. Probes
+    wait on the exchange's shared AdaptiveRateLimiter (see fetch_first_candle),
+    so concurrency overlaps request latency but does not raise the request rate.
+    Results are cached on disk (see discovery_cache); a search with failed
+    probes is not cached since its answer may be too late.
+    
+    With `before`, a single probe the day before it first checks whether the
+    exchange has any data earlier than that; if not, the search is skipped and
+    None is returned (without caching, as the exchange may well have later data).
     
     Args:
         exchange: CCXT exchange instance
         symbol: Trading pair (e.g., 'BTC/USD')
         timeframe: Data granularity (e.g., '1h', '1d')
+        max_workers: Concurrent probes per search round (1 searches serially)
+        before: Only search if the exchange has data before this date (e.g. the best so far)
     
     Returns:
-        Earliest available date, or None if no data exists or market not found
+        Earliest available date, or None if no data exists (before `before`, if given)
+        or market not found
     """
+    hit, cached = discovery_cache.lookup_earliest(exchange.id, symbol, timeframe)
+    if hit:
+        return cached
+    
     end_date = datetime.now(timezone.utc)
     target_start_date = datetime(2010, 1, 1, tzinfo=timezone.utc)  # Start from 2010
+    failed_probes = []
     
-    # Try years from most recent backwards to find first year with data
-    earliest_found = None
-    for year in range(end_date.year, target_start_date.year - 1, -1):
-        test_start = datetime(year, 1, 1, tzinfo=timezone.utc)
-        test_start_ts = exchange.parse8601(test_start.strftime('%Y-%m-%dT00:00:00Z'))
-        
+    def probe(when: datetime) -> Optional[list]:
         try:
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since=test_start_ts, limit=1)
-            if ohlcv and len(ohlcv) > 0:
-                earliest_found = pd.to_datetime(ohlcv[0][0], unit='ms', utc=True)
-                # Found data in this year - return this as earliest
-                logger.debug(f"Found earliest data for {symbol} {timeframe} on {exchange.id} in {year}: {earliest_found.date()}")
-                return earliest_found
+            return fetch_first_candle(exchange, symbol, timeframe, when)
         except (MarketNotFoundError, ccxt.ExchangeError) as e:
-            # Market doesn't exist on this exchange, return None
             error_msg = str(e).lower()
             if 'not found' in error_msg or 'not have market' in error_msg or 'invalid symbol' in error_msg:
-                logger.debug(f"Market {symbol} not found on {exchange.id}")
-                return None
-            # For other exchange errors, continue trying
-            continue
+                raise MarketNotFoundError(f"Market {symbol} not found on {exchange.id}") from e
+            # For other exchange errors, treat as no data at this date
+            failed_probes.append(when)
+            return None
         except Exception:
-            # Network or other temporary errors, continue trying
-            continue
+            # Network or other temporary errors, treat as no data at this date
+            failed_probes.append(when)
+            return None
+    
+    try:
+        if before is not None:
+            candle = probe(before - timedelta(days=1))
+            if not failed_probes and (candle is None or candle[0] >= pd.Timestamp(before).value // 10**6):
+                logger.debug(f"No data for {symbol} {timeframe} on {exchange.id} before {before.date()}")
+                return None
+            failed_probes.clear()  # Inconclusive check: run the full search
+        candle = search_earliest_candle(probe, target_start_date.year, end_date.year, max_workers)
+    except MarketNotFoundError:
+        # Market doesn't exist on this exchange, return None
+        logger.debug(f"Market {symbol} not found on {exchange.id}")
+        discovery_cache.store_earliest(exchange.id, symbol, timeframe, None)
+        return None
+    
+    earliest_found = None if candle is None else pd.to_datetime(candle[0], unit='ms', utc=True)
+    if not failed_probes:
+        discovery_cache.store_earliest(exchange.id, symbol, timeframe, earliest_found)
+    if earliest_found is None:
+        return None
     
+    logger.debug(f"Found earliest data for {symbol} {timeframe} on {exchange.id}: {earliest_found.date()}")
     return earliest_found
 
 
+def _earliest_on_exchange(exchange_name: str, symbol: str, timeframe: str,
+                          before: Optional[datetime] = None) -> Optional[datetime]:
+    """Earliest date for a market on one exchange (see get_earliest_date); None on any failure."""
+    try:
+        exchange = create_exchange(exchange_name, enable_rate_limit=True)
+        logger.debug(f"Testing {exchange_name} for {symbol} {timeframe}...")
+        return get_earliest_date(exchange, symbol, timeframe, before=before)
+    except Exception as e:
+        logger.warning(f"Error testing {exchange_name} for {symbol} {timeframe}: {str(e)}")
+        return None
+
+
 def find_best_exchange(symbol: str, timeframe: str, exchanges: List[str]) -> Tuple[Optional[str], Optional[datetime]]:
     """
     Find the exchange with the most historical data for a given market/timeframe.
@@ -69,6 +116,11 @@ def find_best_exchange(symbol: str, timeframe: str, exchanges: List[str]) -> Tup
     available data date. If multiple exchanges have the same earliest date, returns
     the first one found (prioritizing order in the exchanges list).
     
+    The first exchange is searched on its own; the others are then probed
+    concurrently (one thread each; each exchange's probes share its rate limiter)
+    and only searched fully if they have data before the first one's date, since
+    otherwise they cannot win. Results are compared in list order.
+    
     Args:
         symbol: Trading pair (e.g., 'BTC/USD')
         timeframe: Data granularity (e.g., '1h', '1d')
@@ -77,36 +129,40 @@ def find_best_exchange(symbol: str, timeframe: str, exchanges: List[str]) -> Tup
     Returns:
         Tuple of (exchange_name, earliest_date) or (None, None) if no exchange has data
     """
+    cached = discovery_cache.lookup_best_exchange(symbol, timeframe, exchanges)
+    if cached is not None:
+        logger.debug(f"Using cached best exchange for {symbol} {timeframe}: {cached[0]}")
+        return cached
+    
     best_exchange = None
     earliest_date = None
     
     logger.info(f"Finding best exchange for {symbol} {timeframe} among {exchanges}")
     
-    for exchange_name in exchanges:
-        try:
-            exchange = create_exchange(exchange_name, enable_rate_limit=True)
-            logger.debug(f"Testing {exchange_name} for {symbol} {timeframe}...")
-            
-            date = get_earliest_date(exchange, symbol, timeframe)
-            
-            if date is None:
-                logger.debug(f"{exchange_name} has no data for {symbol} {timeframe}")
-                continue
-            
-            # Check if this exchange has earlier data than current best
-            if earliest_date is None or date < earliest_date:
-                best_exchange = exchange_name
-                earliest_date = date
-                logger.debug(f"{exchange_name} has data from {date.date()} - new best so far")
-        
-        except Exception as e:
-            logger.warning(f"Error testing {exchange_name} for {symbol} {timeframe}: {str(e)}")
+    # The first date bounds the rest: later exchanges must have strictly earlier data to win
+    first = _earliest_on_exchange(exchanges[0], symbol, timeframe) if exchanges else None
+    
+    # Network-bound probes: overlap them, then pick the winner in list order
+    with ThreadPoolExecutor(max_workers=max(1, len(exchanges) - 1)) as executor:
+        rest = list(executor.map(lambda name: _earliest_on_exchange(name, symbol, timeframe, before=first),
+                                 exchanges[1:]))
+    dates = [first] + rest
+    
+    for exchange_name, date in zip(exchanges, dates):
+        if date is None:
+            logger.debug(f"{exchange_name} has no (earlier) data for {symbol} {timeframe}")
             continue
+        
+        # Check if this exchange has earlier data than current best
+        if earliest_date is None or date < earliest_date:
+            best_exchange = exchange_name
+            earliest_date = date
+            logger.debug(f"{exchange_name} has data from {date.date()} - new best so far")
     
     if best_exchange:
         logger.info(f"Best exchange for {symbol} {timeframe}: {best_exchange} (data from {earliest_date.date()})")
+        discovery_cache.store_best_exchange(symbol, timeframe, exchanges, best_exchange, earliest_date)
     else:
         logger.warning(f"No exchange found with data for {symbol} {timeframe}")
     
     return best_exchange, earliest_date
-
@@ -5,19 +5,79 @@ This module handles fetching historical data from exchanges
 with support for full historical fetches and delta fetches.
 """
 
+import os
+import time
 import ccxt
+import numpy as np
 import pandas as pd
 import logging
-from typing import Optional, Tuple
-from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple, Dict, List, Callable
+from datetime import datetime, timedelta, timezone
+
+# pyarrow (optional) stores the per-exchange OHLCV cache as Parquet; CSV otherwise
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 logger = logging.getLogger(__name__)
 
+# Candle length in milliseconds per timeframe, used to step past empty batches
+_TIMEFRAME_MS = {
+    '1m': 60_000, '5m': 300_000, '15m': 900_000, '30m': 1_800_000,
+    '1h': 3_600_000, '2h': 7_200_000, '6h': 21_600_000, '1d': 86_400_000,
+}
+_DEFAULT_STEP_MS = 86_400_000
+
+# Candles per request when the exchange does not advertise its own maximum
+_DEFAULT_BATCH_LIMIT = 1000
+
+# Batch limit per exchange id, resolved on first use (lowered if the exchange rejects it)
+_BATCH_LIMITS: Dict[str, int] = {}
+
+# Column dtypes for the `precision` option of fetch_historical / fetch_historical_cached
+_PRECISION_DTYPES = {'float64': np.float64, 'float32': np.float32}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_DAY_MS = 86_400_000
+
+
+def _day_start_ms(dt: datetime) -> int:
+    """
+    Epoch milliseconds of 00:00:00 UTC on dt's calendar date.
+    
+    Same value as exchange.parse8601(dt.strftime('%Y-%m-%dT00:00:00Z')), computed
+    from the date ordinal instead of formatting and re-parsing a string.
+    """
+    return (dt.toordinal() - _EPOCH.toordinal()) * _DAY_MS
+
+# Per-exchange raw OHLCV kept by fetch_historical_cached (inside the data cache directory)
+OHLCV_CACHE_SUBDIR = '.ohlcv'
+
+# First candle returned by a limit=1 probe, keyed by (exchange id, symbol, timeframe, since).
+# Only hits are cached: a candle that exists never disappears, but an empty probe
+# near the present may return data later.
+_PROBE_CACHE: Dict[Tuple[str, str, str, int], list] = {}
+
+
+# Exchange instances shared per (exchange name, enable_rate_limit), see create_exchange
+_EXCHANGES: Dict[Tuple[str, bool], ccxt.Exchange] = {}
+_EXCHANGES_LOCK = Lock()
+
 
 def create_exchange(exchange_name: str, enable_rate_limit: bool = True) -> ccxt.Exchange:
     """
     Create and configure exchange instance.
     
+    Instances are reused per (exchange_name, enable_rate_limit), so discovery and
+    the fetches that follow share loaded markets, rate-limit state and the HTTP
+    session (keep-alive connections) instead of each starting from scratch.
+    
     Args:
         exchange_name: Name of exchange (e.g., 'coinbase')
         enable_rate_limit: Enable rate limiting
@@ -25,8 +85,31 @@ def create_exchange(exchange_name: str, enable_rate_limit: bool = True) -> ccxt.
     Returns:
         Configured exchange instance
     """
-    exchange_class = getattr(ccxt, exchange_name)
-    return exchange_class({'enableRateLimit': enable_rate_limit})
+    key = (exchange_name, bool(enable_rate_limit))
+    with _EXCHANGES_LOCK:
+        exchange = _EXCHANGES.get(key)
+        if exchange is None:
+            exchange_class = getattr(ccxt, exchange_name)
+            exchange = _EXCHANGES[key] = exchange_class({'enableRateLimit': enable_rate_limit})
+        return exchange
+
+
+def get_batch_limit(exchange: ccxt.Exchange) -> int:
+    """
+    Largest OHLCV request the exchange supports for spot markets.
+    
+    Read from ccxt's exchange features (e.g. kraken 720, okx 300, bitfinex 10000);
+    _DEFAULT_BATCH_LIMIT if the exchange does not declare one. Resolved once per
+    exchange id, and remembered as the default once the exchange rejects it.
+    """
+    limit = _BATCH_LIMITS.get(exchange.id)
+    if limit is None:
+        try:
+            limit = int(exchange.features['spot']['fetchOHLCV']['limit'] or _DEFAULT_BATCH_LIMIT)
+        except (AttributeError, KeyError, TypeError):
+            limit = _DEFAULT_BATCH_LIMIT
+        _BATCH_LIMITS[exchange.id] = limit
+    return limit
 
 
 def fetch_ohlcv_batch(exchange: ccxt.Exchange, symbol: str, timeframe: str,
@@ -57,136 +140,388 @@ def fetch_ohlcv_batch(exchange: ccxt.Exchange, symbol: str, timeframe: str,
         raise FetchError(f"Error fetching data: {str(e)}") from e
 
 
+# Errors worth retrying at the same `since` (includes RateLimitExceeded and DDoSProtection)
+_TRANSIENT_ERRORS = (ccxt.NetworkError,)
+
+
+class AdaptiveRateLimiter:
+    """
+    Spacing between OHLCV requests to one exchange, adapted to rate limits.
+    
+    Requests are always at least min_interval apart (the exchange's rateLimit, see
+    get_rate_limiter), also across threads: ccxt's sync throttling is not
+    thread-safe, so concurrent callers sharing an exchange instance rely on this.
+    On top of that an extra delay starts at zero, doubles (from min_delay, up to
+    max_delay) whenever the exchange reports a rate limit or network error, and
+    decays by 10% per successful request until it drops back below min_delay.
+    """
+    
+    def __init__(self, min_delay: float = 0.1, max_delay: float = 60.0, min_interval: float = 0.0):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_interval = min_interval
+        self.delay = 0.0
+        self._last_request = 0.0
+        self._lock = Lock()
+    
+    def wait(self) -> None:
+        """Sleep until the next request slot (spaced by min_interval or delay) is due."""
+        with self._lock:
+            now = time.monotonic()
+            remaining = self._last_request + max(self.delay, self.min_interval) - now
+            self._last_request = now + max(remaining, 0.0)  # Reserve the slot before sleeping
+        if remaining > 0:
+            time.sleep(remaining)
+    
+    def on_success(self) -> None:
+        """Decay the delay after a successful request."""
+        with self._lock:
+            self.delay *= 0.9
+            if self.delay < self.min_delay:
+                self.delay = 0.0
+    
+    def on_rate_limit(self) -> None:
+        """Back off after a rate limit or network error."""
+        with self._lock:
+            self.delay = min(max(self.delay * 2, self.min_delay), self.max_delay)
+
+
+# One limiter per exchange id, shared by every fetch against that exchange
+_RATE_LIMITERS: Dict[str, AdaptiveRateLimiter] = {}
+_RATE_LIMITERS_LOCK = Lock()
+
+
+def get_rate_limiter(exchange: ccxt.Exchange) -> AdaptiveRateLimiter:
+    """
+    The shared AdaptiveRateLimiter for an exchange.
+    
+    With enableRateLimit the limiter spaces requests by the exchange's rateLimit
+    (milliseconds between requests).
+    """
+    min_interval = 0.0
+    if getattr(exchange, 'enableRateLimit', False):
+        min_interval = (getattr(exchange, 'rateLimit', 0) or 0) / 1000
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(exchange.id)
+        if limiter is None:
+            limiter = _RATE_LIMITERS[exchange.id] = AdaptiveRateLimiter(min_interval=min_interval)
+        else:
+            limiter.min_interval = max(limiter.min_interval, min_interval)
+        return limiter
+
+
+def fetch_ohlcv_batch_retrying(exchange: ccxt.Exchange, symbol: str, timeframe: str, since: int,
+                               limit: int = 1000, limiter: Optional[AdaptiveRateLimiter] = None,
+                               max_retries: int = 5) -> Tuple[list, int]:
+    """
+    fetch_ohlcv_batch that retries rate-limit and network errors at the same `since`.
+    
+    Each failure backs the limiter off and sleeps for its delay before retrying;
+    successes let the delay decay again.
+    
+    Args:
+        exchange: CCXT exchange instance
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+        since: Starting timestamp in milliseconds
+        limit: Maximum number of candles to fetch
+        limiter: Rate limiter to use (defaults to the exchange's shared limiter)
+        max_retries: Retries after the first attempt before giving up
+    
+    Returns:
+        Tuple of (list of OHLCV data, number of API requests made including retries)
+    
+    Raises:
+        FetchError: If the batch still fails after max_retries retries
+    """
+    if limiter is None:
+        limiter = get_rate_limiter(exchange)
+    
+    retries = 0
+    while True:
+        limiter.wait()
+        try:
+            ohlcv, _ = fetch_ohlcv_batch(exchange, symbol, timeframe, since, limit=limit)
+        except FetchError as e:
+            if not isinstance(e.__cause__, _TRANSIENT_ERRORS) or retries >= max_retries:
+                raise
+            retries += 1
+            limiter.on_rate_limit()
+            logger.debug("Retrying %s %s batch on %s in %.1fs (%d/%d): %s",
+                         symbol, timeframe, exchange.id, limiter.delay, retries, max_retries, e.__cause__)
+            time.sleep(limiter.delay)
+            continue
+        limiter.on_success()
+        return ohlcv, retries + 1
+
+
+def fetch_first_candle(exchange: ccxt.Exchange, symbol: str, timeframe: str,
+                  when: datetime) -> Optional[list]:
+    """
+    Fetch the first candle at or after `when` (a single limit=1 request).
+    
+    The request waits for a slot on the exchange's shared rate limiter, so
+    concurrent probes are spaced like any other request.
+    
+    Returns:
+        The candle, or None if the exchange returned no data. Exceptions propagate.
+    """
+    since = _day_start_ms(when)
+    key = (exchange.id, symbol, timeframe, since)
+    candle = _PROBE_CACHE.get(key)
+    if candle is not None:
+        return candle
+    
+    get_rate_limiter(exchange).wait()
+    ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=1)
+    if not ohlcv:
+        return None
+    candle = _PROBE_CACHE[key] = ohlcv[0]
+    return candle
+
+
+def _probe_points(lo: int, hi: int, width: int) -> list:
+    """Up to `width` evenly spread points in [lo, hi) (the midpoint for width 1)."""
+    n = hi - lo
+    if n <= width:
+        return list(range(lo, hi))
+    return [lo + (i + 1) * n // (width + 1) for i in range(width)]
+
+
+def _search_first(probe_many: Callable[[list], list], lo: int, hi: int,
+                  earliest: list, width: int) -> Tuple[int, list]:
+    """
+    Narrow [lo, hi] to the first point with data, probing `width` points per round.
+    
+    Expects points below lo to have no data and hi to have data (candle `earliest`).
+    Width 1 is a plain binary search; wider rounds keep the leftmost hit.
+    """
+    while lo < hi:
+        points = _probe_points(lo, hi, width)
+        for point, candle in zip(points, probe_many(points)):
+            if candle is not None:
+                hi, earliest = point, candle
+                break
+            lo = point + 1
+    return hi, earliest
+
+
+def search_earliest_candle(probe: Callable[[datetime], Optional[list]],
+                           first_year: int, last_year: int, max_workers: int = 1) -> Optional[list]:
+    """
+    Binary search for the earliest candle using Jan 1 probes.
+    
+    Assumes data availability is monotone (once a probe date has data, every later
+    one does too). The newest year with data is found first (normally last_year
+    itself), the years down to first_year are then bisected, and finally the months
+    of the year before the first year with data are bisected, since a market listed
+    mid-year only shows up at the following Jan 1 on exchanges that return candles
+    from a fixed window after `since`. This takes about 10 requests instead of one per year.
+    
+    With max_workers > 1 each round probes up to max_workers dates concurrently
+    and keeps the leftmost hit, so years and months each take one or two rounds
+    of requests instead of four or five sequential ones (at the cost of more
+    requests in total). Falls back to the serial search if no thread pool can be
+    started.
+    
+    Args:
+        probe: Returns the first candle at/after a UTC date, or None if there is none
+        first_year: Earliest year to consider
+        last_year: Latest year to consider
+        max_workers: Concurrent probes per round (1 searches serially)
+    
+    Returns:
+        Earliest candle found, or None if no probe returned data
+    """
+    if max_workers > 1:
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return _search_earliest(probe, first_year, last_year, max_workers,
+                                        lambda dates: list(executor.map(probe, dates)))
+        except RuntimeError as e:
+            logger.debug(f"Parallel earliest-date search unavailable ({e}), searching serially")
+    return _search_earliest(probe, first_year, last_year, 1, lambda dates: [probe(d) for d in dates])
+
+
+def _search_earliest(probe: Callable[[datetime], Optional[list]], first_year: int, last_year: int,
+                     width: int, probe_dates: Callable[[list], list]) -> Optional[list]:
+    """search_earliest_candle with `width` probes per round, run through probe_dates."""
+    def jan_1(year: int) -> datetime:
+        return datetime(year, 1, 1, tzinfo=timezone.utc)
+    
+    # Newest year with data bounds the search (usually the current year)
+    hi, earliest = None, None
+    for year in range(last_year, first_year - 1, -1):
+        earliest = probe(jan_1(year))
+        if earliest is not None:
+            hi = year
+            break
+    if hi is None:
+        return None
+    
+    hi, earliest = _search_first(lambda years: probe_dates([jan_1(y) for y in years]),
+                                 first_year, hi, earliest, width)
+    
+    # Refine to the month within the previous year (month 13 = Jan 1 of `hi`)
+    if hi > first_year:
+        year = hi - 1
+        _, earliest = _search_first(
+            lambda months: probe_dates([datetime(year, m, 1, tzinfo=timezone.utc) for m in months]),
+            2, 13, earliest, width)
+    
+    return earliest
+
+
 def find_earliest_available_date(exchange: ccxt.Exchange, symbol: str, timeframe: str,
                                  target_start_date: datetime, end_date: datetime) -> Optional[datetime]:
     """
-    Find the earliest available date for a market by testing year-by-year.
+    Find the earliest available date for a market by binary search over years.
     
     Returns:
         Earliest available date, or None if no data exists
     """
-    from datetime import timezone
-    
     # Ensure timezone-aware
     if end_date.tzinfo is None:
         end_date = end_date.replace(tzinfo=timezone.utc)
     if target_start_date.tzinfo is None:
         target_start_date = target_start_date.replace(tzinfo=timezone.utc)
     
-    # Try years from most recent backwards to find first year with data
-    earliest_found = None
-    for year in range(end_date.year, target_start_date.year - 1, -1):
-        test_start = datetime(year, 1, 1, tzinfo=timezone.utc)
-        test_start_ts = exchange.parse8601(test_start.strftime('%Y-%m-%dT00:00:00Z'))
-        
+    def probe(when: datetime) -> Optional[list]:
         try:
-            ohlcv = exchange.fetch_ohlcv(symbol, timeframe, since=test_start_ts, limit=1)
-            if ohlcv and len(ohlcv) > 0:
-                earliest_found = pd.to_datetime(ohlcv[0][0], unit='ms', utc=True)
-                # Found data in this year - this is likely the earliest we can easily find
-                # Return it rather than doing expensive binary search
-                logger.debug(f"Found earliest data for {symbol} {timeframe} in {year}: {earliest_found.date()}")
-                return earliest_found
+            return fetch_first_candle(exchange, symbol, timeframe, when)
         except Exception:
-            continue
+            return None  # Treat failed probes as no data
     
+    candle = search_earliest_candle(probe, target_start_date.year, end_date.year)
+    if candle is None:
+        return None
+    
+    earliest_found = pd.to_datetime(candle[0], unit='ms', utc=True)
+    logger.debug(f"Found earliest data for {symbol} {timeframe}: {earliest_found.date()}")
     return earliest_found
 
 
-def fetch_historical(exchange: ccxt.Exchange, symbol: str, timeframe: str,
-                    start_date: str, end_date: Optional[str] = None, 
-                    auto_find_earliest: bool = True, source_exchange: Optional[str] = None) -> Tuple[pd.DataFrame, int]:
+def _parse_date(value: str) -> datetime:
     """
-    Fetch full historical data from start_date to end_date.
+    'YYYY-MM-DD' string as a naive datetime.
     
-    If start_date has no data and auto_find_earliest is True, will automatically
-    find and use the earliest available date.
+    Uses the C datetime.fromisoformat for the canonical form (~40x faster than
+    strptime) and strptime for anything else, so the accepted inputs are unchanged.
+    """
+    if len(value) == 10 and value[4] == value[7] == '-':
+        return datetime.fromisoformat(value)
+    return datetime.strptime(value, '%Y-%m-%d')
+
+
+def _precision_dtype(precision: str) -> type:
+    """NumPy dtype for a `precision` option ('float64' or 'float32')."""
+    try:
+        return _PRECISION_DTYPES[precision]
+    except KeyError:
+        raise ValueError(f"precision must be one of {list(_PRECISION_DTYPES)}, got {precision!r}") from None
+
+
+def _ohlcv_frame(arr: np.ndarray, start_dt: datetime, end_dt: datetime,
+                 dtype: type = np.float64) -> pd.DataFrame:
+    """
+    Build the OHLCV DataFrame from raw candles in one pass.
+    
+    Sorts by timestamp keeping the last of any duplicates, then slices to
+    [start_dt, end_dt] (naive datetimes are taken as UTC) with a binary search.
     
     Args:
-        exchange: CCXT exchange instance
-        symbol: Trading pair (e.g., 'BTC/USD')
-        timeframe: Data granularity (e.g., '1h', '1d')
-        start_date: Start date string (YYYY-MM-DD) or datetime
-        end_date: End date string (YYYY-MM-DD) or datetime. If None, uses today
-        auto_find_earliest: If True, automatically find earliest available date if start_date has no data
-        source_exchange: Exchange name for logging purposes (optional)
+        arr: (n, 6) float array of [timestamp_ms, open, high, low, close, volume] rows
+        start_dt: First timestamp to keep
+        end_dt: Last timestamp to keep
+        dtype: Column dtype (float64 or float32)
     
     Returns:
-        Tuple of (DataFrame with OHLCV data, number of API requests made)
-    
-    Raises:
-        MarketNotFoundError: If market doesn't exist on exchange
-        FetchError: If fetch fails for other reasons
+        DataFrame with a UTC 'datetime' index and OHLCV columns of `dtype`
     """
-    # Parse dates
-    if isinstance(start_date, str):
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-    else:
-        start_dt = start_date
+    ts_ms = arr[:, 0].astype(np.int64)
+    order = np.argsort(ts_ms, kind='stable')
+    ts_ms = ts_ms[order]
+    # Last row of each run of equal timestamps (stable sort keeps fetch order within a run)
+    keep = np.empty(len(ts_ms), dtype=bool)
+    keep[:-1] = ts_ms[1:] != ts_ms[:-1]
+    keep[-1:] = True
+    rows, ts_ms = order[keep], ts_ms[keep]
     
-    if end_date is None:
-        end_dt = datetime.utcnow() - timedelta(days=1)  # Use yesterday by default
-    elif isinstance(end_date, str):
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-    else:
-        end_dt = end_date
+    ts_ns = ts_ms * 1_000_000
+    lo = np.searchsorted(ts_ns, pd.Timestamp(start_dt).value, side='left')
+    hi = np.searchsorted(ts_ns, pd.Timestamp(end_dt).value, side='right')
+    rows, ts_ms = rows[lo:hi], ts_ms[lo:hi]
     
-    # Convert to timestamps
-    start_ts = exchange.parse8601(start_dt.strftime('%Y-%m-%dT00:00:00Z'))
-    end_ts = exchange.parse8601(end_dt.strftime('%Y-%m-%dT23:59:59Z'))
+    index = pd.DatetimeIndex(pd.to_datetime(ts_ms, unit='ms', utc=True), name='datetime')
+    return pd.DataFrame(arr[rows, 1:].astype(dtype, copy=False), index=index,
+                        columns=['open', 'high', 'low', 'close', 'volume'])
+
+
+def _fetch_loop(exchange: ccxt.Exchange, symbol: str, timeframe: str,
+                since_ms: int, end_ts: int, end_us: int) -> Tuple[np.ndarray, int]:
+    """
+    Fetch batches of candles from since_ms until end_ts (see fetch_historical).
     
-    # Fetch data in batches
-    since = start_ts
-    all_ohlcv = []
+    Args:
+        exchange: CCXT exchange instance
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+        since_ms: First timestamp to request (epoch milliseconds)
+        end_ts: Stop requesting at this timestamp (epoch milliseconds)
+        end_us: Stop once a batch reaches this end date (epoch microseconds)
+    
+    Returns:
+        Tuple of ((n, 6) float array of raw candles in fetch order, number of API requests made)
+    """
+    since = since_ms
+    # Candles are copied into a growing float buffer (amortized doubling) as they arrive
+    buffer = np.empty((4096, 6), dtype=np.float64)
+    candle_count = 0
     api_requests = 0
     max_iterations = 10000  # Safety limit to prevent infinite loops
     consecutive_empty_batches = 0
     max_consecutive_empty = 3  # Stop after 3 consecutive empty batches
     
-    exchange_info = f" from {source_exchange}" if source_exchange else ""
-    logger.debug(f"Fetching {symbol} {timeframe}{exchange_info} from {start_dt} to {end_dt} (API requests: {api_requests})")
+    step_ms = _TIMEFRAME_MS.get(timeframe, _DEFAULT_STEP_MS)  # Skip-ahead on empty/failed batches
+    limiter = get_rate_limiter(exchange)  # Transient errors are retried at the same `since`
+    batch_limit = get_batch_limit(exchange)
     
     while since < end_ts and api_requests < max_iterations:
         try:
-            ohlcv, requests = fetch_ohlcv_batch(exchange, symbol, timeframe, since, limit=1000)
+            ohlcv, requests = fetch_ohlcv_batch_retrying(exchange, symbol, timeframe, since, limit=batch_limit,
+                                                         limiter=limiter)
             
             if not ohlcv:
                 # No data in this batch
                 consecutive_empty_batches += 1
-                logger.debug(f"Empty batch {consecutive_empty_batches}/{max_consecutive_empty} for {symbol} {timeframe} at {pd.to_datetime(since, unit='ms', utc=True)}")
+                if logger.isEnabledFor(logging.DEBUG):  # Skip the timestamp conversion otherwise
+                    logger.debug("Empty batch %d/%d for %s %s at %s", consecutive_empty_batches,
+                                 max_consecutive_empty, symbol, timeframe, pd.to_datetime(since, unit='ms', utc=True))
                 if consecutive_empty_batches >= max_consecutive_empty:
                     # Stop if we've hit multiple consecutive empty batches
                     logger.info(f"Stopping fetch for {symbol} {timeframe}: {max_consecutive_empty} consecutive empty batches")
                     break
-                # Try moving forward a bit to see if there's a gap
-                # For daily candles, move forward 1 day; for hourly, 1 hour, etc.
-                timeframe_to_hours = {
-                    '1m': 1/60, '5m': 5/60, '15m': 15/60, '30m': 30/60,
-                    '1h': 1, '2h': 2, '6h': 6, '1d': 24
-                }
-                hours_per_candle = timeframe_to_hours.get(timeframe, 24)
-                since += int(hours_per_candle * 3600 * 1000)  # Convert to milliseconds
+                # Try moving forward one candle to see if there's a gap
+                since += step_ms
                 continue
             
             # Reset empty batch counter on successful fetch
             consecutive_empty_batches = 0
             
-            all_ohlcv.extend(ohlcv)
+            batch = np.asarray(ohlcv, dtype=np.float64)
+            if candle_count + len(batch) > len(buffer):
+                grown = np.empty((max(2 * len(buffer), candle_count + len(batch)), 6), dtype=np.float64)
+                grown[:candle_count] = buffer[:candle_count]
+                buffer = grown
+            buffer[candle_count:candle_count + len(batch)] = batch
+            candle_count += len(batch)
             api_requests += requests
             
             # Update since to next candle after the last one
             last_timestamp = ohlcv[-1][0]
             
             # Check if we've reached or passed the end date
-            last_dt = pd.to_datetime(last_timestamp, unit='ms', utc=True)
-            # Ensure end_dt is timezone-aware for comparison
-            from datetime import timezone
-            if end_dt.tzinfo is None:
-                end_dt_aware = end_dt.replace(tzinfo=timezone.utc)
-            else:
-                end_dt_aware = end_dt
-            
-            if last_dt >= end_dt_aware:
+            if last_timestamp * 1000 >= end_us:
                 # We've reached or passed the end date - filter out future data
                 break
             
@@ -205,17 +540,17 @@ def fetch_historical(exchange: ccxt.Exchange, symbol: str, timeframe: str,
             error_msg = str(e).lower()
             if 'not have market' in error_msg or 'not found' in error_msg or 'invalid symbol' in error_msg:
                 raise MarketNotFoundError(f"Market {symbol} not found on {exchange.id}") from e
+            if isinstance(e, ccxt.BadRequest) and batch_limit > _DEFAULT_BATCH_LIMIT:
+                # Advertised limit rejected: retry this batch with the default size
+                logger.debug("%s rejected limit=%d, using %d: %s", exchange.id, batch_limit, _DEFAULT_BATCH_LIMIT, e)
+                batch_limit = _BATCH_LIMITS[exchange.id] = _DEFAULT_BATCH_LIMIT
+                continue
             # For other exchange errors, treat as temporary and retry
             consecutive_empty_batches += 1
             if consecutive_empty_batches >= max_consecutive_empty:
                 raise FetchError(f"Multiple consecutive exchange errors: {str(e)}") from e
             # Move forward and retry
-            timeframe_to_hours = {
-                '1m': 1/60, '5m': 5/60, '15m': 15/60, '30m': 30/60,
-                '1h': 1, '2h': 2, '6h': 6, '1d': 24
-            }
-            hours_per_candle = timeframe_to_hours.get(timeframe, 24)
-            since += int(hours_per_candle * 3600 * 1000)
+            since += step_ms
             continue
         except Exception as e:
             # For other errors, log and continue to next batch
@@ -224,63 +559,129 @@ def fetch_historical(exchange: ccxt.Exchange, symbol: str, timeframe: str,
             if consecutive_empty_batches >= max_consecutive_empty:
                 raise FetchError(f"Multiple consecutive fetch errors: {str(e)}") from e
             # Move forward and retry
-            timeframe_to_hours = {
-                '1m': 1/60, '5m': 5/60, '15m': 15/60, '30m': 30/60,
-                '1h': 1, '2h': 2, '6h': 6, '1d': 24
-            }
-            hours_per_candle = timeframe_to_hours.get(timeframe, 24)
-            since += int(hours_per_candle * 3600 * 1000)
+            since += step_ms
             continue
     
-    if not all_ohlcv:
-        # If we got no data and auto_find_earliest is enabled, try to find earliest available date
-        if auto_find_earliest:
-            logger.info(f"No data found for {symbol} {timeframe} from {start_date}. Searching for earliest available date...")
-            earliest_date = find_earliest_available_date(exchange, symbol, timeframe, start_dt, end_dt)
-            if earliest_date:
-                logger.info(f"Found earliest available date: {earliest_date.date()}. Fetching from that date...")
-                # Retry fetch from earliest available date
-                earliest_str = earliest_date.strftime('%Y-%m-%d')
-                return fetch_historical(exchange, symbol, timeframe, earliest_str, end_date, auto_find_earliest=False)
-            else:
-                logger.warning(f"No data available for {symbol} {timeframe} at any date")
-        else:
-            logger.warning(f"No data fetched for {symbol} {timeframe} from {start_date} to {end_date}")
-        return pd.DataFrame(), api_requests
+    return buffer[:candle_count], api_requests
+
+
+def fetch_historical(exchange: ccxt.Exchange, symbol: str, timeframe: str,
+                    start_date: str, end_date: Optional[str] = None, 
+                    auto_find_earliest: bool = True, source_exchange: Optional[str] = None,
+                    precision: str = 'float64') -> Tuple[pd.DataFrame, int]:
+    """
+    Fetch full historical data from start_date to end_date.
     
-    logger.debug(f"Fetched {len(all_ohlcv)} total candles for {symbol} {timeframe} in {api_requests} API requests")
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(all_ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-    df['datetime'] = pd.to_datetime(df['timestamp'], unit='ms', utc=True)
-    df = df.set_index('datetime')
-    df = df.drop('timestamp', axis=1)
-    
-    # Remove duplicates and sort
-    df = df[~df.index.duplicated(keep='last')]
-    df = df.sort_index()
-    
-    # Filter to requested date range
-    # Ensure timezone-aware comparison
-    if df.index.tz is not None:
-        # DataFrame is timezone-aware, convert start/end to UTC
-        from datetime import timezone
-        if start_dt.tzinfo is None:
-            start_dt = start_dt.replace(tzinfo=timezone.utc)
-        if end_dt.tzinfo is None:
-            end_dt = end_dt.replace(tzinfo=timezone.utc)
+    If start_date has no data and auto_find_earliest is True, will automatically
+    find and use the earliest available date.
+    
+    Args:
+        exchange: CCXT exchange instance
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+        start_date: Start date string (YYYY-MM-DD) or datetime
+        end_date: End date string (YYYY-MM-DD) or datetime. If None, uses today
+        auto_find_earliest: If True, automatically find earliest available date if start_date has no data
+        source_exchange: Exchange name for logging purposes (optional)
+        precision: Column dtype, 'float64' or 'float32' (half the memory, ~7 significant digits)
+    
+    Returns:
+        Tuple of (DataFrame with OHLCV data, number of API requests made)
+    
+    Raises:
+        MarketNotFoundError: If market doesn't exist on exchange
+        FetchError: If fetch fails for other reasons
+    """
+    dtype = _precision_dtype(precision)
+    
+    # Parse dates
+    if isinstance(start_date, str):
+        start_dt = _parse_date(start_date)
     else:
-        # DataFrame is timezone-naive, ensure dates are naive too
-        if start_dt.tzinfo is not None:
-            start_dt = start_dt.replace(tzinfo=None)
-        if end_dt.tzinfo is not None:
-            end_dt = end_dt.replace(tzinfo=None)
+        start_dt = start_date
+    
+    if end_date is None:
+        end_dt = datetime.utcnow() - timedelta(days=1)  # Use yesterday by default
+    elif isinstance(end_date, str):
+        end_dt = _parse_date(end_date)
+    else:
+        end_dt = end_date
+    
+    # Convert to timestamps
+    start_ts = _day_start_ms(start_dt)
+    end_ts = _day_start_ms(end_dt) + _DAY_MS - 1000  # 23:59:59
     
-    df = df[(df.index >= start_dt) & (df.index <= end_dt)]
+    # End date in exact epoch microseconds, so candle timestamps compare as integers
+    end_dt_aware = end_dt if end_dt.tzinfo is not None else end_dt.replace(tzinfo=timezone.utc)
+    end_us = (end_dt_aware - _EPOCH) // timedelta(microseconds=1)
+    
+    logger.debug("Fetching %s %s%s from %s to %s", symbol, timeframe,
+                 f" from {source_exchange}" if source_exchange else "", start_dt, end_dt)
+    
+    candles, api_requests = _fetch_loop(exchange, symbol, timeframe, start_ts, end_ts, end_us)
+    
+    if not len(candles) and auto_find_earliest:
+        # No data from start_date: continue from the earliest available date instead
+        logger.info(f"No data found for {symbol} {timeframe} from {start_date}. Searching for earliest available date...")
+        earliest_date = find_earliest_available_date(exchange, symbol, timeframe, start_dt, end_dt)
+        if not earliest_date:
+            logger.warning(f"No data available for {symbol} {timeframe} at any date")
+            return pd.DataFrame(), api_requests
+        logger.info(f"Found earliest available date: {earliest_date.date()}. Fetching from that date...")
+        start_dt = earliest_date.normalize()
+        candles, requests = _fetch_loop(exchange, symbol, timeframe, _day_start_ms(start_dt), end_ts, end_us)
+        api_requests += requests
+    
+    if not len(candles):
+        logger.warning(f"No data fetched for {symbol} {timeframe} from {start_dt.date()} to {end_dt.date()}")
+        return pd.DataFrame(), api_requests
+    
+    logger.debug("Fetched %d total candles for %s %s in %d API requests", len(candles), symbol, timeframe, api_requests)
+    
+    df = _ohlcv_frame(candles, start_dt, end_dt, dtype)
     
     return df, api_requests
 
 
+def fetch_historical_many(exchange_name: str, symbols: List[str], timeframe: str,
+                          start_date: str, end_date: Optional[str] = None,
+                          max_workers: int = 4) -> Dict[str, Tuple[pd.DataFrame, int]]:
+    """
+    Fetch historical data for several symbols from one exchange concurrently.
+    
+    All symbols share the exchange instance from create_exchange (loaded markets,
+    HTTP session) and its AdaptiveRateLimiter, which spaces every request by the
+    exchange's rateLimit across threads and backs off on rate limits, so up to
+    max_workers fetch_historical calls overlap their network latency without
+    raising the request rate. Symbols whose fetch fails are logged and left out
+    of the result.
+    
+    Args:
+        exchange_name: Name of exchange (e.g., 'coinbase')
+        symbols: Trading pairs (e.g., ['BTC/USD', 'ETH/USD'])
+        timeframe: Data granularity (e.g., '1h', '1d')
+        start_date: Start date string (YYYY-MM-DD)
+        end_date: End date string (YYYY-MM-DD). If None, uses today
+        max_workers: Maximum concurrent symbol fetches
+    
+    Returns:
+        Dict mapping symbol to (DataFrame with OHLCV data, number of API requests made)
+    """
+    exchange = create_exchange(exchange_name, enable_rate_limit=True)
+    
+    def fetch(symbol: str) -> Optional[Tuple[pd.DataFrame, int]]:
+        try:
+            return fetch_historical(exchange, symbol, timeframe, start_date, end_date,
+                                    source_exchange=exchange_name)
+        except (MarketNotFoundError, FetchError) as e:
+            logger.warning(f"Could not fetch {symbol} {timeframe} from {exchange_name}: {e}")
+            return None
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(symbols)))) as executor:
+        results = list(executor.map(fetch, symbols))
+    return {symbol: result for symbol, result in zip(symbols, results) if result is not None}
+
+
 def fetch_from_date(exchange: ccxt.Exchange, symbol: str, timeframe: str,
                    from_timestamp: pd.Timestamp, end_date: Optional[str] = None) -> Tuple[pd.DataFrame, int]:
     """
@@ -305,9 +706,145 @@ def fetch_from_date(exchange: ccxt.Exchange, symbol: str, timeframe: str,
     # Add 1 minute to ensure we get the next candle (not the last one we already have)
     from_dt = from_dt + timedelta(minutes=1)
     
-    start_date_str = from_dt.strftime('%Y-%m-%d')
+    # Fetch from midnight of that day (naive, as fetch_historical expects)
+    start_day = datetime(from_dt.year, from_dt.month, from_dt.day)
+    
+    return fetch_historical(exchange, symbol, timeframe, start_day, end_date)
+
+
+def _ohlcv_cache_path(cache_dir: Path, exchange_id: str, symbol: str, timeframe: str) -> Path:
+    """Cache file for an exchange/symbol/timeframe (Parquet with pyarrow, else CSV)."""
+    suffix = 'parquet' if HAS_PYARROW else 'csv'
+    return cache_dir / f"{exchange_id}_{symbol.replace('/', '_')}_{timeframe}.{suffix}"
+
+
+def _read_ohlcv_cache(path: Path) -> pd.DataFrame:
+    """Read a cached OHLCV frame (UTC DatetimeIndex); empty if missing or unreadable."""
+    if not path.exists():
+        return pd.DataFrame()
+    try:
+        if path.suffix == '.parquet':
+            df = pd.read_parquet(path, columns=['open', 'high', 'low', 'close', 'volume'])
+        else:
+            df = pd.read_csv(path, index_col='datetime')
+            df.index = pd.to_datetime(df.index, utc=True)
+        return df
+    except Exception:
+        return pd.DataFrame()
+
+
+def _write_ohlcv_cache(path: Path, df: pd.DataFrame) -> None:
+    """Write an OHLCV frame atomically (temp file then replace)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df = df.copy()
+    df.index.name = 'datetime'
+    with NamedTemporaryFile('wb', delete=False, dir=str(path.parent), prefix=path.name + '.', suffix='.tmp') as tmp:
+        tmp_path = tmp.name
+    try:
+        if path.suffix == '.parquet':
+            df.to_parquet(tmp_path, compression='zstd')
+        else:
+            df.to_csv(tmp_path)
+        os.replace(tmp_path, path)
+    except Exception:
+        os.unlink(tmp_path)
+        raise
+
+
+def _start_marker_path(path: Path) -> Path:
+    """Sidecar file recording the earliest start date already fetched into a cache file."""
+    return path.with_name(path.name + '.start')
+
+
+def _read_fetched_from(path: Path) -> Optional[pd.Timestamp]:
+    """Earliest start date already fetched into a cache file, or None if unknown."""
+    try:
+        return pd.Timestamp(_start_marker_path(path).read_text().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def fetch_historical_cached(exchange: ccxt.Exchange, symbol: str, timeframe: str,
+                            start_date: str, end_date: Optional[str] = None,
+                            cache_dir: Optional[Path] = None,
+                            precision: str = 'float64') -> Tuple[pd.DataFrame, int]:
+    """
+    Fetch historical data through a per-exchange on-disk cache.
+    
+    The first call behaves like fetch_historical and stores the result. Later calls
+    only fetch what the cache lacks: the tail from the last cached candle onwards
+    (re-fetching that day so an incomplete last candle is replaced) and, if
+    start_date is before the first cached candle, the range up to it. Once a start
+    date has been fetched it is recorded next to the cache, so a market listed
+    after it is not asked for its (non-existent) earlier candles again. The cache
+    itself always keeps float64; `precision` only applies to the returned frame.
+    
+    Args:
+        exchange: CCXT exchange instance
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+        start_date: Start date string (YYYY-MM-DD)
+        end_date: End date string (YYYY-MM-DD). If None, uses today
+        cache_dir: Cache directory (defaults to <data cache>/.ohlcv)
+        precision: Column dtype, 'float64' or 'float32'
+    
+    Returns:
+        Tuple of (DataFrame with OHLCV data for the requested range, number of API requests made)
+    """
+    dtype = _precision_dtype(precision)
+    if cache_dir is None:
+        from backtester.data import cache_manager
+        cache_dir = cache_manager.CACHE_DIR / OHLCV_CACHE_SUBDIR
+    path = _ohlcv_cache_path(Path(cache_dir), exchange.id, symbol, timeframe)
+    cached = _read_ohlcv_cache(path)
+    
+    # Requested range, bounded like fetch_historical's final filter
+    start_dt = pd.Timestamp(start_date, tz='UTC')
+    if end_date is None:
+        end_dt = pd.Timestamp(datetime.utcnow() - timedelta(days=1), tz='UTC')
+    else:
+        end_dt = pd.Timestamp(end_date, tz='UTC')
+    
+    fetched_from = None if cached.empty else _read_fetched_from(path)
+    if cached.empty:
+        df, api_requests = fetch_historical(exchange, symbol, timeframe, start_date, end_date)
+        if df.empty:
+            return df, api_requests
+        merged = df
+        fetched_from = start_dt
+    else:
+        parts = [cached]
+        api_requests = 0
+        first_cached, last_cached = cached.index.min(), cached.index.max()
+        if start_dt < first_cached.normalize() and (fetched_from is None or start_dt < fetched_from):
+            # Head gap: only up to the first cached day (no earliest-date search here)
+            head, requests = fetch_historical(exchange, symbol, timeframe, start_date,
+                                              first_cached.strftime('%Y-%m-%d'), auto_find_earliest=False)
+            parts.insert(0, head)
+            api_requests += requests
+            fetched_from = start_dt
+        if last_cached < end_dt:
+            tail, requests = fetch_from_date(exchange, symbol, timeframe, last_cached, end_date)
+            parts.append(tail)
+            api_requests += requests
+        
+        if api_requests == 0:
+            return cached[(cached.index >= start_dt) & (cached.index <= end_dt)].astype(dtype, copy=False), 0
+        merged = pd.concat([part for part in parts if not part.empty])
+        # Sort and drop duplicate timestamps in one np.unique pass; the reversed
+        # array makes its first occurrences the last (freshest) rows
+        ts = merged.index.asi8
+        _, last_rows = np.unique(ts[::-1], return_index=True)
+        merged = merged.iloc[len(ts) - 1 - last_rows]
+    
+    try:
+        _write_ohlcv_cache(path, merged)
+        if fetched_from is not None:
+            _start_marker_path(path).write_text(fetched_from.isoformat())
+    except (OSError, ValueError, ImportError) as e:
+        logger.warning(f"Could not write OHLCV cache {path}: {e}")
     
-    return fetch_historical(exchange, symbol, timeframe, start_date_str, end_date)
+    return merged[(merged.index >= start_dt) & (merged.index <= end_dt)].astype(dtype, copy=False), api_requests
 
 
 class MarketNotFoundError(Exception):
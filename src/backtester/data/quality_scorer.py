@@ -5,22 +5,53 @@ This module calculates component scores and composite quality scores
 for OHLCV datasets based on various quality metrics.
 """
 
+import numpy as np
 import pandas as pd
-from typing import Dict, Any, Optional
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple, List
 from datetime import datetime
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from backtester.data.validator import (
-    validate_ohlcv_integrity, validate_volume, detect_outliers,
+    validate_ohlcv_integrity, validate_volume,
     validate_cross_candle_consistency, validate_missing_values,
-    validate_chronological_order, detect_gaps, get_timeframe_delta
+    validate_chronological_order, count_gaps, get_timeframe_delta
 )
 from backtester.data.cache_manager import read_cache, get_manifest_entry
 
 
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# Composite score thresholds for grades D, C, B and A (below the first is F)
+_GRADE_THRESHOLDS = (60, 70, 80, 90)
+_GRADES = 'FDCBA'
+
+# Array dtypes for the `precision` option of the scorers
+_PRECISION_DTYPES = {'float64': np.float64, 'float32': np.float32}
+
+# Weights/thresholds loaded from the default ConfigManager, once per process
+# (see clear_quality_config_cache)
+_QUALITY_CONFIG_CACHE: Dict[str, Dict[str, Any]] = {}
+
+
+def clear_quality_config_cache() -> None:
+    """Forget cached weights/thresholds so the next load re-reads the config."""
+    _QUALITY_CONFIG_CACHE.clear()
+
+
 def load_quality_weights(config_manager=None) -> Dict[str, float]:
     """
     Load quality scoring weights from config.
     
+    Without a config_manager the result is cached for the process.
+    
     Args:
         config_manager: Optional ConfigManager instance (creates one if not provided)
     
@@ -37,8 +68,12 @@ def load_quality_weights(config_manager=None) -> Dict[str, float]:
         'outliers': 0.05
     }
     
+    use_default_config = config_manager is None
+    if use_default_config and 'weights' in _QUALITY_CONFIG_CACHE:
+        return _QUALITY_CONFIG_CACHE['weights'].copy()
+    
     try:
-        if config_manager is None:
+        if use_default_config:
             from config import ConfigManager
             config_manager = ConfigManager()
         
@@ -48,16 +83,20 @@ def load_quality_weights(config_manager=None) -> Dict[str, float]:
         # Merge with defaults (use defaults if not specified)
         result = default_weights.copy()
         result.update(weights)
-        
-        return result
     except Exception:
-        return default_weights
+        result = default_weights
+    
+    if use_default_config:
+        _QUALITY_CONFIG_CACHE['weights'] = result.copy()
+    return result
 
 
 def load_quality_thresholds(config_manager=None) -> Dict[str, Any]:
     """
     Load quality thresholds from config.
     
+    Without a config_manager the result is cached for the process.
+    
     Args:
         config_manager: Optional ConfigManager instance (creates one if not provided)
     
@@ -73,8 +112,12 @@ def load_quality_thresholds(config_manager=None) -> Dict[str, Any]:
         'warning_threshold': 70
     }
     
+    use_default_config = config_manager is None
+    if use_default_config and 'thresholds' in _QUALITY_CONFIG_CACHE:
+        return _QUALITY_CONFIG_CACHE['thresholds'].copy()
+    
     try:
-        if config_manager is None:
+        if use_default_config:
             from config import ConfigManager
             config_manager = ConfigManager()
         
@@ -84,10 +127,202 @@ def load_quality_thresholds(config_manager=None) -> Dict[str, Any]:
         # Merge with defaults
         result = default_thresholds.copy()
         result.update(thresholds)
+    except Exception:
+        result = default_thresholds
+    
+    if use_default_config:
+        _QUALITY_CONFIG_CACHE['thresholds'] = result.copy()
+    return result
+
+
+@dataclass(frozen=True)
+class OHLCVArrays:
+    """OHLCV columns as contiguous float arrays in chronological order, extracted once per frame."""
+    index: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dtype: type = np.float64) -> Optional['OHLCVArrays']:
+        """
+        Extract the columns of df, or None if it is empty or lacks an OHLCV column.
         
-        return result
+        float32 halves the memory the scans read; columns already stored as
+        float32 (see fetch_historical's precision option) are then not copied.
+        """
+        if df.empty or not all(col in df.columns for col in OHLCV_COLUMNS):
+            return None
+        if not df.index.is_monotonic_increasing:
+            df = df.sort_index()
+        return cls(df.index.values,
+                   *(np.ascontiguousarray(df[col].to_numpy(dtype=dtype)) for col in OHLCV_COLUMNS))
+    
+    def stack(self, columns: List[str]) -> np.ndarray:
+        """2D array with one column per name, for per-column statistics."""
+        return np.column_stack([getattr(self, col) for col in columns])
+
+
+@dataclass(frozen=True)
+class OHLCVScan:
+    """Per-candle counts shared by the integrity, volume and consistency scores."""
+    total_count: int
+    invalid_count: int
+    zero_volume_count: int
+    consistent_count: int
+    total_transitions: int
+
+
+def _scan_ohlcv_loop(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     volume: np.ndarray, tolerance: float) -> Tuple[int, int, int]:
+    """
+    Single-loop version of the scan, compiled with numba when it is installed.
+    
+    Returns:
+        Tuple of (invalid_count, zero_volume_count, consistent_count)
+    """
+    invalid_count = 0
+    zero_volume_count = 0
+    consistent_count = 0
+    for i in range(len(close)):
+        o = open_[i]
+        h = high[i]
+        l = low[i]
+        c = close[i]
+        v = volume[i]
+        if (o <= 0 or h <= 0 or l <= 0 or c <= 0 or v < 0
+                or h < l or h < o or h < c or l > o or l > c):
+            invalid_count += 1
+        if v == 0:
+            zero_volume_count += 1
+        if i > 0:
+            prev_close = close[i - 1]
+            if prev_close > 0 and not np.isnan(o) and abs(o - prev_close) / prev_close <= tolerance:
+                consistent_count += 1
+    return invalid_count, zero_volume_count, consistent_count
+
+
+if HAS_NUMBA:
+    # No fastmath: the NaN checks must keep IEEE semantics. nogil lets
+    # assess_data_quality_many's threads scan in parallel.
+    _scan_ohlcv_loop = njit(cache=True, nogil=True)(_scan_ohlcv_loop)
+    
+    # Compile (or load from numba's disk cache) the float64 version at import
+    # so the first assessment in a process does not pay for it. If numba
+    # cannot compile it, use the numpy scan instead.
+    try:
+        _scan_ohlcv_loop(*(np.zeros(2) for _ in OHLCV_COLUMNS), 0.01)
     except Exception:
-        return default_thresholds
+        HAS_NUMBA = False
+
+
+def _scan_ohlcv(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                volume: np.ndarray, tolerance: float) -> OHLCVScan:
+    """
+    Count invalid candles, zero volumes and consistent transitions in one place.
+    
+    Gives the same counts as validate_ohlcv_integrity, validate_volume and
+    validate_cross_candle_consistency, but reads each column once instead of
+    once per validator. The arrays must be in chronological order. Uses the
+    compiled loop when numba is available and numpy expressions otherwise.
+    """
+    if HAS_NUMBA:
+        invalid_count, zero_volume_count, consistent_count = _scan_ohlcv_loop(
+            np.ascontiguousarray(open_), np.ascontiguousarray(high), np.ascontiguousarray(low),
+            np.ascontiguousarray(close), np.ascontiguousarray(volume), float(tolerance))
+    else:
+        invalid = (open_ <= 0) | (high <= 0) | (low <= 0) | (close <= 0) | (volume < 0)
+        invalid |= (high < low) | (high < open_) | (high < close) | (low > open_) | (low > close)
+        
+        # Next open vs previous close; NaNs and non-positive closes are skipped
+        prev_close = close[:-1]
+        curr_open = open_[1:]
+        checked = (prev_close > 0) & ~np.isnan(curr_open)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            consistent = checked & (np.abs(curr_open - prev_close) / prev_close <= tolerance)
+        
+        invalid_count = np.count_nonzero(invalid)
+        zero_volume_count = np.count_nonzero(volume == 0)
+        consistent_count = np.count_nonzero(consistent)
+    
+    return OHLCVScan(
+        total_count=len(close),
+        invalid_count=int(invalid_count),
+        zero_volume_count=int(zero_volume_count),
+        consistent_count=int(consistent_count),
+        total_transitions=max(len(close) - 1, 0)
+    )
+
+
+def scan_ohlcv(df: pd.DataFrame, thresholds: Dict[str, Any],
+               arrays: Optional[OHLCVArrays] = None) -> Optional[OHLCVScan]:
+    """
+    Run the fused per-candle scan over a DataFrame.
+    
+    Args:
+        df: DataFrame with datetime index and OHLCV columns
+        thresholds: Dictionary with consistency_tolerance
+        arrays: Columns already extracted from df (extracted here if None)
+    
+    Returns:
+        OHLCVScan, or None if the frame is empty or lacks an OHLCV column
+    """
+    if arrays is None:
+        arrays = OHLCVArrays.from_frame(df)
+        if arrays is None:
+            return None
+    return _scan_ohlcv(arrays.open, arrays.high, arrays.low, arrays.close, arrays.volume,
+                       thresholds.get('consistency_tolerance', 0.01))
+
+
+def _count_iqr_outliers(values: np.ndarray, index: np.ndarray, multiplier: float) -> int:
+    """
+    Number of candles detect_outliers(method='iqr') would return, without building the list.
+    
+    Quartiles of all columns come from one np.quantile call (a partial sort)
+    and the outlier rows from one vectorized mask.
+    
+    Args:
+        values: 2D array with one column per checked OHLCV column
+        index: Timestamps of the rows (duplicates count once, as in detect_outliers)
+        multiplier: IQR multiplier
+    """
+    if len(values) < 4 or values.shape[1] == 0:  # Need at least 4 points for IQR
+        return 0
+    
+    quantile = np.nanquantile if np.isnan(values).any() else np.quantile
+    q1, q3 = quantile(values, [0.25, 0.75], axis=0)
+    iqr = q3 - q1
+    
+    # Columns without variance are skipped
+    outliers = ((values < q1 - multiplier * iqr) | (values > q3 + multiplier * iqr)) & (iqr != 0)
+    rows = outliers.any(axis=1)
+    if not rows.any():
+        return 0
+    return len(np.unique(index[rows]))
+
+
+def _outlier_values(df: pd.DataFrame, columns: List[str],
+                    arrays: Optional[OHLCVArrays]) -> Tuple[np.ndarray, np.ndarray]:
+    """(values, index) for _count_iqr_outliers, from arrays when available."""
+    if arrays is not None:
+        return arrays.stack(columns), arrays.index
+    columns = [col for col in columns if col in df.columns]
+    return df[columns].to_numpy(dtype=np.float64), df.index.values
+
+
+def _align_tz(ts: Any, tz: Any) -> Any:
+    """
+    Match a Timestamp's timezone awareness to a DataFrame index timezone.
+    
+    Naive timestamps are localized to tz, aware ones made naive when tz is
+    None; anything else (including already matching timestamps) is returned as is.
+    """
+    if not isinstance(ts, pd.Timestamp) or (ts.tz is None) == (tz is None):
+        return ts
+    return ts.tz_localize(tz)
 
 
 def calculate_coverage_score(df: pd.DataFrame, timeframe: str,
@@ -114,17 +349,8 @@ def calculate_coverage_score(df: pd.DataFrame, timeframe: str,
         end_date = df.index.max()
     
     # Ensure timezone awareness matches
-    if isinstance(start_date, pd.Timestamp):
-        if df.index.tz is not None and start_date.tz is None:
-            start_date = start_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and start_date.tz is not None:
-            start_date = start_date.tz_localize(None)
-    
-    if isinstance(end_date, pd.Timestamp):
-        if df.index.tz is not None and end_date.tz is None:
-            end_date = end_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and end_date.tz is not None:
-            end_date = end_date.tz_localize(None)
+    start_date = _align_tz(start_date, df.index.tz)
+    end_date = _align_tz(end_date, df.index.tz)
     
     timeframe_delta = get_timeframe_delta(timeframe)
     expected_interval = timeframe_delta.total_seconds()
@@ -135,9 +361,12 @@ def calculate_coverage_score(df: pd.DataFrame, timeframe: str,
     if expected_count <= 0:
         return 0.0
     
-    # Filter data to date range
-    df_filtered = df[(df.index >= start_date) & (df.index <= end_date)]
-    actual_count = len(df_filtered)
+    # Count candles in the date range (binary search on a sorted index, no copy)
+    if df.index.is_monotonic_increasing:
+        actual_count = int(df.index.searchsorted(end_date, side='right')
+                           - df.index.searchsorted(start_date, side='left'))
+    else:
+        actual_count = int(((df.index >= start_date) & (df.index <= end_date)).sum())
     
     coverage_score = (actual_count / expected_count) * 100
     
@@ -158,23 +387,17 @@ def calculate_gaps_score(df: pd.DataFrame, timeframe: str,
     Returns:
         Gaps score (0-100)
     """
-    gaps = detect_gaps(df, timeframe)
-    
-    if not gaps:
-        return 100.0
-    
     small_gap_penalty = thresholds.get('gap_penalty_small', 0.5)
     large_gap_penalty = thresholds.get('gap_penalty_large', 1.0)
     
-    small_gap_count = 0
-    large_gap_count = 0
+    # Gaps cannot cost anything, skip detecting them
+    if small_gap_penalty == 0 and large_gap_penalty == 0:
+        return 100.0
+    
+    small_gap_count, large_gap_count = count_gaps(df, timeframe)
     
-    for gap in gaps:
-        duration_hours = gap['duration_seconds'] / 3600
-        if duration_hours >= 24:
-            large_gap_count += 1
-        else:
-            small_gap_count += 1
+    if small_gap_count == 0 and large_gap_count == 0:
+        return 100.0
     
     penalty = (small_gap_count * small_gap_penalty) + (large_gap_count * large_gap_penalty)
     gaps_score = max(0.0, 100.0 - penalty)
@@ -182,12 +405,13 @@ def calculate_gaps_score(df: pd.DataFrame, timeframe: str,
     return gaps_score
 
 
-def calculate_integrity_score(df: pd.DataFrame) -> float:
+def calculate_integrity_score(df: pd.DataFrame, scan: Optional[OHLCVScan] = None) -> float:
     """
     Calculate integrity score: percentage of candles with valid OHLCV relationships.
     
     Args:
         df: DataFrame with datetime index and OHLCV columns
+        scan: Precomputed scan_ohlcv result (validates df if None)
     
     Returns:
         Integrity score (0-100)
@@ -195,9 +419,13 @@ def calculate_integrity_score(df: pd.DataFrame) -> float:
     if df.empty:
         return 0.0
     
-    integrity_result = validate_ohlcv_integrity(df)
-    valid_count = integrity_result['valid_count']
-    invalid_count = integrity_result['invalid_count']
+    if scan is not None:
+        invalid_count = scan.invalid_count
+        valid_count = scan.total_count - invalid_count
+    else:
+        integrity_result = validate_ohlcv_integrity(df)
+        valid_count = integrity_result.valid_count
+        invalid_count = integrity_result.invalid_count
     total_count = valid_count + invalid_count
     
     if total_count == 0:
@@ -208,13 +436,17 @@ def calculate_integrity_score(df: pd.DataFrame) -> float:
     return integrity_score
 
 
-def calculate_volume_score(df: pd.DataFrame, thresholds: Dict[str, Any]) -> float:
+def calculate_volume_score(df: pd.DataFrame, thresholds: Dict[str, Any],
+                           scan: Optional[OHLCVScan] = None,
+                           arrays: Optional[OHLCVArrays] = None) -> float:
     """
     Calculate volume score: percentage of candles with reasonable volume.
     
     Args:
         df: DataFrame with datetime index and 'volume' column
         thresholds: Dictionary with outlier configuration
+        scan: Precomputed scan_ohlcv result (validates df if None)
+        arrays: Columns already extracted from df
     
     Returns:
         Volume score (0-100)
@@ -222,10 +454,14 @@ def calculate_volume_score(df: pd.DataFrame, thresholds: Dict[str, Any]) -> floa
     if df.empty or 'volume' not in df.columns:
         return 0.0
     
-    volume_result = validate_volume(df)
     total_count = len(df)
-    zero_volume_count = volume_result['zero_volume_count']
-    outlier_count = volume_result['outlier_count']
+    if scan is not None:
+        zero_volume_count = scan.zero_volume_count
+        outlier_count = _count_iqr_outliers(*_outlier_values(df, ['volume'], arrays), 1.5)
+    else:
+        volume_result = validate_volume(df)
+        zero_volume_count = volume_result['zero_volume_count']
+        outlier_count = volume_result['outlier_count']
     
     # Count valid volume candles (non-zero, non-outlier)
     valid_volume_count = total_count - zero_volume_count - outlier_count
@@ -243,58 +479,62 @@ def calculate_volume_score(df: pd.DataFrame, thresholds: Dict[str, Any]) -> floa
     return volume_score
 
 
-def calculate_consistency_score(df: pd.DataFrame, thresholds: Dict[str, Any]) -> float:
+def calculate_consistency_score(df: pd.DataFrame, thresholds: Dict[str, Any],
+                                scan: Optional[OHLCVScan] = None) -> float:
     """
     Calculate consistency score: percentage of smooth cross-candle transitions.
     
     Args:
         df: DataFrame with datetime index and OHLCV columns
         thresholds: Dictionary with consistency_tolerance
+        scan: Precomputed scan_ohlcv result (validates df if None)
     
     Returns:
         Consistency score (0-100)
     """
-    if df.empty or len(df) < 2:
+    if len(df.index) < 2 or df.columns.empty:
         return 100.0  # Single candle or empty is considered consistent
     
-    tolerance = thresholds.get('consistency_tolerance', 0.01)
-    consistency_result = validate_cross_candle_consistency(df, tolerance=tolerance)
-    
-    total_transitions = consistency_result['total_transitions']
+    if scan is not None:
+        total_transitions = scan.total_transitions
+        consistent_count = scan.consistent_count
+    else:
+        tolerance = thresholds.get('consistency_tolerance', 0.01)
+        consistency_result = validate_cross_candle_consistency(df, tolerance=tolerance)
+        total_transitions = consistency_result['total_transitions']
+        consistent_count = consistency_result['consistent_count']
     
     if total_transitions == 0:
         return 100.0
     
-    consistent_count = consistency_result['consistent_count']
     consistency_score = (consistent_count / total_transitions) * 100
     
     return consistency_score
 
 
-def calculate_outliers_score(df: pd.DataFrame, thresholds: Dict[str, Any]) -> float:
+def calculate_outliers_score(df: pd.DataFrame, thresholds: Dict[str, Any],
+                             arrays: Optional[OHLCVArrays] = None) -> float:
     """
     Calculate outliers score: inverse of outlier count.
     
     Args:
         df: DataFrame with datetime index
         thresholds: Dictionary with outlier_iqr_multiplier and outlier_penalty
+        arrays: Columns already extracted from df
     
     Returns:
         Outliers score (0-100)
     """
-    if df.empty:
+    # Penalty per outlier
+    penalty = thresholds.get('outlier_penalty', 0.1)
+    
+    # Empty, too short for IQR, or outliers cost nothing: skip detection
+    if len(df) < 4 or penalty == 0:
         return 100.0
     
     multiplier = thresholds.get('outlier_iqr_multiplier', 1.5)
-    outlier_indices = detect_outliers(df, method='iqr', multiplier=multiplier)
-    outlier_count = len(outlier_indices)
-    
-    total_count = len(df)
-    if total_count == 0:
-        return 100.0
+    outlier_count = _count_iqr_outliers(*_outlier_values(df, OHLCV_COLUMNS, arrays), multiplier)
     
-    # Penalty per outlier
-    penalty = thresholds.get('outlier_penalty', 0.1)
     outliers_score = max(0.0, 100.0 - (outlier_count * penalty))
     
     return outliers_score
@@ -327,17 +567,8 @@ def calculate_completeness_score(df: pd.DataFrame, timeframe: str,
         expected_end_date = actual_end
     
     # Ensure timezone awareness matches
-    if isinstance(expected_start_date, pd.Timestamp):
-        if df.index.tz is not None and expected_start_date.tz is None:
-            expected_start_date = expected_start_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and expected_start_date.tz is not None:
-            expected_start_date = expected_start_date.tz_localize(None)
-    
-    if isinstance(expected_end_date, pd.Timestamp):
-        if df.index.tz is not None and expected_end_date.tz is None:
-            expected_end_date = expected_end_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and expected_end_date.tz is not None:
-            expected_end_date = expected_end_date.tz_localize(None)
+    expected_start_date = _align_tz(expected_start_date, df.index.tz)
+    expected_end_date = _align_tz(expected_end_date, df.index.tz)
     
     # Calculate coverage for start and end
     timeframe_delta = get_timeframe_delta(timeframe)
@@ -373,7 +604,8 @@ def calculate_component_scores(df: pd.DataFrame, timeframe: str,
                               start_date: Optional[pd.Timestamp] = None,
                               end_date: Optional[pd.Timestamp] = None,
                               weights: Optional[Dict[str, float]] = None,
-                              thresholds: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                              thresholds: Optional[Dict[str, Any]] = None,
+                              precision: str = 'float64') -> Dict[str, Any]:
     """
     Calculate all component quality scores.
     
@@ -384,40 +616,39 @@ def calculate_component_scores(df: pd.DataFrame, timeframe: str,
         end_date: Expected end date
         weights: Component weights dictionary (loads from config if None)
         thresholds: Quality thresholds dictionary (loads from config if None)
+        precision: 'float64' or 'float32' for the OHLCV scans; float32 reads half
+                   the memory and only differs for prices within float32 rounding
     
     Returns:
         Dictionary with all component scores
     """
+    if precision not in _PRECISION_DTYPES:
+        raise ValueError(f"precision must be one of {list(_PRECISION_DTYPES)}, got {precision!r}")
+    
     if weights is None:
         weights = load_quality_weights()
     if thresholds is None:
         thresholds = load_quality_thresholds()
     
-    # Parse dates if strings
+    # Parse dates if strings (matching the dataframe's timezone)
     if isinstance(start_date, str):
-        start_date = pd.to_datetime(start_date)
-        # Match timezone to dataframe
-        if df.index.tz is not None and start_date.tz is None:
-            start_date = start_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and start_date.tz is not None:
-            start_date = start_date.tz_localize(None)
-    
+        start_date = _align_tz(pd.to_datetime(start_date), df.index.tz)
     if isinstance(end_date, str):
-        end_date = pd.to_datetime(end_date)
-        # Match timezone to dataframe
-        if df.index.tz is not None and end_date.tz is None:
-            end_date = end_date.tz_localize(df.index.tz)
-        elif df.index.tz is None and end_date.tz is not None:
-            end_date = end_date.tz_localize(None)
+        end_date = _align_tz(pd.to_datetime(end_date), df.index.tz)
+    
+    # Extract the OHLCV columns once; integrity, volume and consistency
+    # then share one pass over them
+    arrays = OHLCVArrays.from_frame(df, _PRECISION_DTYPES[precision])
+    scan = scan_ohlcv(df, thresholds, arrays)
     
     # Calculate all component scores
     scores = {
         'coverage': calculate_coverage_score(df, timeframe, start_date, end_date),
         'gaps': calculate_gaps_score(df, timeframe, thresholds),
-        'integrity': calculate_integrity_score(df),
-        'volume': calculate_volume_score(df, thresholds),
-        'consistency': calculate_consistency_score(df, thresholds),
-        'outliers': calculate_outliers_score(df, thresholds),
+        'integrity': calculate_integrity_score(df, scan),
+        'volume': calculate_volume_score(df, thresholds, scan, arrays),
+        'consistency': calculate_consistency_score(df, thresholds, scan),
+        'outliers': calculate_outliers_score(df, thresholds, arrays),
         'completeness': calculate_completeness_score(df, timeframe, start_date, end_date)
     }
     
@@ -440,23 +671,16 @@ def calculate_composite_score(component_scores: Dict[str, float],
         weights = load_quality_weights()
     
     # Calculate weighted average
-    composite = sum(component_scores.get(comp, 0) * weights.get(comp, 0)
-                   for comp in weights.keys())
+    composite = sum(component_scores.get(comp, 0) * weight for comp, weight in weights.items())
     
     # Normalize by sum of weights (in case they don't sum to 1.0)
     weight_sum = sum(weights.values())
     if weight_sum > 0:
         composite = composite / weight_sum
     
-    # Determine grade
-    if composite >= 90:
-        grade = 'A'
-    elif composite >= 80:
-        grade = 'B'
-    elif composite >= 70:
-        grade = 'C'
-    elif composite >= 60:
-        grade = 'D'
+    # Determine grade: binary search over the thresholds (NaN fails the first test)
+    if composite >= _GRADE_THRESHOLDS[0]:
+        grade = _GRADES[bisect_right(_GRADE_THRESHOLDS, composite)]
     else:
         grade = 'F'
     
@@ -468,7 +692,8 @@ def calculate_composite_score(component_scores: Dict[str, float],
 
 def assess_data_quality(symbol: str, timeframe: str,
                        start_date: Optional[pd.Timestamp] = None,
-                       end_date: Optional[pd.Timestamp] = None) -> Dict[str, Any]:
+                       end_date: Optional[pd.Timestamp] = None,
+                       precision: str = 'float64') -> Dict[str, Any]:
     """
     Complete data quality assessment pipeline.
     
@@ -477,6 +702,7 @@ def assess_data_quality(symbol: str, timeframe: str,
         timeframe: Data granularity (e.g., '1h', '1d')
         start_date: Expected start date
         end_date: Expected end date
+        precision: Float precision of the OHLCV scans ('float64' or 'float32')
     
     Returns:
         Complete assessment dictionary with component scores, composite score, and grade
@@ -507,11 +733,14 @@ def assess_data_quality(symbol: str, timeframe: str,
     if end_date is None:
         end_date = df.index.max()
     
-    # Calculate component scores
-    component_scores = calculate_component_scores(df, timeframe, start_date, end_date)
+    # Calculate component scores (weights/thresholds resolved once for both steps)
+    weights = load_quality_weights()
+    component_scores = calculate_component_scores(df, timeframe, start_date, end_date,
+                                                  weights=weights, thresholds=load_quality_thresholds(),
+                                                  precision=precision)
     
     # Calculate composite score
-    composite_result = calculate_composite_score(component_scores)
+    composite_result = calculate_composite_score(component_scores, weights)
     
     # Round component scores
     rounded_scores = {k: round(v, 2) for k, v in component_scores.items()}
@@ -524,3 +753,35 @@ def assess_data_quality(symbol: str, timeframe: str,
         'assessment_date': datetime.utcnow().isoformat() + 'Z'
     }
 
+
+def assess_data_quality_many(datasets: List[Tuple[str, str]], precision: str = 'float64',
+                             max_workers: int = 4) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """
+    Assess several cached datasets concurrently.
+    
+    Each dataset is an independent assess_data_quality call (dates from the
+    manifest). The column scans are numpy (or nogil numba) code that releases
+    the GIL, so threads overlap the numeric work as well as the cache reads.
+    
+    Args:
+        datasets: (symbol, timeframe) pairs, e.g. [('BTC/USD', '1h'), ('ETH/USD', '1h')]
+        precision: Float precision of the OHLCV scans ('float64' or 'float32')
+        max_workers: Maximum concurrent assessments
+    
+    Returns:
+        Dict mapping (symbol, timeframe) to its assessment dictionary, in input order
+    """
+    if not datasets:
+        return {}
+    
+    # Resolve the config once instead of racing to fill the cache from every thread
+    load_quality_weights()
+    load_quality_thresholds()
+    
+    def assess(dataset: Tuple[str, str]) -> Dict[str, Any]:
+        symbol, timeframe = dataset
+        return assess_data_quality(symbol, timeframe, precision=precision)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(datasets)))) as executor:
+        results = list(executor.map(assess, datasets))
+    return {tuple(dataset): result for dataset, result in zip(datasets, results)}
@@ -5,16 +5,30 @@ This module coordinates fetching new data and updating caches
 with validation and manifest updates.
 """
 
+import logging
 import pandas as pd
-from typing import Tuple, Optional
+from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timedelta
 
 from backtester.data.fetcher import create_exchange, fetch_from_date, MarketNotFoundError, FetchError
 from backtester.data.cache_manager import (
     read_cache, write_cache, get_last_cached_timestamp, 
-    update_manifest, cache_exists, get_manifest_entry
+    update_manifest, cache_exists, get_cached_manifest_entry
 )
-from backtester.data.validator import remove_duplicates, validate_data
+from backtester.data.validator import remove_duplicates, validate_data, validate_data_incremental
+
+logger = logging.getLogger(__name__)
+
+# New candles per (symbol, timeframe) waiting for flush_update
+_pending: Dict[Tuple[str, str], List[pd.DataFrame]] = {}
+
+# Cached rows before each delta included in its incremental validation
+_VALIDATION_TAIL_ROWS = 3
+
+# Serializes cache writes: every market shares the manifest file
+_WRITE_LOCK = Lock()
 
 
 def needs_update(symbol: str, timeframe: str, target_end_date: Optional[str] = None) -> Tuple[bool, Optional[pd.Timestamp]]:
@@ -83,22 +97,42 @@ def fetch_delta(exchange_name: str, symbol: str, timeframe: str,
     return fetch_from_date(exchange, symbol, timeframe, from_timestamp, target_end_date)
 
 
-def apply_update(symbol: str, timeframe: str, new_data: pd.DataFrame, 
-                validate: bool = True, source_exchange: Optional[str] = None) -> dict:
+def stage_update(symbol: str, timeframe: str, new_data: pd.DataFrame) -> None:
     """
-    Apply delta update to cache with validation.
+    Stage new candles for symbol/timeframe until the next flush_update.
     
     Args:
         symbol: Trading pair (e.g., 'BTC/USD')
         timeframe: Data granularity (e.g., '1h', '1d')
         new_data: DataFrame with new OHLCV data
+    """
+    if not new_data.empty:
+        _pending.setdefault((symbol, timeframe), []).append(new_data)
+
+
+def flush_update(symbol: str, timeframe: str, validate: bool = True,
+                 source_exchange: Optional[str] = None, manifest_entry: Optional[dict] = None,
+                 deep_validate: bool = False) -> dict:
+    """
+    Merge all staged candles into the cache with validation.
+    
+    The cache is read once and combined with every staged chunk in a single
+    concat, so staging several chunks copies the history only once.
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
         validate: Whether to validate data before saving
         source_exchange: Exchange name from which data was fetched (optional)
+        manifest_entry: Manifest entry already looked up by the caller (optional)
+        deep_validate: Validate the whole merged history instead of only the new
+            candles and the boundary with the cache
     
     Returns:
         Dictionary with update results
     """
-    if new_data.empty:
+    frames = _pending.pop((symbol, timeframe), [])
+    if not frames:
         return {
             'status': 'no_new_data',
             'candles_added': 0,
@@ -107,11 +141,13 @@ def apply_update(symbol: str, timeframe: str, new_data: pd.DataFrame,
     
     # If source_exchange not provided, try to get from manifest
     if source_exchange is None:
-        manifest_entry = get_manifest_entry(symbol, timeframe)
+        if manifest_entry is None:
+            manifest_entry = get_cached_manifest_entry(symbol, timeframe)
         if manifest_entry and 'source_exchange' in manifest_entry:
             source_exchange = manifest_entry['source_exchange']
     
     # Validate new data
+    new_data = frames[0] if len(frames) == 1 else pd.concat(frames, sort=False)
     validation_result = validate_data(new_data, timeframe) if validate else {'valid': True}
     
     warnings = []
@@ -120,25 +156,37 @@ def apply_update(symbol: str, timeframe: str, new_data: pd.DataFrame,
     
     # Read existing cache
     existing_data = read_cache(symbol, timeframe)
+    if not existing_data.empty:
+        frames.insert(0, existing_data)
     
-    if existing_data.empty:
+    fast_path = False
+    if len(frames) == 1:
         # No existing data, just write new data
         combined_data = new_data
+    elif (not existing_data.empty and new_data.index.is_monotonic_increasing and new_data.index.is_unique
+          and new_data.index[0] > existing_data.index.max()):
+        # Pure append: the concat is already sorted and free of duplicates
+        combined_data = pd.concat(frames, sort=False)
+        fast_path = True
     else:
-        # Combine existing and new data
-        combined_data = pd.concat([existing_data, new_data])
+        # Combine existing and new data in one pass
+        combined_data = pd.concat(frames, sort=False)
         
-        # Remove duplicates (in case of overlap)
+        # Remove duplicates (in case of overlap), keeping the newest candles in sorted order
         combined_data, duplicates_removed = remove_duplicates(combined_data)
         
         if duplicates_removed > 0:
             warnings.append(f"Removed {duplicates_removed} duplicate candles")
-        
-        # Sort by index
-        combined_data = combined_data.sort_index()
     
-    # Validate combined data
-    final_validation = validate_data(combined_data, timeframe) if validate else {}
+    # Validate combined data (only the new candles and the boundary, unless deep_validate)
+    if not validate:
+        final_validation = {}
+    elif deep_validate or existing_data.empty or not existing_data.index.is_monotonic_increasing:
+        final_validation = validate_data(combined_data, timeframe)
+    else:
+        start = existing_data.index.searchsorted(new_data.index.min())
+        existing_tail = existing_data.iloc[max(start - _VALIDATION_TAIL_ROWS, 0):]
+        final_validation = validate_data_incremental(new_data, timeframe, existing_tail)
     
     if final_validation.get('gaps'):
         warnings.append(f"Detected {len(final_validation['gaps'])} gaps in data")
@@ -153,10 +201,37 @@ def apply_update(symbol: str, timeframe: str, new_data: pd.DataFrame,
         'candles_added': candles_added,
         'total_candles': len(combined_data),
         'warnings': warnings,
-        'validation': final_validation
+        'validation': final_validation,
+        'fast_path': fast_path
     }
 
 
+def apply_update(symbol: str, timeframe: str, new_data: pd.DataFrame, 
+                validate: bool = True, source_exchange: Optional[str] = None,
+                manifest_entry: Optional[dict] = None, deep_validate: bool = False) -> dict:
+    """
+    Apply delta update to cache with validation.
+    
+    Equivalent to stage_update followed by flush_update (any candles already
+    staged for this market are flushed too).
+    
+    Args:
+        symbol: Trading pair (e.g., 'BTC/USD')
+        timeframe: Data granularity (e.g., '1h', '1d')
+        new_data: DataFrame with new OHLCV data
+        validate: Whether to validate data before saving
+        source_exchange: Exchange name from which data was fetched (optional)
+        manifest_entry: Manifest entry already looked up by the caller (optional)
+        deep_validate: Validate the whole merged history (see flush_update)
+    
+    Returns:
+        Dictionary with update results
+    """
+    stage_update(symbol, timeframe, new_data)
+    return flush_update(symbol, timeframe, validate=validate, source_exchange=source_exchange,
+                        manifest_entry=manifest_entry, deep_validate=deep_validate)
+
+
 def update_market(exchange_name: str, symbol: str, timeframe: str,
                  target_end_date: Optional[str] = None,
                  force_refresh: bool = False) -> dict:
@@ -176,9 +251,10 @@ def update_market(exchange_name: str, symbol: str, timeframe: str,
     Returns:
         Dictionary with update results
     """
+    logger.info(f"Updating {symbol} {timeframe}...")
     try:
         # Get source_exchange from manifest if available
-        manifest_entry = get_manifest_entry(symbol, timeframe)
+        manifest_entry = get_cached_manifest_entry(symbol, timeframe)
         source_exchange = None
         if manifest_entry and 'source_exchange' in manifest_entry:
             source_exchange = manifest_entry['source_exchange']
@@ -207,6 +283,7 @@ def update_market(exchange_name: str, symbol: str, timeframe: str,
             needs_update_flag, last_timestamp = needs_update(symbol, timeframe, target_end_date)
             
             if not needs_update_flag:
+                logger.info(f"{symbol} {timeframe} is up to date")
                 return {
                     'status': 'up_to_date',
                     'candles_added': 0,
@@ -230,28 +307,67 @@ def update_market(exchange_name: str, symbol: str, timeframe: str,
             )
         
         # Apply update with source_exchange
-        update_result = apply_update(symbol, timeframe, new_data, validate=True, source_exchange=source_exchange)
+        stage_update(symbol, timeframe, new_data)
+        with _WRITE_LOCK:
+            update_result = flush_update(symbol, timeframe, validate=True, source_exchange=source_exchange,
+                                         manifest_entry=manifest_entry)
         update_result['api_requests'] = api_requests
         update_result['source_exchange'] = source_exchange
+        logger.info(f"Updated {symbol} {timeframe}: {update_result['status']}, "
+                    f"{update_result['candles_added']} candles added")
         
         return update_result
         
     except MarketNotFoundError as e:
+        logger.warning(f"Update of {symbol} {timeframe} failed: {e}")
         return {
             'status': 'market_not_found',
             'error': str(e),
             'candles_added': 0
         }
     except FetchError as e:
+        logger.warning(f"Update of {symbol} {timeframe} failed: {e}")
         return {
             'status': 'fetch_error',
             'error': str(e),
             'candles_added': 0
         }
     except Exception as e:
+        logger.warning(f"Update of {symbol} {timeframe} failed: {e}")
         return {
             'status': 'error',
             'error': str(e),
             'candles_added': 0
         }
 
+
+def update_markets(exchange_name: str, pairs: List[Tuple[str, str]],
+                   target_end_date: Optional[str] = None,
+                   max_workers: int = 8) -> Dict[Tuple[str, str], dict]:
+    """
+    Update several market/timeframe combinations concurrently.
+    
+    Markets share the exchange instances from create_exchange, and every request
+    waits on the exchange's AdaptiveRateLimiter (spaced by its rateLimit across
+    threads), so the workers overlap network latency and validation without
+    exceeding the exchange's request rate. Cache writes are serialized. Each
+    update_market call logs its own progress as it starts and finishes.
+    
+    Args:
+        exchange_name: Name of exchange to use as fallback (e.g., 'coinbase')
+        pairs: (symbol, timeframe) combinations to update
+        target_end_date: Target end date (YYYY-MM-DD). If None, uses yesterday
+        max_workers: Maximum concurrent market updates
+    
+    Returns:
+        Dict mapping (symbol, timeframe) to the update_market result
+    """
+    if not pairs:
+        return {}
+    
+    def update(pair: Tuple[str, str]) -> dict:
+        return update_market(exchange_name, pair[0], pair[1], target_end_date=target_end_date)
+    
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+        results = list(executor.map(update, pairs))
+    return dict(zip(pairs, results))
@@ -7,14 +7,41 @@ and validate data coverage.
 
 import pandas as pd
 import numpy as np
-from typing import Tuple, List, Dict, Any
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple, List, Dict, Any, Optional
 from datetime import timedelta
 
 
+@dataclass(slots=True, frozen=True)
+class CoverageResult:
+    """Result of validate_coverage."""
+    expected_count: int
+    actual_count: int
+    missing_count: int
+    coverage_pct: float
+    is_valid: bool
+    start_date: str
+    end_date: str
+    actual_start: Optional[str]
+    actual_end: Optional[str]
+
+
+@dataclass(slots=True, frozen=True)
+class IntegrityResult:
+    """Result of validate_ohlcv_integrity."""
+    valid_count: int
+    invalid_count: int
+    issues: List[str]
+
+
+@lru_cache(maxsize=32)
 def get_timeframe_delta(timeframe: str) -> timedelta:
     """
     Convert timeframe string to timedelta.
     
+    Cached: scorers and validators call this repeatedly with the same few timeframes.
+    
     Args:
         timeframe: Timeframe string (e.g., '1m', '5m', '1h', '1d')
     
@@ -65,6 +92,40 @@ def remove_duplicates(df: pd.DataFrame) -> Tuple[pd.DataFrame, int]:
     return df_cleaned, duplicates_removed
 
 
+def _find_gaps(df: pd.DataFrame, timeframe: str) -> Tuple[pd.DatetimeIndex, np.ndarray, np.ndarray]:
+    """
+    Locate gaps between consecutive candles in one vectorized pass.
+    
+    Returns:
+        Tuple of (sorted index, positions i where a gap follows sorted_index[i],
+        gap durations in seconds)
+    """
+    index = df.index if df.index.is_monotonic_increasing else df.index.sort_values()
+    intervals = np.diff(index.values) / np.timedelta64(1, 's')
+    expected_interval = get_timeframe_delta(timeframe).total_seconds()
+    # 50% tolerance for timing variations
+    positions = np.flatnonzero(intervals > expected_interval * 1.5)
+    return index, positions, intervals[positions]
+
+
+def count_gaps(df: pd.DataFrame, timeframe: str) -> Tuple[int, int]:
+    """
+    Count the gaps detect_gaps reports, without building gap dicts.
+    
+    Args:
+        df: DataFrame with datetime index
+        timeframe: Expected timeframe (e.g., '1h', '1d')
+    
+    Returns:
+        Tuple of (small gap count, large gap count); gaps of 24 hours or more are large
+    """
+    if df.empty or len(df) < 2:
+        return 0, 0
+    durations = _find_gaps(df, timeframe)[2]
+    large_gap_count = int(np.count_nonzero(durations / 3600 >= 24))
+    return len(durations) - large_gap_count, large_gap_count
+
+
 def detect_gaps(df: pd.DataFrame, timeframe: str, 
                 tolerance: float = 0.05) -> List[Dict[str, Any]]:
     """
@@ -81,41 +142,26 @@ def detect_gaps(df: pd.DataFrame, timeframe: str,
     if df.empty or len(df) < 2:
         return []
     
-    gaps = []
-    timeframe_delta = get_timeframe_delta(timeframe)
-    
-    # Sort by index
-    df_sorted = df.sort_index()
-    
-    # Calculate expected intervals
-    expected_interval = timeframe_delta.total_seconds()
+    index, positions, durations = _find_gaps(df, timeframe)
+    expected_interval = get_timeframe_delta(timeframe).total_seconds()
     
-    # Find gaps
-    for i in range(len(df_sorted) - 1):
-        current_time = df_sorted.index[i]
-        next_time = df_sorted.index[i + 1]
-        
-        actual_interval = (next_time - current_time).total_seconds()
-        
-        # Check if gap is significantly larger than expected
-        if actual_interval > expected_interval * 1.5:  # 50% tolerance for timing variations
-            expected_candles = int(actual_interval / expected_interval)
-            missing_candles = expected_candles - 1  # -1 because we have the end candle
-            
-            gaps.append({
-                'start': current_time.isoformat(),
-                'end': next_time.isoformat(),
-                'expected_candles': expected_candles,
-                'missing_candles': missing_candles,
-                'duration_seconds': actual_interval
-            })
+    gaps = []
+    for i, actual_interval in zip(positions.tolist(), durations.tolist()):
+        expected_candles = int(actual_interval / expected_interval)
+        gaps.append({
+            'start': index[i].isoformat(),
+            'end': index[i + 1].isoformat(),
+            'expected_candles': expected_candles,
+            'missing_candles': expected_candles - 1,  # -1 because we have the end candle
+            'duration_seconds': actual_interval
+        })
     
     return gaps
 
 
 def validate_coverage(df: pd.DataFrame, timeframe: str, 
                      start_date: pd.Timestamp, end_date: pd.Timestamp,
-                     tolerance: float = 0.05) -> Dict[str, Any]:
+                     tolerance: float = 0.05) -> CoverageResult:
     """
     Validate data coverage for a date range.
     
@@ -127,7 +173,7 @@ def validate_coverage(df: pd.DataFrame, timeframe: str,
         tolerance: Acceptable percentage of missing data (0.05 = 5%)
     
     Returns:
-        Validation results dictionary
+        CoverageResult with expected/actual counts and the covered range
     """
     timeframe_delta = get_timeframe_delta(timeframe)
     
@@ -146,20 +192,20 @@ def validate_coverage(df: pd.DataFrame, timeframe: str,
     # Check if coverage meets tolerance
     is_valid = coverage_pct >= (1.0 - tolerance)
     
-    return {
-        'expected_count': expected_count,
-        'actual_count': actual_count,
-        'missing_count': expected_count - actual_count,
-        'coverage_pct': coverage_pct,
-        'is_valid': is_valid,
-        'start_date': start_date.isoformat(),
-        'end_date': end_date.isoformat(),
-        'actual_start': df_filtered.index.min().isoformat() if not df_filtered.empty else None,
-        'actual_end': df_filtered.index.max().isoformat() if not df_filtered.empty else None
-    }
+    return CoverageResult(
+        expected_count=expected_count,
+        actual_count=actual_count,
+        missing_count=expected_count - actual_count,
+        coverage_pct=coverage_pct,
+        is_valid=is_valid,
+        start_date=start_date.isoformat(),
+        end_date=end_date.isoformat(),
+        actual_start=df_filtered.index.min().isoformat() if not df_filtered.empty else None,
+        actual_end=df_filtered.index.max().isoformat() if not df_filtered.empty else None
+    )
 
 
-def validate_ohlcv_integrity(df: pd.DataFrame) -> Dict[str, Any]:
+def validate_ohlcv_integrity(df: pd.DataFrame) -> IntegrityResult:
     """
     Validate OHLCV price relationships and ensure all prices are positive.
     
@@ -167,22 +213,14 @@ def validate_ohlcv_integrity(df: pd.DataFrame) -> Dict[str, Any]:
         df: DataFrame with datetime index and OHLCV columns (open, high, low, close, volume)
     
     Returns:
-        Dictionary with valid_count, invalid_count, and issues list
+        IntegrityResult with valid_count, invalid_count, and issues list
     """
     if df.empty:
-        return {
-            'valid_count': 0,
-            'invalid_count': 0,
-            'issues': []
-        }
+        return IntegrityResult(valid_count=0, invalid_count=0, issues=[])
     
     required_cols = ['open', 'high', 'low', 'close', 'volume']
     if not all(col in df.columns for col in required_cols):
-        return {
-            'valid_count': 0,
-            'invalid_count': len(df),
-            'issues': ['Missing required OHLCV columns']
-        }
+        return IntegrityResult(valid_count=0, invalid_count=len(df), issues=['Missing required OHLCV columns'])
     
     issues = []
     invalid_mask = pd.Series(False, index=df.index)
@@ -232,11 +270,7 @@ def validate_ohlcv_integrity(df: pd.DataFrame) -> Dict[str, Any]:
     valid_count = (~invalid_mask).sum()
     invalid_count = invalid_mask.sum()
     
-    return {
-        'valid_count': int(valid_count),
-        'invalid_count': int(invalid_count),
-        'issues': issues
-    }
+    return IntegrityResult(valid_count=int(valid_count), invalid_count=int(invalid_count), issues=issues)
 
 
 def detect_outliers(df: pd.DataFrame, method: str = 'iqr', multiplier: float = 1.5,
@@ -345,27 +379,21 @@ def validate_cross_candle_consistency(df: pd.DataFrame, tolerance: float = 0.01)
         }
     
     # Sort by index to ensure chronological order
-    df_sorted = df.sort_index()
-    
-    consistent_count = 0
-    inconsistent_count = 0
-    
-    # Compare each candle's open to previous candle's close
-    for i in range(1, len(df_sorted)):
-        prev_close = df_sorted.iloc[i - 1]['close']
-        curr_open = df_sorted.iloc[i]['open']
-        
-        # Skip if either value is invalid
-        if pd.isna(prev_close) or pd.isna(curr_open) or prev_close <= 0:
-            continue
-        
-        # Calculate percentage difference
-        price_diff_pct = abs(curr_open - prev_close) / prev_close
-        
-        if price_diff_pct <= tolerance:
-            consistent_count += 1
-        else:
-            inconsistent_count += 1
+    df_sorted = df if df.index.is_monotonic_increasing else df.sort_index()
+    close = df_sorted['close'].to_numpy(dtype=np.float64)
+    open_ = df_sorted['open'].to_numpy(dtype=np.float64)
+    
+    # Compare each candle's open to previous candle's close, skipping
+    # transitions with a missing value or a non-positive close
+    prev_close = close[:-1]
+    curr_open = open_[1:]
+    checked = (prev_close > 0) & ~np.isnan(curr_open)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_diff_pct = np.abs(curr_open - prev_close) / prev_close
+    consistent = checked & (price_diff_pct <= tolerance)
+    
+    consistent_count = int(np.count_nonzero(consistent))
+    inconsistent_count = int(np.count_nonzero(checked)) - consistent_count
     
     total_transitions = len(df_sorted) - 1
     gap_count = inconsistent_count
@@ -468,3 +496,29 @@ def validate_data(df: pd.DataFrame, timeframe: str) -> Dict[str, Any]:
         'date_range_days': (last_date - first_date).days if candle_count > 1 else 0
     }
 
+
+def validate_data_incremental(new_data: pd.DataFrame, timeframe: str,
+                              existing_tail: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Validate new candles against the end of the existing history.
+    
+    Checks new_data together with existing_tail (the cached rows from just before
+    new_data onwards) and only reports gaps ending inside the new data, so older
+    gaps in the history are not re-scanned on every update.
+    
+    Args:
+        new_data: DataFrame with new OHLCV data
+        timeframe: Expected timeframe (e.g., '1h', '1d')
+        existing_tail: Existing rows around the start of new_data (may be empty)
+    
+    Returns:
+        Validation results dictionary (see validate_data) for the checked window
+    """
+    if existing_tail.empty or new_data.empty:
+        return validate_data(new_data, timeframe)
+    
+    result = validate_data(pd.concat([existing_tail, new_data]), timeframe)
+    new_start = new_data.index.min()
+    result['gaps'] = [gap for gap in result['gaps'] if pd.Timestamp(gap['end']) >= new_start]
+    result['valid'] = not result['gaps']
+    return result
@@ -7,9 +7,13 @@ to enable correlation between code/config changes and performance.
 
 import subprocess
 import hashlib
+import importlib.metadata
+import mmap
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import json
 
 try:
@@ -29,22 +33,31 @@ class ChangeTracker:
             project_root: Project root directory (defaults to git root)
         """
         self.project_root = project_root or self._find_git_root()
+        self._metadata: Optional[Dict[str, Any]] = None
     
     def get_change_metadata(self) -> Dict[str, Any]:
         """
         Get comprehensive change metadata for current execution.
         
+        Computed on the first call and reused afterwards; call invalidate() to
+        pick up later commits or config edits in a long-running process.
+        
         Returns:
             Dictionary with git info, config hashes, dependency versions
         """
-        metadata = {
-            'git': self._get_git_info(),
-            'config': self._get_config_hashes(),
-            'environment': self._get_environment_info(),
-            'dependencies': self._get_dependency_versions()
-        }
+        if self._metadata is None:
+            self._metadata = {
+                'git': self._get_git_info(),
+                'config': self._get_config_hashes(),
+                'environment': self._get_environment_info(),
+                'dependencies': self._get_dependency_versions()
+            }
         
-        return metadata
+        return self._metadata
+    
+    def invalidate(self) -> None:
+        """Drop the cached metadata so the next get_change_metadata call recomputes it."""
+        self._metadata = None
     
     def _find_git_root(self) -> Path:
         """Find git repository root."""
@@ -58,37 +71,21 @@ class ChangeTracker:
     def _get_git_info(self) -> Dict[str, Any]:
         """Get git commit information."""
         try:
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=1.0
-            )
-            commit_hash = result.stdout.strip() if result.returncode == 0 else None
-            
-            # Get branch name
-            result = subprocess.run(
-                ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
-                cwd=self.project_root,
-                capture_output=True,
-                text=True,
-                timeout=1.0
-            )
-            branch = result.stdout.strip() if result.returncode == 0 else None
-            
-            # Get commit message (first line)
-            if commit_hash:
-                result = subprocess.run(
-                    ['git', 'log', '-1', '--pretty=%s', commit_hash],
-                    cwd=self.project_root,
-                    capture_output=True,
-                    text=True,
-                    timeout=1.0
-                )
-                commit_message = result.stdout.strip() if result.returncode == 0 else None
+            head = self._read_git_head()
+            if head is None:
+                commit_hash, branch, commit_message = self._run_git_head()
             else:
-                commit_message = None
+                commit_hash, branch, commit_message = head
+                if commit_message is None:
+                    # Commit object is packed: ask git for the subject only
+                    result = subprocess.run(
+                        ['git', 'log', '-1', '--pretty=%s', commit_hash],
+                        cwd=self.project_root,
+                        capture_output=True,
+                        text=True,
+                        timeout=1.0
+                    )
+                    commit_message = result.stdout.strip() if result.returncode == 0 else None
             
             # Check for uncommitted changes
             result = subprocess.run(
@@ -113,6 +110,80 @@ class ChangeTracker:
                 'has_uncommitted_changes': False
             }
     
+    def _read_git_head(self) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Read HEAD straight from the .git directory, without running git.
+        
+        Returns:
+            Tuple of (commit_hash, branch, commit_message), or None if .git cannot be read
+            this way (missing, a worktree link file, or no commits yet). commit_message is
+            None when the commit is only stored in a pack file.
+        """
+        git_dir = self.project_root / '.git'
+        try:
+            head = (git_dir / 'HEAD').read_text().strip()
+            if head.startswith('ref: '):
+                ref = head[len('ref: '):]
+                branch = ref[len('refs/heads/'):] if ref.startswith('refs/heads/') else ref
+                commit_hash = self._resolve_git_ref(git_dir, ref)
+            else:
+                # Detached HEAD, reported like `git rev-parse --abbrev-ref HEAD`
+                branch, commit_hash = 'HEAD', head
+            if commit_hash is None:
+                return None
+            return commit_hash, branch, self._read_commit_subject(git_dir, commit_hash)
+        except (OSError, ValueError, zlib.error):
+            return None
+    
+    @staticmethod
+    def _resolve_git_ref(git_dir: Path, ref: str) -> Optional[str]:
+        """Commit hash of a ref from its loose file or packed-refs."""
+        ref_path = git_dir / ref
+        if ref_path.is_file():
+            return ref_path.read_text().strip()
+        packed_refs = git_dir / 'packed-refs'
+        if packed_refs.is_file():
+            for line in packed_refs.read_text().splitlines():
+                commit_hash, _, name = line.partition(' ')
+                if name == ref:
+                    return commit_hash
+        return None
+    
+    @staticmethod
+    def _read_commit_subject(git_dir: Path, commit_hash: str) -> Optional[str]:
+        """Subject of a loose commit object (like `git log --pretty=%s`), or None if packed."""
+        object_path = git_dir / 'objects' / commit_hash[:2] / commit_hash[2:]
+        if not object_path.is_file():
+            return None
+        raw = zlib.decompress(object_path.read_bytes())
+        _, _, message = raw.partition(b'\x00')[2].partition(b'\n\n')
+        subject = message.decode('utf-8', errors='replace').strip().split('\n\n', 1)[0]
+        return ' '.join(line.strip() for line in subject.splitlines())
+    
+    def _run_git_head(self) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """Ask git for (commit_hash, branch, commit_message) when .git cannot be read directly."""
+        result = subprocess.run(
+            ['git', 'log', '-1', '--pretty=%H%n%s'],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            timeout=1.0
+        )
+        commit_hash, commit_message = None, None
+        if result.returncode == 0 and result.stdout.strip():
+            commit_hash, _, commit_message = result.stdout.strip().partition('\n')
+        
+        # Get branch name
+        result = subprocess.run(
+            ['git', 'rev-parse', '--abbrev-ref', 'HEAD'],
+            cwd=self.project_root,
+            capture_output=True,
+            text=True,
+            timeout=1.0
+        )
+        branch = result.stdout.strip() if result.returncode == 0 else None
+        return commit_hash, branch, commit_message or None
+    
     def _get_config_hashes(self) -> Dict[str, str]:
         """Calculate SHA256 hashes of config files."""
         config_dir = self.project_root / 'config'
@@ -130,29 +201,37 @@ class ChangeTracker:
             'debug.yaml'
         ]
         
-        for config_file in config_files:
-            config_path = config_dir / config_file
-            if config_path.exists():
-                try:
-                    with open(config_path, 'rb') as f:
-                        content = f.read()
-                        hashes[config_file] = hashlib.sha256(content).hexdigest()[:16]
-                except Exception:
-                    hashes[config_file] = 'error'
-        
-        # Also hash profile configs
+        # Collect every file first (including profile configs), then hash them concurrently
+        names = [name for name in config_files if (config_dir / name).exists()]
         profiles_dir = config_dir / 'profiles'
         if profiles_dir.exists():
-            for profile_file in profiles_dir.glob('*.yaml'):
-                try:
-                    with open(profile_file, 'rb') as f:
-                        content = f.read()
-                        hashes[f'profiles/{profile_file.name}'] = hashlib.sha256(content).hexdigest()[:16]
-                except Exception:
-                    pass
+            names += [f'profiles/{profile_file.name}' for profile_file in profiles_dir.glob('*.yaml')]
+        if not names:
+            return hashes
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(names))) as executor:
+            digests = executor.map(self._hash_file, [config_dir / name for name in names])
+        
+        for name, digest in zip(names, digests):
+            if digest is not None:
+                hashes[name] = digest
+            elif not name.startswith('profiles/'):
+                hashes[name] = 'error'
         
         return hashes
     
+    @staticmethod
+    def _hash_file(path: Path) -> Optional[str]:
+        """Short SHA256 of a file read through mmap (None if it cannot be read)."""
+        try:
+            with open(path, 'rb') as f:
+                if path.stat().st_size == 0:
+                    return hashlib.sha256(b'').hexdigest()[:16]  # mmap rejects empty files
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    return hashlib.sha256(mapped).hexdigest()[:16]
+        except Exception:
+            return None
+    
     def _get_environment_info(self) -> Dict[str, str]:
         """Get environment information."""
         return {
@@ -162,31 +241,20 @@ class ChangeTracker:
         }
     
     def _get_dependency_versions(self) -> Dict[str, str]:
-        """Get versions of key dependencies."""
+        """Get versions of key dependencies (from package metadata, without importing them)."""
         versions = {}
         
         key_packages = [
             'pandas', 'numpy', 'backtrader', 'scipy',
             'ta', 'ccxt', 'psutil', 'pyyaml'
         ]
+        # Distribution names that differ from the reported package name
+        distributions = {'pyyaml': 'PyYAML'}
         
         for package in key_packages:
             try:
-                if package == 'backtrader':
-                    import backtrader as module
-                    # Backtrader uses different version attribute
-                    versions[package] = getattr(module, '__version__', getattr(module, 'version', 'unknown'))
-                elif package == 'ta':
-                    import ta as module
-                    versions[package] = getattr(module, '__version__', 'unknown')
-                elif package == 'pyyaml':
-                    import yaml as module
-                    versions[package] = getattr(module, '__version__', 'unknown')
-                else:
-                    module = __import__(package)
-                    versions[package] = getattr(module, '__version__', 'unknown')
-            except ImportError:
+                versions[package] = importlib.metadata.version(distributions.get(package, package))
+            except importlib.metadata.PackageNotFoundError:
                 versions[package] = 'not_installed'
         
         return versions
-
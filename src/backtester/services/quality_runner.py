@@ -134,7 +134,7 @@ def assess_dataset_quality(symbol: str, timeframe: str,
             'gap_count': len(gaps),
             'outliers': len(outlier_indices),
             'outlier_sample': outlier_sample,
-            'integrity_issues': integrity_result.get('issues', [])[:10],  # Store sample
+            'integrity_issues': integrity_result.issues[:10],  # Store sample
             'consistency_issues': consistency_result.get('inconsistent_count', 0)
         }
         
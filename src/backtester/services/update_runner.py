@@ -13,7 +13,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Any
 
-from backtester.data.updater import update_market, MarketNotFoundError
+from backtester.data.updater import update_markets, MarketNotFoundError
 from backtester.data.cache_manager import load_manifest, get_manifest_entry, update_manifest, read_cache
 from backtester.data.fetcher import create_exchange
 from backtester.data.market_liveliness import check_market_on_exchange, is_liveliness_stale
@@ -252,16 +252,13 @@ def run_update(target_end_date: str = None) -> Dict[str, Any]:
     total_api_requests = 0
     warnings = []
     
-    # Update each market/timeframe
+    # Update all markets/timeframes concurrently (update_market logs progress), then tally each result
+    results = update_markets(exchange_name, combinations, target_end_date=target_end_date) if combinations else {}
     for i, (symbol, timeframe) in enumerate(combinations, 1):
-        logger.info(f"[{i}/{len(combinations)}] Updating {symbol} {timeframe}...")
+        logger.info(f"[{i}/{len(combinations)}] {symbol} {timeframe}")
         
         try:
-            result = update_market(
-                exchange_name, symbol, timeframe, 
-                target_end_date=target_end_date,
-                force_refresh=False
-            )
+            result = results[(symbol, timeframe)]
             
             status = result.get('status')
             
@@ -117,6 +117,21 @@ class TestWindowGenerator(unittest.TestCase):
         self.assertLessEqual(first_window.in_sample_end, first_window.out_sample_start)
         self.assertLessEqual(first_window.out_sample_end, end or datetime(2022, 1, 1))
     
+    def test_generate_windows_non_ns_index(self):
+        """Test that second-resolution and NaT-containing indexes give the same windows."""
+        start = datetime(2020, 1, 1)
+        end = datetime(2022, 6, 30)
+        utc_data = self.sample_data.tz_localize('UTC')
+        expected = generate_windows(start, end, 180, 90, utc_data)
+        
+        seconds_data = utc_data.set_axis(utc_data.index.as_unit('s'))
+        self.assertEqual(generate_windows(start, end, 180, 90, seconds_data), expected)
+        
+        with_nat = pd.concat([seconds_data, seconds_data.iloc[:1].set_axis(
+            pd.DatetimeIndex([pd.NaT], tz='UTC').as_unit('s'))])
+        self.assertEqual(generate_windows(start, end, 180, 90, with_nat), expected)
+        self.assertEqual(expected[-1].out_sample_end.year, 2021)
+    
     def test_generate_windows_from_period(self):
         """Test window generation from period string."""
         start = datetime(2020, 1, 1)
@@ -134,6 +134,36 @@ class TestChangeTracker(unittest.TestCase):
         except (subprocess.CalledProcessError, FileNotFoundError):
             self.skipTest("Git not available")
     
+    def test_read_git_head_matches_git(self):
+        """Test reading .git directly gives what the git commands report."""
+        def git(*args):
+            return subprocess.run(['git', *args], cwd=self.temp_dir, capture_output=True,
+                                  text=True, check=True).stdout.strip()
+        
+        try:
+            git('init', '-b', 'feature/x')
+            git('config', 'user.email', 'test@example.com')
+            git('config', 'user.name', 'Test User')
+            (self.temp_path / 'test.txt').write_text('test content')
+            git('add', 'test.txt')
+            git('commit', '-m', 'Wrapped\nsubject line\n\nBody text')
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            self.skipTest("Git not available")
+        
+        tracker = ChangeTracker(project_root=self.temp_path)
+        expected = (git('rev-parse', 'HEAD'), 'feature/x', git('log', '-1', '--pretty=%s'))
+        self.assertEqual(expected[2], 'Wrapped subject line')
+        self.assertEqual(tracker._read_git_head(), expected)
+        self.assertEqual(tracker._run_git_head(), expected)
+        
+        # Packed refs and objects: the subject comes from one git call
+        git('gc', '-q')
+        self.assertEqual(tracker._read_git_head(), expected[:2] + (None,))
+        self.assertEqual(tracker._get_git_info()['commit_message'], expected[2])
+        
+        git('checkout', '-q', '--detach')
+        self.assertEqual(tracker._read_git_head()[:2], (expected[0], 'HEAD'))
+    
     def test_get_config_hashes_with_files(self):
         """Test _get_config_hashes calculates hashes for existing config files."""
         # Create config directory and files
@@ -156,6 +186,19 @@ class TestChangeTracker(unittest.TestCase):
         self.assertEqual(len(hashes['strategy.yaml']), 16)
         self.assertTrue(all(c in '0123456789abcdef' for c in hashes['strategy.yaml']))
     
+    def test_get_config_hashes_match_file_contents(self):
+        """Test hashes are the SHA256 prefix of each file, including empty and profile files."""
+        profiles_dir = self.temp_path / 'config' / 'profiles'
+        profiles_dir.mkdir(parents=True)
+        contents = {'data.yaml': b'data:\n  cache: true', 'debug.yaml': b'',
+                    'profiles/fast.yaml': b'profile: fast'}
+        for name, content in contents.items():
+            (self.temp_path / 'config' / name).write_bytes(content)
+        
+        hashes = ChangeTracker(project_root=self.temp_path)._get_config_hashes()
+        self.assertEqual(hashes, {name: hashlib.sha256(content).hexdigest()[:16]
+                                  for name, content in contents.items()})
+    
     def test_get_config_hashes_missing_files(self):
         """Test _get_config_hashes skips missing config files."""
         # Create config directory but no files
@@ -222,6 +265,16 @@ class TestChangeTracker(unittest.TestCase):
         # In test environment, at least pandas/numpy should be available
         self.assertGreaterEqual(installed_count, 0)  # May have none in minimal test env
     
+    def test_get_dependency_versions_match_modules(self):
+        """Test metadata versions match the installed modules' __version__."""
+        import numpy
+        import pandas
+        import yaml
+        versions = ChangeTracker()._get_dependency_versions()
+        self.assertEqual(versions['pandas'], pandas.__version__)
+        self.assertEqual(versions['numpy'], numpy.__version__)
+        self.assertEqual(versions['pyyaml'], yaml.__version__)
+    
     def test_get_dependency_versions_missing(self):
         """Test _get_dependency_versions returns 'not_installed' for missing packages."""
         tracker = ChangeTracker()
@@ -260,6 +313,21 @@ class TestChangeTracker(unittest.TestCase):
         # Verify dependencies structure
         self.assertIsInstance(metadata['dependencies'], dict)
     
+    def test_get_change_metadata_cached_until_invalidated(self):
+        """Test metadata is computed once and refreshed after invalidate()."""
+        config_dir = self.temp_path / 'config'
+        config_dir.mkdir()
+        (config_dir / 'data.yaml').write_text('a: 1')
+        tracker = ChangeTracker(project_root=self.temp_path)
+        metadata = tracker.get_change_metadata()
+        
+        (config_dir / 'data.yaml').write_text('a: 2')
+        self.assertIs(tracker.get_change_metadata(), metadata)
+        
+        tracker.invalidate()
+        self.assertNotEqual(tracker.get_change_metadata()['config']['data.yaml'],
+                            metadata['config']['data.yaml'])
+    
     def test_get_change_metadata_no_git(self):
         """Test get_change_metadata works without git repo."""
         tracker = ChangeTracker(project_root=self.temp_path)
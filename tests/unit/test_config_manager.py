@@ -3,11 +3,13 @@ Tests for walk-forward configuration management.
 """
 
 import unittest
+import unittest.mock
 import pytest
 import tempfile
 import os
 import yaml
-from backtester.config import ConfigManager, ConfigError
+from pathlib import Path
+from backtester.config import ConfigManager, ConfigError, ConfigLoader
 
 
 @pytest.mark.unit
@@ -107,13 +109,13 @@ class TestWalkForwardConfig(unittest.TestCase):
         """Test getting walk-forward periods."""
         config = ConfigManager(config_dir=self.config_path, metadata_path=self.metadata_path)
         periods = config.get_walkforward_periods()
-        self.assertEqual(periods, ['1Y/6M'])
+        self.assertEqual(periods, ('1Y/6M',))
     
     def test_get_fitness_function(self):
         """Test getting fitness function."""
         config = ConfigManager(config_dir=self.config_path, metadata_path=self.metadata_path)
         fitness = config.get_walkforward_fitness_functions()
-        self.assertEqual(fitness, ['np_avg_dd'])
+        self.assertEqual(fitness, ('np_avg_dd',))
     
     def test_get_parameter_ranges(self):
         """Test getting parameter ranges."""
@@ -136,6 +138,131 @@ class TestWalkForwardConfig(unittest.TestCase):
         # Should raise validation error since walkforward is required
         with self.assertRaises(Exception):
             config = ConfigManager(config_dir=self.config_path, metadata_path=self.metadata_path)
+    
+    def test_convert_config_fallback_matches_msgspec(self):
+        """Test that the pure-Python section decoding matches the msgspec path."""
+        from backtester.config.core import accessor as accessor_module
+        from backtester.config.core.accessor import (
+            _convert_config, TradingConfig, DataQualityConfig, DebugConfig
+        )
+        
+        config = ConfigLoader(self.config_dir).load_all()
+        sections = [
+            (config['trading'], TradingConfig),
+            ({**config['trading'], 'slippage': 0, 'commission': '0.005'}, TradingConfig),
+            (config.get('data_quality'), DataQualityConfig),
+            (config.get('debug'), DebugConfig),
+            ({'crash_reports': {'max_total_size_mb': 100}}, DebugConfig),
+            (None, DebugConfig),
+        ]
+        for raw, config_cls in sections:
+            with unittest.mock.patch.object(accessor_module, 'HAS_MSGSPEC', False):
+                fallback = _convert_config(raw, config_cls)
+            self.assertEqual(fallback, _convert_config(raw, config_cls), config_cls.__name__)
+            self.assertIsInstance(fallback, config_cls)
+    
+    def test_walkforward_config_matches_getters(self):
+        """Test that the typed walk-forward config backs the legacy getters."""
+        config = ConfigManager(config_dir=self.config_path, metadata_path=self.metadata_path)
+        wf = config.get_walkforward_config()
+        
+        self.assertIs(wf, config.get_walkforward_config())
+        self.assertEqual(wf.start_date, config.get_walkforward_start_date())
+        self.assertEqual(wf.symbols, config.get_walkforward_symbols())
+        self.assertEqual(wf.periods, config.get_walkforward_periods())
+        self.assertEqual(wf.fitness_functions, config.get_walkforward_fitness_functions())
+    
+    def test_malformed_walkforward_sequences_isolated(self):
+        """Test that a malformed periods/fitness entry only fails its own getter."""
+        from backtester.config.core.accessor import ConfigAccessor
+        
+        config = ConfigLoader(self.config_dir).load_all()
+        walkforward = config['walkforward']
+        start_date = walkforward['start_date']
+        
+        walkforward['periods'] = '1Y/6M'
+        self.assertEqual(ConfigAccessor(config).get_walkforward_periods(), ('1Y/6M',))
+        
+        walkforward['periods'] = None
+        walkforward['fitness_functions'] = 'np_avg_dd'
+        accessor = ConfigAccessor(config)
+        self.assertEqual(accessor.get_walkforward_start_date(), start_date)
+        self.assertEqual(accessor.get_walkforward_periods(), ())
+        with self.assertRaises(ConfigError):
+            accessor.get_walkforward_fitness_functions()
+        
+        walkforward['periods'] = {'in_sample': '1Y'}
+        accessor = ConfigAccessor(config)
+        self.assertEqual(accessor.get_walkforward_start_date(), start_date)
+        with self.assertRaises(ConfigError):
+            accessor.get_walkforward_periods()
+    
+    def test_load_all_cache_returns_independent_copies(self):
+        """Test that cached loads can be mutated without affecting later loads."""
+        loader = ConfigLoader(self.config_dir)
+        first = loader.load_all()
+        first['strategy']['parameters']['fast_period'] = 99
+        
+        second = loader.load_all()
+        self.assertEqual(second['strategy']['parameters']['fast_period'], 20)
+    
+    def test_load_all_cache_invalidated_on_file_change(self):
+        """Test that modifying a config file bypasses the cached merge."""
+        loader = ConfigLoader(self.config_dir)
+        self.assertEqual(loader.load_all()['data']['exchange'], 'coinbase')
+        
+        data_path = os.path.join(self.config_dir, 'data.yaml')
+        with open(data_path, 'w') as f:
+            yaml.dump({'data': {'exchange': 'kraken'}}, f)
+        stat = os.stat(data_path)
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        
+        self.assertEqual(loader.load_all()['data']['exchange'], 'kraken')
+    
+    def test_load_all_cache_invalidated_on_same_stat_edit(self):
+        """Test that a same-size edit with the old mtime restored bypasses the cached merge."""
+        loader = ConfigLoader(self.config_dir)
+        self.assertEqual(loader.load_all()['data']['exchange'], 'coinbase')
+        
+        data_path = os.path.join(self.config_dir, 'data.yaml')
+        stat = os.stat(data_path)
+        with open(data_path, 'w') as f:
+            yaml.dump({'data': {'exchange': 'binance_'}}, f)
+        os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        
+        self.assertEqual(loader.load_all()['data']['exchange'], 'binance_')
+    
+    def test_load_all_uses_per_file_json_cache(self):
+        """Test that unchanged YAML files are read from their JSON copies outside the config dir."""
+        from backtester.config.core import loader as loader_module
+        
+        cache_dir = os.path.join(self.temp_dir, 'user_cache')
+        with unittest.mock.patch.dict(os.environ, {'BACKTESTER_CONFIG_CACHE_DIR': cache_dir}):
+            loader = ConfigLoader(self.config_dir)
+            expected = loader.load_all()
+            self.assertEqual(len(os.listdir(cache_dir)), len(ConfigLoader.DOMAIN_FILES))
+            self.assertFalse(os.path.exists(os.path.join(self.config_dir, '.cache')))
+            
+            # Drop the merged cache so only the per-file copies remain
+            loader_module._CACHE.clear()
+            with unittest.mock.patch.object(ConfigLoader, '_load_yaml', side_effect=AssertionError):
+                self.assertEqual(loader.load_all(), expected)
+    
+    def test_per_file_cache_keyed_on_content(self):
+        """Test a same-size edit with the old mtime restored is not served from the cache."""
+        cache_dir = os.path.join(self.temp_dir, 'user_cache')
+        data_path = os.path.join(self.config_dir, 'data.yaml')
+        with unittest.mock.patch.dict(os.environ, {'BACKTESTER_CONFIG_CACHE_DIR': cache_dir}):
+            loader = ConfigLoader(self.config_dir)
+            self.assertEqual(loader._load_fast(Path(data_path)), {'data': {'exchange': 'coinbase'}})
+            
+            stat = os.stat(data_path)
+            with open(data_path, 'w') as f:
+                yaml.dump({'data': {'exchange': 'binance_'}}, f)  # Same length as 'coinbase'
+            os.utime(data_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            self.assertEqual(os.stat(data_path).st_size, stat.st_size)
+            
+            self.assertEqual(loader._load_fast(Path(data_path)), {'data': {'exchange': 'binance_'}})
 
 
 if __name__ == '__main__':
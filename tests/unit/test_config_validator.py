@@ -0,0 +1,137 @@
+"""
+Unit tests for ConfigValidator.
+"""
+
+import copy
+import unittest
+from unittest.mock import patch
+
+from backtester.config import ConfigValidator
+from backtester.config.core import validator as validator_module
+
+
+def make_valid_config():
+    """Minimal config that passes every rule."""
+    return {
+        'data': {'exchange': 'coinbase', 'historical_start_date': '2017-01-01'},
+        'trading': {'fee_type': 'taker', 'slippage': 0.001, 'commission': 0.006},
+        'strategy': {'name': 'sma_cross'},
+        'data_quality': {'weights': {'coverage': 0.6, 'gaps': 0.4}},
+        'parallel': {'mode': 'auto', 'max_workers': None, 'cpu_reserve_cores': 1},
+        'walkforward': {
+            'start_date': '2022-01-01',
+            'end_date': '2023-01-01',
+            'initial_capital': 100000.0,
+            'symbols': ['BTC/USD'],
+            'timeframes': ['1h'],
+            'periods': ['1Y/6M'],
+            'fitness_functions': ['np_avg_dd'],
+            'parameter_ranges': {'fast_period': {'start': 5, 'end': 20, 'step': 5}},
+        },
+        'debug': {'enabled': True, 'tracing': {'level': 'standard', 'sample_rate': 1.0}},
+    }
+
+
+class TestConfigValidator(unittest.TestCase):
+    """Test ConfigValidator results."""
+    
+    METADATA = {'exchanges': ['coinbase'], 'top_markets': ['BTC/USD'], 'timeframes': ['1h', '1d']}
+    
+    def validate(self, config, metadata=None, use_schema=True):
+        validator = ConfigValidator()
+        if not use_schema:
+            validator._validate = None
+        result = validator.validate(config, metadata)
+        return result.errors, result.warnings
+    
+    def test_valid_config(self):
+        """Test that a valid config has no errors or warnings."""
+        self.assertEqual(self.validate(make_valid_config(), self.METADATA), ([], []))
+    
+    def test_schema_fast_path_matches_python_rules(self):
+        """Test that results are identical with and without the compiled schema."""
+        configs = [make_valid_config() for _ in range(4)]
+        configs[1]['walkforward']['start_date'] = '2024-01-01'       # cross-field error
+        configs[2]['walkforward']['symbols'] = ['ETH/USD']           # metadata warning
+        configs[3]['trading']['slippage'] = -1                       # schema violation
+    
+        for config in configs:
+            expected = self.validate(copy.deepcopy(config), self.METADATA)
+            actual = self.validate(copy.deepcopy(config), self.METADATA, use_schema=False)
+            self.assertEqual(actual, expected)
+    
+    @unittest.skipUnless(validator_module.HAS_FASTJSONSCHEMA, "fastjsonschema not installed")
+    def test_compiled_schema_shared_between_validators(self):
+        """Test that the compiled schema is cached across instances until cleared."""
+        first = ConfigValidator()
+        self.assertIs(ConfigValidator()._validate, first._validate)
+    
+        ConfigValidator.clear_cache()
+        self.assertIsNot(ConfigValidator()._validate, first._validate)
+    
+    def test_date_formats(self):
+        """Test that dates pandas cannot parse are rejected whichever parser runs."""
+        cases = [('2022-01-01', True), ('2022-01-01T00:00:00Z', True),
+                 ('Jan 1 2022', True), ('2022-W01', False),
+                 ('2022-02-30', False), ('1500-01-01', False)]
+        for use_ciso8601 in sorted({False, validator_module.HAS_CISO8601}):
+            with patch.object(validator_module, 'HAS_CISO8601', use_ciso8601):
+                for value, valid in cases:
+                    config = make_valid_config()
+                    config['data']['historical_start_date'] = value
+                    errors, _ = self.validate(config)
+                    self.assertEqual(errors == [], valid, (value, use_ciso8601))
+    
+    def test_period_format(self):
+        """Test that periods are checked against the full parse_period grammar."""
+        config = make_valid_config()
+        config['walkforward']['periods'] = ['1Y/6M', '252/126', '1.5y / 3m', '/', 'abc/', '1Y/6M/1M']
+        
+        errors, _ = self.validate(config)
+        self.assertEqual(len(errors), 3)
+        self.assertTrue(all(e.startswith('Invalid period format') for e in errors))
+    
+    def test_numeric_rule_bounds(self):
+        """Test inclusive and exclusive bounds of the generated numeric checks."""
+        for field, value, valid in [('slippage', 0, True), ('slippage', -0.1, False),
+                                    ('risk_per_trade', 0, False), ('risk_per_trade', 1.0, True),
+                                    ('risk_per_trade', 'abc', False), ('commission', 1.5, False)]:
+            config = make_valid_config()
+            config['trading'][field] = value
+            errors, _ = self.validate(config, use_schema=False)
+            self.assertEqual(errors == [], valid, (field, value))
+
+    def test_non_numeric_weight_reported(self):
+        """Test that a non-numeric weight is an error rather than an exception."""
+        config = make_valid_config()
+        config['data_quality']['weights']['gaps'] = 'high'
+        
+        errors, warnings = self.validate(config)
+        self.assertEqual(errors, ["'data_quality.weights.gaps' must be a number"])
+        self.assertEqual(warnings, [])
+    
+    def test_max_errors_stops_early(self):
+        """Test that validation stops once max_errors errors were recorded."""
+        config = make_valid_config()
+        config['trading']['fee_type'] = 'both'
+        config['walkforward']['fitness_functions'] = ['unknown']
+        
+        result = ConfigValidator().validate(config, max_errors=1)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("'trading.fee_type'", result.errors[0])
+        self.assertFalse(result.is_valid())
+    
+    def test_invalid_values_report_field_errors(self):
+        """Test that rule violations report the offending field."""
+        config = make_valid_config()
+        config['trading']['fee_type'] = 'both'
+        config['walkforward']['fitness_functions'] = ['unknown']
+    
+        errors, _ = self.validate(config)
+        self.assertEqual(len(errors), 2)
+        self.assertIn("'trading.fee_type'", errors[0])
+        self.assertIn("Invalid fitness function 'unknown'", errors[1])
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -25,6 +25,20 @@ class TestDebugConfig(unittest.TestCase):
         self.assertTrue(hasattr(debug_config, 'crash_reports'))
         self.assertTrue(hasattr(debug_config, 'logging'))
     
+    def test_debug_config_mutations_not_shared(self):
+        """Test that toggling a returned debug config leaves later calls unchanged."""
+        config = ConfigManager()
+        debug_config = config.get_debug_config()
+        enabled = debug_config.enabled
+        tracing_enabled = debug_config.tracing.enabled
+        
+        debug_config.enabled = not enabled
+        debug_config.tracing.enabled = not tracing_enabled
+        
+        fresh = config.get_debug_config()
+        self.assertEqual(fresh.enabled, enabled)
+        self.assertEqual(fresh.tracing.enabled, tracing_enabled)
+    
     def test_debug_config_defaults(self):
         """Test debug config provides sensible defaults."""
         # Create minimal config
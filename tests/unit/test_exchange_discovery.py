@@ -0,0 +1,156 @@
+"""
+Tests for earliest-date discovery.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from datetime import datetime, timezone
+
+import ccxt
+import pandas as pd
+
+from backtester.data import cache_manager, discovery_cache, fetcher
+from backtester.data.exchange_discovery import get_earliest_date, find_best_exchange
+from backtester.data.fetcher import find_earliest_available_date, search_earliest_candle
+
+
+class FakeExchange:
+    """Exchange stub with data from `listed` onwards, counting fetch_ohlcv calls."""
+    
+    id = 'fake'
+    parse8601 = staticmethod(ccxt.Exchange.parse8601)
+    
+    def __init__(self, listed: str, windowed: bool, exchange_id: str = 'fake'):
+        self.id = exchange_id
+        self.listed_ms = int(pd.Timestamp(listed, tz='UTC').value // 10**6)
+        self.windowed = windowed
+        self.calls = 0
+    
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls += 1
+        if symbol == 'MISSING/USD':
+            raise ccxt.BadSymbol('fake does not have market symbol MISSING/USD')
+        if self.windowed:
+            # Only candles inside the requested window (here: exactly at since)
+            if since < self.listed_ms:
+                return []
+            return [[since, 1.0, 1.0, 1.0, 1.0, 1.0]]
+        return [[max(since, self.listed_ms), 1.0, 1.0, 1.0, 1.0, 1.0]]
+
+
+class TestEarliestDate(unittest.TestCase):
+    """Test the binary search for the earliest available candle."""
+    
+    def setUp(self):
+        """Use an empty probe cache and a temporary discovery database."""
+        fetcher._PROBE_CACHE.clear()
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cache = cache_manager.CACHE_DIR
+        cache_manager.CACHE_DIR = Path(self.temp_dir)
+    
+    def tearDown(self):
+        """Restore the data cache directory."""
+        cache_manager.CACHE_DIR = self.original_cache
+        shutil.rmtree(self.temp_dir)
+    
+    def test_forward_exchange_returns_listing_candle(self):
+        """Test exchanges returning the next candle after since give the exact start."""
+        exchange = FakeExchange('2015-06-15', windowed=False)
+        self.assertEqual(get_earliest_date(exchange, 'BTC/USD', '1d'),
+                         pd.Timestamp('2015-06-15', tz='UTC'))
+    
+    def test_windowed_exchange_refines_to_month(self):
+        """Test window-only exchanges resolve to the first month with data."""
+        exchange = FakeExchange('2017-06-15', windowed=True)
+        self.assertEqual(get_earliest_date(exchange, 'BTC/USD', '1d', max_workers=1),
+                         pd.Timestamp('2017-07-01', tz='UTC'))
+        self.assertLessEqual(exchange.calls, 10)
+    
+    def test_parallel_search_matches_serial(self):
+        """Test concurrent probe rounds find the same date as the serial search."""
+        for listed, windowed in [('2010-01-01', True), ('2013-02-10', True), ('2017-06-15', True),
+                                 ('2021-12-31', True), ('2015-06-15', False)]:
+            serial = search_earliest_candle(
+                lambda when: fetcher.fetch_first_candle(FakeExchange(listed, windowed), 'BTC/USD', '1d', when),
+                2010, 2025)
+            fetcher._PROBE_CACHE.clear()
+            parallel = search_earliest_candle(
+                lambda when: fetcher.fetch_first_candle(FakeExchange(listed, windowed), 'BTC/USD', '1d', when),
+                2010, 2025, max_workers=8)
+            fetcher._PROBE_CACHE.clear()
+            self.assertEqual(parallel, serial, listed)
+    
+    def test_market_not_found(self):
+        """Test a missing market returns None after a single request."""
+        exchange = FakeExchange('2015-01-01', windowed=True)
+        self.assertIsNone(get_earliest_date(exchange, 'MISSING/USD', '1d'))
+        self.assertEqual(exchange.calls, 1)
+    
+    def test_find_earliest_available_date_respects_range(self):
+        """Test the search is bounded by the requested years."""
+        exchange = FakeExchange('2012-03-01', windowed=True)
+        earliest = find_earliest_available_date(
+            exchange, 'BTC/USD', '1d', datetime(2014, 1, 1), datetime(2020, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(earliest, pd.Timestamp('2014-01-01', tz='UTC'))
+        self.assertIsNone(find_earliest_available_date(
+            FakeExchange('2030-01-01', windowed=True), 'ETH/USD', '1d',
+            datetime(2014, 1, 1), datetime(2020, 1, 1)))
+    
+    
+    def test_find_best_exchange_prefers_earliest_then_list_order(self):
+        """Test the earliest exchange wins and ties keep the configured order."""
+        listings = {'a': '2018-01-01', 'b': '2016-01-01', 'c': '2016-01-01', 'd': None}
+        
+        def create(name, enable_rate_limit=True):
+            if listings[name] is None:
+                raise ccxt.NetworkError('unreachable')
+            return FakeExchange(listings[name], windowed=False, exchange_id=name)
+        
+        with patch('backtester.data.exchange_discovery.create_exchange', side_effect=create):
+            best, earliest = find_best_exchange('BTC/USD', '1d', ['a', 'b', 'c', 'd'])
+        self.assertEqual(best, 'b')
+        self.assertEqual(earliest, pd.Timestamp('2016-01-01', tz='UTC'))
+    
+    def test_exchange_without_earlier_data_skips_search(self):
+        """Test `before` ends the search after one probe if the exchange cannot win."""
+        for windowed in (True, False):
+            exchange = FakeExchange('2018-01-01', windowed=windowed, exchange_id=f'late-{windowed}')
+            self.assertIsNone(get_earliest_date(exchange, 'BTC/USD', '1d',
+                                                before=pd.Timestamp('2016-01-01', tz='UTC')))
+            self.assertEqual(exchange.calls, 1)
+            self.assertEqual(discovery_cache.lookup_earliest(exchange.id, 'BTC/USD', '1d'), (False, None))
+            
+            self.assertEqual(get_earliest_date(exchange, 'BTC/USD', '1d',
+                                               before=pd.Timestamp('2019-01-01', tz='UTC')),
+                             pd.Timestamp('2018-01-01', tz='UTC'))
+    
+    
+    def test_results_cached_on_disk(self):
+        """Test earliest dates (including 'no data') are served from the discovery cache."""
+        exchange = FakeExchange('2015-06-15', windowed=False)
+        first = get_earliest_date(exchange, 'BTC/USD', '1d')
+        self.assertIsNone(get_earliest_date(exchange, 'MISSING/USD', '1d'))
+        fetcher._PROBE_CACHE.clear()
+        calls = exchange.calls
+        
+        self.assertEqual(get_earliest_date(exchange, 'BTC/USD', '1d'), first)
+        self.assertIsNone(get_earliest_date(exchange, 'MISSING/USD', '1d'))
+        self.assertEqual(exchange.calls, calls)
+        
+        discovery_cache.invalidate('BTC/USD')
+        self.assertEqual(discovery_cache.lookup_earliest('fake', 'BTC/USD', '1d'), (False, None))
+        self.assertEqual(discovery_cache.lookup_earliest('fake', 'MISSING/USD', '1d'), (True, None))
+    
+    def test_failed_probes_not_cached(self):
+        """Test a search with transient errors is not cached."""
+        exchange = FakeExchange('2015-06-15', windowed=False)
+        with patch.object(exchange, 'fetch_ohlcv', side_effect=ccxt.NetworkError('timeout')):
+            self.assertIsNone(get_earliest_date(exchange, 'BTC/USD', '1d'))
+        self.assertEqual(discovery_cache.lookup_earliest('fake', 'BTC/USD', '1d'), (False, None))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,261 @@
+"""
+Tests for OHLCV fetching.
+"""
+
+import shutil
+import tempfile
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+import ccxt
+import pandas as pd
+
+from backtester.data import fetcher
+from backtester.data.fetcher import (fetch_historical, fetch_historical_cached, AdaptiveRateLimiter,
+                                     FetchError, create_exchange, fetch_historical_many)
+
+DAY_MS = 86_400_000
+
+
+class FakeExchange:
+    """Exchange stub serving daily candles from `listed` to `now`."""
+    
+    id = 'fake'
+    parse8601 = staticmethod(ccxt.Exchange.parse8601)
+    
+    def __init__(self, listed: str, now: str, fail_every: int = 0, windowed: bool = False):
+        self.listed_ms = int(pd.Timestamp(listed, tz='UTC').value // 10**6)
+        self.now_ms = int(pd.Timestamp(now, tz='UTC').value // 10**6)
+        self.fail_every = fail_every
+        self.windowed = windowed  # Only serve candles within `limit` days of since
+        self.features = {}
+        self.max_limit = None  # Larger limits raise BadRequest
+        self.calls = 0
+    
+    def fetch_ohlcv(self, symbol, timeframe, since=None, limit=None):
+        self.calls += 1
+        if symbol == 'MISSING/USD':
+            raise ccxt.BadSymbol('fake does not have market symbol MISSING/USD')
+        if self.fail_every and self.calls % self.fail_every:
+            raise ccxt.RateLimitExceeded('fake 429 Too Many Requests')
+        if self.max_limit and limit > self.max_limit:
+            raise ccxt.BadRequest(f'fake limit {limit} too large')
+        first = max(since, self.listed_ms)
+        first += -first % DAY_MS  # Align to the next candle
+        candles = []
+        ts = first
+        window_end = since + limit * DAY_MS if self.windowed else self.now_ms + 1
+        while ts <= self.now_ms and ts < window_end and len(candles) < limit:
+            price = float(ts // DAY_MS)
+            candles.append([ts, price, price + 1, price - 1, price, 10.0])
+            ts += DAY_MS
+        return candles
+
+
+class TestFetchHistorical(unittest.TestCase):
+    """Test fetch_historical batching and frame construction."""
+    
+    def tearDown(self):
+        """Drop limiter backoff and learned batch limits so they do not leak into later tests."""
+        fetcher._RATE_LIMITERS.clear()
+        fetcher._BATCH_LIMITS.clear()
+    
+    def test_many_batches(self):
+        """Test a fetch spanning several batches returns every candle once, in order."""
+        exchange = FakeExchange('2010-01-01', now='2025-01-01')
+        df, requests = fetch_historical(exchange, 'BTC/USD', '1d', '2010-01-01', '2024-12-31')
+        
+        self.assertEqual(requests, 6)
+        self.assertEqual(len(df), 5479)
+        self.assertTrue(df.index.is_monotonic_increasing and df.index.is_unique)
+        self.assertEqual(df.index[-1], pd.Timestamp('2024-12-31', tz='UTC'))
+        self.assertEqual(df['open'].iloc[-1], float(df.index[-1].value // 10**6 // DAY_MS))
+    
+    def test_exchange_batch_limit(self):
+        """Test the advertised per-exchange limit is used, falling back to 1000 once rejected."""
+        fetcher._BATCH_LIMITS.clear()
+        exchange = FakeExchange('2010-01-01', now='2025-01-01')
+        exchange.features = {'spot': {'fetchOHLCV': {'limit': 2000}}}
+        df, requests = fetch_historical(exchange, 'BTC/USD', '1d', '2010-01-01', '2024-12-31')
+        self.assertEqual((len(df), requests), (5479, 3))
+        
+        exchange.max_limit = 1000
+        rejected, requests = fetch_historical(exchange, 'BTC/USD', '1d', '2010-01-01', '2024-12-31')
+        pd.testing.assert_frame_equal(rejected, df)
+        self.assertEqual(requests, 6)
+        
+        # The rejection is remembered: no oversized request on the next fetch
+        calls = exchange.calls
+        fetch_historical(exchange, 'BTC/USD', '1d', '2010-01-01', '2024-12-31')
+        self.assertEqual(exchange.calls - calls, 6)
+    
+    def test_float32_precision(self):
+        """Test precision='float32' returns the same candles with float32 columns."""
+        exchange = FakeExchange('2020-01-01', now='2021-01-01')
+        expected, _ = fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2020-12-31')
+        df, _ = fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2020-12-31', precision='float32')
+        
+        self.assertTrue((df.dtypes == 'float32').all())
+        pd.testing.assert_frame_equal(df, expected.astype('float32'))
+        with self.assertRaises(ValueError):
+            fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2020-12-31', precision='float16')
+    
+    def test_empty_start_continues_from_earliest_date(self):
+        """Test a start before listing is resumed from the earliest available date."""
+        fetcher._PROBE_CACHE.clear()
+        exchange = FakeExchange('2019-03-10', now='2021-01-01', windowed=True)
+        df, requests = fetch_historical(exchange, 'BTC/USD', '1d', '2012-01-01', '2020-12-31')
+        
+        # Month-level search on a windowed exchange: first candle on Apr 1
+        self.assertEqual(df.index[0], pd.Timestamp('2019-04-01', tz='UTC'))
+        self.assertEqual(df.index[-1], pd.Timestamp('2020-12-31', tz='UTC'))
+        self.assertEqual(len(df), 641)
+        self.assertEqual(requests, 1)
+    
+    @patch('backtester.data.fetcher.time.sleep')
+    def test_rate_limits_retry_same_batch(self, sleep):
+        """Test rate-limited batches are retried at the same since without losing candles."""
+        expected, _ = fetch_historical(FakeExchange('2020-01-01', now='2025-01-01'),
+                                       'BTC/USD', '1d', '2020-01-01', '2024-12-31')
+        exchange = FakeExchange('2020-01-01', now='2025-01-01', fail_every=3)  # Two 429s per success
+        df, requests = fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2024-12-31')
+        
+        pd.testing.assert_frame_equal(df, expected)
+        self.assertEqual(requests, exchange.calls)
+        self.assertTrue(sleep.called)
+    
+    @patch('backtester.data.fetcher.time.sleep')
+    def test_persistent_rate_limit_raises(self, sleep):
+        """Test a batch still failing after the retries raises FetchError."""
+        exchange = FakeExchange('2020-01-01', now='2025-01-01', fail_every=10**9)
+        with self.assertRaises(FetchError):
+            fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2024-12-31')
+        self.assertEqual(exchange.calls, 6)
+    
+    
+    def test_many_symbols_share_one_exchange(self):
+        """Test fetch_historical_many fetches every symbol and leaves out failures."""
+        exchange = FakeExchange('2020-01-01', now='2025-01-01')
+        expected, _ = fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2024-12-31')
+        
+        with patch('backtester.data.fetcher.create_exchange', return_value=exchange):
+            results = fetch_historical_many('fake', ['BTC/USD', 'ETH/USD', 'MISSING/USD'], '1d',
+                                            '2020-01-01', '2024-12-31')
+        
+        self.assertEqual(list(results), ['BTC/USD', 'ETH/USD'])
+        for df, requests in results.values():
+            pd.testing.assert_frame_equal(df, expected)
+            self.assertEqual(requests, 2)
+
+
+class TestAdaptiveRateLimiter(unittest.TestCase):
+    """Test the limiter's backoff and decay."""
+    
+    def test_backoff_and_decay(self):
+        """Test the delay doubles up to the cap and decays back to zero."""
+        limiter = AdaptiveRateLimiter(min_delay=0.1, max_delay=1.0)
+        delays = []
+        for _ in range(5):
+            limiter.on_rate_limit()
+            delays.append(limiter.delay)
+        self.assertEqual(delays, [0.1, 0.2, 0.4, 0.8, 1.0])
+        
+        for _ in range(30):
+            limiter.on_success()
+        self.assertEqual(limiter.delay, 0.0)
+    
+    def test_min_interval_spaces_concurrent_requests(self):
+        """Test threads sharing a limiter get request slots at least min_interval apart."""
+        limiter = AdaptiveRateLimiter(min_interval=0.05)
+        
+        def request(_):
+            limiter.wait()
+            return time.monotonic()
+        
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            times = sorted(executor.map(request, range(4)))
+        self.assertGreaterEqual(min(b - a for a, b in zip(times, times[1:])), 0.04)
+    
+    def test_shared_limiter_uses_exchange_rate_limit(self):
+        """Test the per-exchange limiter spaces requests by rateLimit when ccxt throttling is on."""
+        fetcher._RATE_LIMITERS.clear()
+        exchange = FakeExchange('2020-01-01', now='2021-01-01')
+        exchange.enableRateLimit, exchange.rateLimit = True, 250
+        try:
+            self.assertEqual(fetcher.get_rate_limiter(exchange).min_interval, 0.25)
+        finally:
+            fetcher._RATE_LIMITERS.clear()
+
+
+class TestFetchHistoricalCached(unittest.TestCase):
+    """Test the incremental per-exchange OHLCV cache."""
+    
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+    
+    def test_refresh_fetches_only_the_tail(self):
+        """Test later calls fetch the missing tail and match a full fetch."""
+        exchange = FakeExchange('2020-01-01', now='2023-06-01')
+        first, requests = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2020-01-01', '2023-06-01',
+                                                  cache_dir=self.cache_dir)
+        self.assertEqual(len(first), 1248)
+        self.assertEqual(requests, 2)
+        
+        exchange.now_ms += 10 * DAY_MS
+        refreshed, requests = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2020-01-01', '2023-06-11',
+                                                      cache_dir=self.cache_dir)
+        self.assertEqual(requests, 1)
+        expected, _ = fetch_historical(exchange, 'BTC/USD', '1d', '2020-01-01', '2023-06-11')
+        pd.testing.assert_frame_equal(refreshed, expected, check_freq=False)
+    
+    def test_cached_range_needs_no_requests(self):
+        """Test a range already covered by the cache is served without API calls."""
+        exchange = FakeExchange('2020-01-01', now='2023-06-01')
+        fetch_historical_cached(exchange, 'BTC/USD', '1d', '2020-01-01', '2023-06-01', cache_dir=self.cache_dir)
+        calls = exchange.calls
+        
+        df, requests = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2021-01-01', '2021-12-31',
+                                               cache_dir=self.cache_dir)
+        self.assertEqual((requests, exchange.calls), (0, calls))
+        self.assertEqual(df.index[0], pd.Timestamp('2021-01-01', tz='UTC'))
+        self.assertEqual(df.index[-1], pd.Timestamp('2021-12-31', tz='UTC'))
+
+    
+    def test_head_before_listing_fetched_once(self):
+        """Test a start before the listing date does not re-request the head on later calls."""
+        exchange = FakeExchange('2020-01-01', now='2021-06-01')
+        first, _ = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2019-01-01', '2020-12-31',
+                                           cache_dir=self.cache_dir)
+        self.assertEqual(first.index[0], pd.Timestamp('2020-01-01', tz='UTC'))
+        calls = exchange.calls
+        
+        df, requests = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2019-06-01', '2020-12-31',
+                                               cache_dir=self.cache_dir)
+        self.assertEqual((requests, exchange.calls), (0, calls))
+        pd.testing.assert_frame_equal(df, first)
+        
+        # An earlier start than any fetched so far still checks the head
+        _, requests = fetch_historical_cached(exchange, 'BTC/USD', '1d', '2018-01-01', '2020-12-31',
+                                              cache_dir=self.cache_dir)
+        self.assertGreater(requests, 0)
+
+
+class TestCreateExchange(unittest.TestCase):
+    """Test exchange instance reuse."""
+    
+    def test_instances_shared_per_settings(self):
+        """Test the same name and rate-limit setting return one shared instance."""
+        exchange = create_exchange('kraken')
+        self.assertIs(create_exchange('kraken', enable_rate_limit=True), exchange)
+        self.assertIsNot(create_exchange('kraken', enable_rate_limit=False), exchange)
+        self.assertFalse(create_exchange('kraken', enable_rate_limit=False).enableRateLimit)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -5,6 +5,8 @@ Tests validation functions, quality scoring, and quality assessment pipeline.
 """
 
 import unittest
+import types
+from unittest.mock import MagicMock, patch
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta, timezone
@@ -20,11 +22,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from backtester.data.validator import (
     validate_ohlcv_integrity, validate_volume, detect_outliers,
     validate_cross_candle_consistency, validate_missing_values,
-    validate_chronological_order, detect_gaps
+    validate_chronological_order, validate_coverage, detect_gaps
 )
+from backtester.data import quality_scorer
 from backtester.data.quality_scorer import (
-    calculate_component_scores, calculate_composite_score,
-    assess_data_quality
+    calculate_component_scores, calculate_composite_score, calculate_gaps_score,
+    calculate_integrity_score, calculate_volume_score, calculate_consistency_score, scan_ohlcv,
+    assess_data_quality, assess_data_quality_many, load_quality_weights, load_quality_thresholds,
+    clear_quality_config_cache
 )
 from backtester.data.cache_manager import write_cache, read_cache, update_manifest, load_manifest
 from backtester.data.quality_metadata import (
@@ -57,9 +62,9 @@ class TestValidationFunctions(unittest.TestCase):
     def test_validate_ohlcv_integrity_good_data(self):
         """Test integrity validation with good data."""
         result = validate_ohlcv_integrity(self.good_df)
-        self.assertEqual(result['valid_count'], 100)
-        self.assertEqual(result['invalid_count'], 0)
-        self.assertEqual(len(result['issues']), 0)
+        self.assertEqual(result.valid_count, 100)
+        self.assertEqual(result.invalid_count, 0)
+        self.assertEqual(len(result.issues), 0)
     
     def test_validate_ohlcv_integrity_bad_data(self):
         """Test integrity validation with bad data."""
@@ -68,8 +73,16 @@ class TestValidationFunctions(unittest.TestCase):
         bad_df.iloc[1]['open'] = -10  # Negative price
         
         result = validate_ohlcv_integrity(bad_df)
-        self.assertGreater(result['invalid_count'], 0)
-        self.assertGreater(len(result['issues']), 0)
+        self.assertGreater(result.invalid_count, 0)
+        self.assertGreater(len(result.issues), 0)
+    
+    def test_validate_coverage(self):
+        """Test coverage counts candles inside the requested range."""
+        df = self.good_df.drop(self.good_df.index[10:20])
+        result = validate_coverage(df, '1h', self.good_df.index[0], self.good_df.index[-1])
+        self.assertEqual((result.expected_count, result.actual_count, result.missing_count), (99, 90, 9))
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.actual_start, self.good_df.index[0].isoformat())
     
     def test_detect_outliers(self):
         """Test outlier detection."""
@@ -157,6 +170,13 @@ class TestQualityScoring(unittest.TestCase):
             self.assertGreaterEqual(score, 0)
             self.assertLessEqual(score, 100)
     
+    def test_float32_precision(self):
+        """Test float32 scans give the float64 scores on ordinary prices."""
+        expected = calculate_component_scores(self.df, '1h')
+        self.assertEqual(calculate_component_scores(self.df, '1h', precision='float32'), expected)
+        with self.assertRaises(ValueError):
+            calculate_component_scores(self.df, '1h', precision='float16')
+    
     def test_calculate_composite_score(self):
         """Test composite score calculation."""
         component_scores = {
@@ -176,6 +196,74 @@ class TestQualityScoring(unittest.TestCase):
         self.assertGreaterEqual(result['composite'], 0)
         self.assertLessEqual(result['composite'], 100)
         self.assertIn(result['grade'], ['A', 'B', 'C', 'D', 'F'])
+    
+    def test_gaps_score_penalizes_large_gaps_more(self):
+        """Test gaps under 24h cost gap_penalty_small and longer ones gap_penalty_large."""
+        df = self.df.drop(self.df.index[[10, 11, 100]])  # 3h and 2h gaps
+        df = df.drop(df.index[200:230])                   # 31h gap
+        thresholds = {'gap_penalty_small': 0.5, 'gap_penalty_large': 2.0}
+        
+        self.assertEqual(calculate_gaps_score(df, '1h', thresholds), 100.0 - 2 * 0.5 - 2.0)
+        self.assertEqual(calculate_gaps_score(self.df, '1h', thresholds), 100.0)
+    
+    def test_scan_matches_validators(self):
+        """Test scores from the fused OHLCV scan equal the per-validator scores."""
+        df = self.df.copy()
+        df['open'] = df['close'].shift(1) * np.random.choice([1.0, 1.005, 1.05], len(df))
+        df.iloc[[3, 40], 0] = np.nan
+        df.iloc[[5, 50], 3] = [-1.0, 0.0]
+        df.iloc[::7, 4] = 0.0
+        df = df.iloc[np.random.permutation(len(df))]  # Unsorted input
+        thresholds = {'consistency_tolerance': 0.01}
+        
+        scan = scan_ohlcv(df, thresholds)
+        self.assertEqual(calculate_integrity_score(df, scan), calculate_integrity_score(df))
+        self.assertEqual(calculate_volume_score(df, thresholds, scan), calculate_volume_score(df, thresholds))
+        self.assertEqual(calculate_consistency_score(df, thresholds, scan),
+                         calculate_consistency_score(df, thresholds))
+        self.assertIsNone(scan_ohlcv(df.drop(columns='volume'), thresholds))
+        
+        # The single-loop (numba) scan counts the same as the numpy scan
+        columns = [df.sort_index()[col].to_numpy() for col in ['open', 'high', 'low', 'close', 'volume']]
+        with patch.object(quality_scorer, 'HAS_NUMBA', False):
+            expected = quality_scorer._scan_ohlcv(*columns, 0.01)
+        self.assertEqual(quality_scorer._scan_ohlcv_loop(*[np.ascontiguousarray(c) for c in columns], 0.01),
+                         (expected.invalid_count, expected.zero_volume_count, expected.consistent_count))
+    
+    def test_outlier_count_matches_detect_outliers(self):
+        """Test the scorer's vectorized IQR count equals the detect_outliers result."""
+        df = self.df.copy()
+        df.iloc[[10, 20], 3] = [1e6, -1e6]
+        df.iloc[30, 4] = np.nan
+        df.iloc[::50, 4] = 1e9
+        
+        arrays = quality_scorer.OHLCVArrays.from_frame(df)
+        for multiplier in (1.0, 1.5, 3.0):
+            self.assertEqual(quality_scorer._count_iqr_outliers(arrays.stack(quality_scorer.OHLCV_COLUMNS),
+                                                                arrays.index, multiplier),
+                             len(detect_outliers(df, method='iqr', multiplier=multiplier)))
+        self.assertEqual(quality_scorer._count_iqr_outliers(arrays.stack(['volume']), arrays.index, 1.5),
+                         validate_volume(df)['outlier_count'])
+    
+    def test_default_config_loaded_once(self):
+        """Test weights/thresholds from the default config are cached until cleared."""
+        config_module = types.ModuleType('config')
+        config_module.ConfigManager = MagicMock()
+        dq_config = config_module.ConfigManager.return_value.get_data_quality_config.return_value
+        dq_config.weights = {'coverage': 0.5}
+        dq_config.thresholds = {'outlier_penalty': 0.2}
+        
+        clear_quality_config_cache()
+        try:
+            with patch.dict(sys.modules, {'config': config_module}):
+                for _ in range(3):
+                    self.assertEqual(load_quality_weights()['coverage'], 0.5)
+                    self.assertEqual(load_quality_thresholds()['outlier_penalty'], 0.2)
+                load_quality_weights()['coverage'] = 0.0  # Callers get copies
+                self.assertEqual(load_quality_weights()['coverage'], 0.5)
+                self.assertEqual(config_module.ConfigManager.call_count, 2)
+        finally:
+            clear_quality_config_cache()
 
 
 class TestQualityMetadata(unittest.TestCase):
@@ -293,6 +381,26 @@ class TestEndToEndQualityAssessment(unittest.TestCase):
         if 'quality_grade' in manifest_entry:
             self.assertIn(manifest_entry['quality_grade'], ['A', 'B', 'C', 'D', 'F', 'Not Assessed'])
 
+    
+    def test_assess_many_matches_single_assessments(self):
+        """Test the concurrent batch returns the same assessments as one call per dataset."""
+        dates = pd.date_range(start='2025-01-01', end='2025-01-10', freq='1h', tz='UTC')
+        for symbol in ('BTC/USD', 'ETH/USD'):
+            close = np.random.uniform(100, 200, len(dates))
+            df = pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                               'volume': np.random.uniform(1000, 10000, len(dates))}, index=dates)
+            write_cache(symbol, '1h', df.drop(df.index[50:60]), source_exchange='coinbase')
+        datasets = [('BTC/USD', '1h'), ('ETH/USD', '1h'), ('SOL/USD', '1h')]
+        
+        results = assess_data_quality_many(datasets, max_workers=3)
+        
+        self.assertEqual(list(results), datasets)
+        self.assertEqual(results[('SOL/USD', '1h')]['status'], 'no_data')
+        for symbol, timeframe in datasets[:2]:
+            expected = assess_data_quality(symbol, timeframe)
+            for key in ('status', 'component_scores', 'composite', 'grade'):
+                self.assertEqual(results[(symbol, timeframe)][key], expected[key])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,147 @@
+"""
+Tests for delta updates of the data cache.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from backtester.data import cache_manager, updater
+from backtester.data.cache_manager import read_cache, write_cache, update_manifest, get_cached_manifest_entry
+from backtester.data.updater import apply_update, stage_update, flush_update, update_markets
+
+
+def make_candles(start: str, periods: int, price: float = 100.0) -> pd.DataFrame:
+    """Consistent hourly candles starting at `start`."""
+    index = pd.date_range(start=start, periods=periods, freq='1h', tz='UTC')
+    close = np.full(periods, price)
+    return pd.DataFrame({'open': close, 'high': close + 1, 'low': close - 1, 'close': close,
+                         'volume': np.full(periods, 10.0)}, index=index)
+
+
+class TestApplyUpdate(unittest.TestCase):
+    """Test merging new candles into the cache."""
+    
+    def setUp(self):
+        """Point the cache at a temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.original_cache = cache_manager.CACHE_DIR
+        self.original_manifest = cache_manager.MANIFEST_FILE
+        cache_manager.CACHE_DIR = Path(self.temp_dir)
+        cache_manager.MANIFEST_FILE = Path(self.temp_dir) / '.cache_manifest.json'
+        write_cache('BTC/USD', '1h', make_candles('2025-01-01', 48), source_exchange='coinbase')
+    
+    def tearDown(self):
+        """Restore the cache paths."""
+        updater._pending.clear()
+        cache_manager._entry_cache.clear()
+        cache_manager.CACHE_DIR = self.original_cache
+        cache_manager.MANIFEST_FILE = self.original_manifest
+        shutil.rmtree(self.temp_dir)
+    
+    def test_overlap_keeps_newest_candles(self):
+        """Test overlapping candles are replaced by the update and the result is sorted."""
+        result = apply_update('BTC/USD', '1h', make_candles('2025-01-02 12:00', 24, price=200.0))
+        
+        self.assertEqual(result['status'], 'success')
+        self.assertEqual((result['candles_added'], result['total_candles']), (24, 60))
+        self.assertIn('Removed 12 duplicate candles', result['warnings'])
+        self.assertFalse(result['fast_path'])
+        cached = read_cache('BTC/USD', '1h')
+        self.assertTrue(cached.index.is_monotonic_increasing and cached.index.is_unique)
+        self.assertEqual(cached.loc['2025-01-02 12:00', 'close'], 200.0)
+        self.assertEqual(cached.loc['2025-01-02 11:00', 'close'], 100.0)
+    
+    def test_append_skips_dedup(self):
+        """Test a delta strictly after the cache is appended on the fast path."""
+        result = apply_update('BTC/USD', '1h', make_candles('2025-01-03', 24, price=200.0))
+        
+        self.assertTrue(result['fast_path'])
+        self.assertEqual((result['candles_added'], result['total_candles']), (24, 72))
+        self.assertEqual(result['warnings'], [])
+        cached = read_cache('BTC/USD', '1h')
+        self.assertTrue(cached.index.is_monotonic_increasing and cached.index.is_unique)
+        self.assertEqual(cached['close'].iloc[-1], 200.0)
+    
+    def test_incremental_validation_skips_old_gaps(self):
+        """Test only gaps touching the new candles are reported unless deep_validate is set."""
+        history = make_candles('2025-01-01', 48)
+        write_cache('BTC/USD', '1h', history.drop(history.index[10:15]), source_exchange='coinbase')
+        
+        result = apply_update('BTC/USD', '1h', make_candles('2025-01-03 03:00', 24))
+        self.assertEqual([gap['start'] for gap in result['validation']['gaps']],
+                         ['2025-01-02T23:00:00+00:00'])
+        
+        deep = apply_update('BTC/USD', '1h', make_candles('2025-01-04 03:00', 24), deep_validate=True)
+        self.assertEqual(len(deep['validation']['gaps']), 2)
+        self.assertEqual(deep['validation']['candle_count'], 91)
+        
+        # Overlapping candles are checked with their cached neighbours
+        overlap = apply_update('BTC/USD', '1h', make_candles('2025-01-03 04:00', 2).iloc[::-1])
+        self.assertFalse(overlap['fast_path'])
+        self.assertEqual(overlap['validation']['gaps'], [])
+    
+    def test_staged_chunks_flush_once(self):
+        """Test chunks staged separately give the same cache as one combined update."""
+        chunks = [make_candles('2025-01-03', 12), make_candles('2025-01-03 12:00', 12, price=150.0)]
+        for chunk in chunks:
+            stage_update('BTC/USD', '1h', chunk)
+        result = flush_update('BTC/USD', '1h')
+        staged = read_cache('BTC/USD', '1h')
+        
+        self.assertEqual((result['candles_added'], result['total_candles']), (24, 72))
+        self.assertEqual(flush_update('BTC/USD', '1h')['status'], 'no_new_data')
+        
+        write_cache('BTC/USD', '1h', make_candles('2025-01-01', 48), source_exchange='coinbase')
+        apply_update('BTC/USD', '1h', pd.concat(chunks))
+        pd.testing.assert_frame_equal(staged, read_cache('BTC/USD', '1h'))
+    
+    def test_manifest_entry_cached_until_write(self):
+        """Test manifest lookups hit the disk once and are refreshed after any manifest write."""
+        with patch('backtester.data.cache_manager.get_manifest_entry',
+                   wraps=cache_manager.get_manifest_entry) as lookup:
+            self.assertEqual(get_cached_manifest_entry('BTC/USD', '1h')['source_exchange'], 'coinbase')
+            result = apply_update('BTC/USD', '1h', make_candles('2025-01-03', 24))
+            self.assertEqual(lookup.call_count, 1)
+            
+            self.assertEqual(result['total_candles'], 72)
+            self.assertEqual(get_cached_manifest_entry('BTC/USD', '1h')['candle_count'], 72)
+            self.assertEqual(lookup.call_count, 2)
+            
+            # Writers outside the updater invalidate the entry too
+            update_manifest('BTC/USD', '1h', read_cache('BTC/USD', '1h'), source_exchange='kraken')
+            self.assertEqual(get_cached_manifest_entry('BTC/USD', '1h')['source_exchange'], 'kraken')
+            self.assertEqual(lookup.call_count, 3)
+    
+    def test_update_markets_concurrently(self):
+        """Test concurrent updates append every delta and keep every manifest entry."""
+        pairs = [(symbol, '1h') for symbol in ('BTC/USD', 'ETH/USD', 'SOL/USD', 'ADA/USD')]
+        for symbol, timeframe in pairs[1:]:
+            write_cache(symbol, timeframe, make_candles('2025-01-01', 48), source_exchange='coinbase')
+        
+        def fetch_delta(exchange_name, symbol, timeframe, from_timestamp, target_end_date=None):
+            return make_candles(from_timestamp + pd.Timedelta(hours=1), 24), 1
+        
+        with patch('backtester.data.updater.fetch_delta', side_effect=fetch_delta):
+            results = update_markets('coinbase', pairs, target_end_date='2025-02-01', max_workers=4)
+        
+        self.assertEqual(list(results), pairs)
+        for symbol, timeframe in pairs:
+            self.assertEqual(results[(symbol, timeframe)]['status'], 'success')
+            self.assertEqual(len(read_cache(symbol, timeframe)), 72)
+            self.assertEqual(cache_manager.get_manifest_entry(symbol, timeframe)['candle_count'], 72)
+    
+    def test_empty_update(self):
+        """Test an empty delta leaves the cache untouched."""
+        result = apply_update('BTC/USD', '1h', make_candles('2025-01-03', 0))
+        self.assertEqual(result['status'], 'no_new_data')
+        self.assertEqual(len(read_cache('BTC/USD', '1h')), 48)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
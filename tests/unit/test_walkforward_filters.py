@@ -6,6 +6,7 @@ multiple filters, and edge cases.
 """
 
 import unittest
+import warnings
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
@@ -254,6 +255,34 @@ class TestWalkForwardFiltersE2E(unittest.TestCase):
         accessor = ConfigAccessor(mock_config)
         filters = accessor.get_walkforward_filters()
         self.assertEqual(filters, [])
+    
+    def test_invalid_filters_warn_once(self):
+        """Test that non-string filter entries are dropped with a single warning."""
+        from backtester.config.core.accessor import ConfigAccessor
+        
+        mock_config = {'walkforward': {'filters': ['volatility_regime_atr', 1, None]}}
+        accessor = ConfigAccessor(mock_config)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            filters = accessor.get_walkforward_filters()
+        
+        self.assertEqual(filters, ['volatility_regime_atr'])
+        self.assertEqual(len(caught), 1)
+        self.assertIn('2 invalid filter(s)', str(caught[0].message))
+    
+    def test_invalid_filters_warn_from_filters_getter(self):
+        """Test other walk-forward getters stay silent and the warning points at the caller."""
+        from backtester.config.core.accessor import ConfigAccessor
+        
+        accessor = ConfigAccessor({'walkforward': {'start_date': '2024-01-01', 'filters': ['atr', 1]}}, {})
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            accessor.get_walkforward_start_date()
+            self.assertEqual(caught, [])
+            accessor.get_walkforward_filters()
+        
+        self.assertEqual(len(caught), 1)
+        self.assertEqual(caught[0].filename, __file__)
 
 
 class TestWalkForwardFiltersIntegration(unittest.TestCase):